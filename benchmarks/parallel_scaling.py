@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for multi-core gate application
+
+Times a layer of Hadamards, CNOTs and two-qubit unitaries on one
+statevector with the serial path and with 2, 4, ... worker processes.
+
+Usage:
+    python benchmarks/parallel_scaling.py [num_qubits] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from quantiq import Simulator
+from quantiq.gates import H
+
+
+def run_layer(simulator: Simulator, unitary: np.ndarray) -> float:
+    """Apply one layer of gates and return the elapsed seconds."""
+    n = simulator.num_qubits
+    start = time.perf_counter()
+    for qubit in range(n):
+        simulator.apply_gate(H, qubit)
+    for qubit in range(n - 1):
+        simulator.apply_cx(qubit, qubit + 1)
+    for qubit in range(0, n - 1, 2):
+        simulator.apply_unitary(unitary, [qubit, qubit + 1])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    num_qubits = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    q, _ = np.linalg.qr(np.random.default_rng(0).normal(size=(4, 4)))
+    unitary = q.astype(complex)
+
+    print("=" * 60)
+    print(f"PARALLEL SCALING ({num_qubits} qubits, {3 * num_qubits - 2} gates)")
+    print("=" * 60)
+
+    serial = run_layer(Simulator(num_qubits), unitary)
+    print(f"serial     : {serial:8.3f} s")
+
+    workers = 2
+    while workers <= max_workers:
+        simulator = Simulator(num_qubits, workers=workers)
+        elapsed = run_layer(simulator, unitary)
+        simulator.close()
+        print(f"{workers:3d} workers: {elapsed:8.3f} s  ({serial / elapsed:5.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,26 @@ A developer-first quantum computing platform.
 
 __version__ = "1.0.1"
 
+from .compiler import register_gate
+from .noise import NoiseModel
+from .observables import PauliSum
+from .parameters import Parameter
 from .quantiq import QuantumCircuit
 from .results import Result
 from .simulator import Simulator
+from .transpiler import transpile
 from .visualization import draw_circuit, plot_results
 
 __all__ = [
+    "NoiseModel",
+    "Parameter",
+    "PauliSum",
     "QuantumCircuit",
     "Result",
     "Simulator",
     "draw_circuit",
     "plot_results",
+    "register_gate",
+    "transpile",
     "__version__",
 ]
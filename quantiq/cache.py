@@ -0,0 +1,171 @@
+"""
+Final-statevector cache for quantIQ
+
+Services often simulate the same circuit repeatedly: a ``get_statevector``
+followed by a ``run``, or identical circuits resubmitted by different
+callers. Results are keyed by ``QuantumCircuit.content_hash()`` and the
+precision, so any circuit with the same gates reuses the stored final
+state and only pays for sampling.
+
+The cache is process-wide, bounded by the total bytes of the statevectors
+it holds, and evicts the least recently used entry first. The same class
+holds each circuit's prefix checkpoints (``QuantumCircuit.checkpoints``),
+so a circuit grown gate by gate only simulates what was appended since
+the last call.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+# Default bound on the bytes of cached statevectors (256 MiB)
+DEFAULT_CACHE_BYTES = 2**28
+
+# Default bound on each circuit's prefix checkpoints (64 MiB)
+DEFAULT_CHECKPOINT_BYTES = 2**26
+
+
+class StatevectorCache:
+    """
+    LRU cache of final statevectors bounded by total size.
+
+    Stored arrays are read-only; callers that hand a state out must copy
+    it. The cache is safe to share between threads.
+
+    Attributes:
+        max_bytes: Largest total size of the cached statevectors
+        enabled: When False, lookups miss and nothing is stored
+        hits: Lookups that found an entry
+        misses: Lookups that found nothing
+        evictions: Entries dropped to make room
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, enabled: bool = True):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Bound on the total bytes of cached statevectors
+            enabled: Whether the cache stores and returns entries
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size must be non-negative")
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes of the cached statevectors."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a lookup would hit, without touching counters or order."""
+        return self.enabled and key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, Dict[str, int]]]:
+        """
+        Look up a statevector and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (read-only statevector, compilation stats), or None
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        statevector: np.ndarray,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Store a statevector, evicting old entries to stay within max_bytes.
+
+        States larger than max_bytes on their own are not stored.
+
+        Args:
+            key: Cache key
+            statevector: Final statevector; the cache keeps a reference, so
+                the caller must not modify it afterwards
+            stats: Compilation stats to report on later hits
+        """
+        if not self.enabled or statevector.nbytes > self.max_bytes:
+            return
+        statevector.flags.writeable = False
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[0].nbytes
+            while self._entries and self._bytes + statevector.nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+            self._entries[key] = (statevector, dict(stats or {}))
+            self._bytes += statevector.nbytes
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries and bytes
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"StatevectorCache({len(self)} entries, {self._bytes} of "
+            f"{self.max_bytes} bytes)"
+        )
+
+
+# Cache shared by every circuit in the process
+STATEVECTOR_CACHE = StatevectorCache()
+
+
+def get_cache() -> StatevectorCache:
+    """The process-wide statevector cache."""
+    return STATEVECTOR_CACHE
+
+
+__all__ = [
+    "DEFAULT_CACHE_BYTES",
+    "DEFAULT_CHECKPOINT_BYTES",
+    "STATEVECTOR_CACHE",
+    "StatevectorCache",
+    "get_cache",
+]
@@ -0,0 +1,398 @@
+"""
+Circuit compilation for quantIQ
+
+A circuit's gate list (tuples of strings) is lowered once to a compact
+instruction array of numeric opcodes, qubit operands and indices into a
+table of preresolved matrices. Executing the compiled program is a plain
+loop over kernel calls with no string dispatch.
+
+New gates are added through ``register_gate`` rather than by editing the
+execution loop.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .gates import CCX, CX, CZ, SWAP, H, S, T, X, Y, Z, controlled, rx, ry, rz
+from .parameters import Parameter, collect_parameters, is_symbolic
+
+Kernel = Callable[[Any, Tuple[int, ...], Optional[np.ndarray]], None]
+
+
+def _single_qubit_kernel(simulator, qubits, matrix) -> None:
+    simulator.apply_gate(matrix, qubits[0])
+
+
+def _controlled_kernel(simulator, qubits, matrix) -> None:
+    simulator.apply_controlled_gate(matrix, qubits[:-1], qubits[-1])
+
+
+def _swap_kernel(simulator, qubits, matrix) -> None:
+    simulator.apply_swap(qubits[0], qubits[1])
+
+
+def _unitary_kernel(simulator, qubits, matrix) -> None:
+    simulator.apply_unitary(matrix, qubits)
+
+
+class GateSpec:
+    """
+    Description of a gate type known to the compiler.
+
+    Gate tuples in ``QuantumCircuit.gates`` have the form
+    ``(name, *qubits, *params)``; the spec says how many qubits and
+    parameters to expect and how to execute the gate.
+
+    Attributes:
+        name: Gate name as stored in gate tuples
+        opcode: Numeric opcode assigned at registration
+        num_qubits: Number of qubits, or None for any number
+        num_params: Number of trailing non-qubit operands
+        kernel: Function called as kernel(simulator, qubits, matrix),
+            or None for gates that are no-ops during simulation
+        matrix: Matrix passed to the kernel for unparameterized gates
+        matrix_fn: Function building the kernel matrix from the parameters
+        unitary: Full unitary over the gate's qubits, if it is fixed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        opcode: int,
+        num_qubits: Optional[int],
+        kernel: Optional[Kernel],
+        matrix: Optional[np.ndarray] = None,
+        num_params: int = 0,
+        matrix_fn: Optional[Callable[..., np.ndarray]] = None,
+        unitary: Optional[np.ndarray] = None,
+    ):
+        self.name = name
+        self.opcode = opcode
+        self.num_qubits = num_qubits
+        self.num_params = num_params
+        self.kernel = kernel
+        self.matrix = matrix
+        self.matrix_fn = matrix_fn
+        self.unitary = unitary
+
+    def split(self, gate: Tuple) -> Tuple[Tuple[int, ...], Tuple]:
+        """
+        Split a gate tuple into its qubit and parameter operands.
+
+        Args:
+            gate: Gate tuple (name, *qubits, *params)
+
+        Returns:
+            Tuple of (qubits, params)
+        """
+        end = len(gate) - self.num_params
+        return tuple(gate[1:end]), tuple(gate[end:])
+
+    def resolve(self, params: Sequence) -> Optional[np.ndarray]:
+        """
+        Build the matrix handed to the kernel.
+
+        Args:
+            params: Parameter operands of the gate
+
+        Returns:
+            Kernel matrix, or None if the kernel needs no matrix
+        """
+        if self.matrix_fn is not None:
+            return self.matrix_fn(*params)
+        return self.matrix
+
+    def to_matrix(self, gate: Tuple) -> Optional[np.ndarray]:
+        """
+        Full unitary of a gate over its own qubits, in operand order.
+
+        Args:
+            gate: Gate tuple (name, *qubits, *params)
+
+        Returns:
+            2^k x 2^k unitary, or None if the gate has no fixed matrix form
+            or depends on an unbound Parameter
+        """
+        if self.unitary is not None:
+            return self.unitary
+        qubits, params = self.split(gate)
+        if is_symbolic(params):
+            return None
+        if self.kernel is _controlled_kernel:
+            target = self.resolve(params)
+            if target is None:
+                return None
+            return controlled(target, len(qubits) - 1)
+        if self.kernel in (_single_qubit_kernel, _unitary_kernel):
+            return self.resolve(params)
+        return None
+
+    def __repr__(self) -> str:
+        return f"GateSpec({self.name!r}, opcode={self.opcode})"
+
+
+_SPECS: List[GateSpec] = []
+_REGISTRY: Dict[str, GateSpec] = {}
+
+
+def register_gate(
+    name: str,
+    matrix: Optional[np.ndarray] = None,
+    *,
+    num_qubits: Optional[int] = None,
+    num_params: int = 0,
+    matrix_fn: Optional[Callable[..., np.ndarray]] = None,
+    kernel: Optional[Kernel] = None,
+    unitary: Optional[np.ndarray] = None,
+) -> GateSpec:
+    """
+    Register a gate type so circuits can append and execute it.
+
+    A fixed unitary is enough for most custom gates: 2x2 matrices run on
+    the single-qubit kernel and larger ones on the k-qubit kernel.
+
+    Args:
+        name: Gate name, used in gate tuples and circuit diagrams
+        matrix: Fixed 2^k x 2^k unitary of the gate
+        num_qubits: Number of qubits; inferred from matrix if omitted
+        num_params: Number of parameter operands following the qubits
+        matrix_fn: Builds the kernel matrix from the parameter operands
+        kernel: Custom kernel(simulator, qubits, matrix) implementation;
+            a gate with no matrix, matrix_fn or kernel is a simulation no-op
+        unitary: Full unitary over the gate's qubits, if it differs from matrix
+
+    Returns:
+        The registered GateSpec
+
+    Example:
+        register_gate("SX", np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2)
+        QuantumCircuit(1).append("SX", 0)
+    """
+    if name in _REGISTRY:
+        raise ValueError(f"Gate '{name}' is already registered")
+
+    if matrix is not None:
+        matrix = np.asarray(matrix, dtype=complex)
+        dim = matrix.shape[0]
+        if matrix.shape != (dim, dim) or dim < 2 or dim & (dim - 1):
+            raise ValueError(f"Gate matrix must be 2^k x 2^k, got {matrix.shape}")
+        if kernel is None:
+            # A plain unitary gate: the matrix is the whole operation
+            if num_qubits is None:
+                num_qubits = dim.bit_length() - 1
+            elif 2**num_qubits != dim:
+                raise ValueError(
+                    f"Gate matrix {matrix.shape} doesn't act on {num_qubits} qubits"
+                )
+            if unitary is None:
+                unitary = matrix
+            kernel = _single_qubit_kernel if dim == 2 else _unitary_kernel
+
+    if kernel is None and matrix_fn is not None:
+        kernel = _single_qubit_kernel if num_qubits == 1 else _unitary_kernel
+
+    spec = GateSpec(
+        name,
+        len(_SPECS),
+        num_qubits,
+        kernel,
+        matrix=matrix,
+        num_params=num_params,
+        matrix_fn=matrix_fn,
+        unitary=unitary,
+    )
+    _SPECS.append(spec)
+    _REGISTRY[name] = spec
+    return spec
+
+
+def get_gate_spec(name: str) -> GateSpec:
+    """
+    Look up a registered gate type.
+
+    Args:
+        name: Gate name
+
+    Returns:
+        GateSpec for the gate
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown gate: '{name}'") from None
+
+
+# Built-in gates
+for _name, _matrix in [("H", H), ("X", X), ("Y", Y), ("Z", Z), ("S", S), ("T", T)]:
+    register_gate(_name, _matrix)
+register_gate("CX", X, num_qubits=2, kernel=_controlled_kernel, unitary=CX)
+register_gate("CZ", Z, num_qubits=2, kernel=_controlled_kernel, unitary=CZ)
+register_gate("SWAP", num_qubits=2, kernel=_swap_kernel, unitary=SWAP)
+register_gate("CCX", X, num_qubits=3, kernel=_controlled_kernel, unitary=CCX)
+register_gate("MCX", X, kernel=_controlled_kernel)
+register_gate(
+    "CU",
+    num_qubits=2,
+    num_params=1,
+    matrix_fn=lambda gate: gate,
+    kernel=_controlled_kernel,
+)
+register_gate(
+    "UNITARY", num_params=1, matrix_fn=lambda matrix: matrix, kernel=_unitary_kernel
+)
+register_gate("RX", num_qubits=1, num_params=1, matrix_fn=rx)
+register_gate("RY", num_qubits=1, num_params=1, matrix_fn=ry)
+register_gate("RZ", num_qubits=1, num_params=1, matrix_fn=rz)
+register_gate("MEASURE_ALL", num_qubits=0, kernel=None)
+register_gate("MEASURE", kernel=None)
+register_gate("RESET", num_qubits=1, kernel=None)
+
+
+class CompiledCircuit:
+    """
+    A circuit lowered to a compact instruction array.
+
+    Attributes:
+        num_qubits: Number of qubits in the circuit
+        opcodes: Opcode of each instruction (int16)
+        operands: Qubit operands per instruction, padded with -1 (int32)
+        matrix_ids: Index into ``matrices`` per instruction, -1 if none (int32)
+        matrices: Table of preresolved kernel matrices
+        symbolic: Parameter operands of instructions whose matrix depends
+            on an unbound Parameter, keyed by instruction index
+        parameters: Unbound Parameters the program needs values for
+        stats: Statistics reported by the optimization passes that ran
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        opcodes: np.ndarray,
+        operands: np.ndarray,
+        matrix_ids: np.ndarray,
+        matrices: List[np.ndarray],
+        stats: Optional[Dict[str, int]] = None,
+        symbolic: Optional[Dict[int, Tuple]] = None,
+    ):
+        self.num_qubits = num_qubits
+        self.opcodes = opcodes
+        self.operands = operands
+        self.matrix_ids = matrix_ids
+        self.matrices = matrices
+        self.stats = stats if stats is not None else {}
+        self.symbolic = symbolic if symbolic is not None else {}
+        self.parameters = collect_parameters([("", *p) for p in self.symbolic.values()])
+
+        # Decode once so execution is a flat loop over kernel calls
+        self._program = []
+        for i, (opcode, row, matrix_id) in enumerate(
+            zip(opcodes.tolist(), operands.tolist(), matrix_ids.tolist())
+        ):
+            spec = _SPECS[opcode]
+            qubits = tuple(q for q in row if q >= 0)
+            matrix = matrices[matrix_id] if matrix_id >= 0 else None
+            params = self.symbolic.get(i)
+            self._program.append((spec.kernel, qubits, matrix, spec, params))
+
+    def __len__(self) -> int:
+        return len(self._program)
+
+    def run(
+        self, simulator, values: Optional[Dict[Parameter, np.ndarray]] = None
+    ) -> None:
+        """
+        Execute every instruction on the simulator.
+
+        Args:
+            simulator: Simulator whose statevector is evolved in place
+            values: Value (scalar or one per batch element) of every
+                Parameter in ``parameters``
+        """
+        values = values or {}
+        missing = [p.name for p in self.parameters if p not in values]
+        if missing:
+            raise ValueError(f"No values bound for parameters: {missing}")
+
+        for kernel, qubits, matrix, spec, params in self._program:
+            if params is not None:
+                matrix = spec.resolve(
+                    [values[p] if isinstance(p, Parameter) else p for p in params]
+                )
+            kernel(simulator, qubits, matrix)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledCircuit({self.num_qubits} qubits, {len(self)} instructions, "
+            f"{len(self.matrices)} matrices)"
+        )
+
+
+def compile_gates(
+    num_qubits: int, gates: Sequence[Tuple], stats: Optional[Dict[str, int]] = None
+) -> CompiledCircuit:
+    """
+    Lower a gate list to a CompiledCircuit.
+
+    Gates whose spec has no kernel (such as MEASURE_ALL) produce no
+    instruction. Identical matrix objects share one table entry.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        stats: Statistics to attach to the compiled program
+
+    Returns:
+        Compiled program
+    """
+    opcodes: List[int] = []
+    rows: List[Tuple[int, ...]] = []
+    matrix_ids: List[int] = []
+    matrices: List[np.ndarray] = []
+    table: Dict[int, int] = {}
+    symbolic: Dict[int, Tuple] = {}
+
+    for gate in gates:
+        spec = get_gate_spec(gate[0])
+        if spec.kernel is None:
+            continue
+        qubits, params = spec.split(gate)
+        if is_symbolic(params):
+            symbolic[len(opcodes)] = params
+            matrix = None
+        else:
+            matrix = spec.resolve(params)
+        if matrix is None:
+            matrix_id = -1
+        else:
+            matrix_id = table.get(id(matrix), -1)
+            if matrix_id < 0:
+                matrix_id = table[id(matrix)] = len(matrices)
+                matrices.append(matrix)
+        opcodes.append(spec.opcode)
+        rows.append(qubits)
+        matrix_ids.append(matrix_id)
+
+    width = max((len(row) for row in rows), default=0)
+    operands = np.full((len(rows), width), -1, dtype=np.int32)
+    for i, row in enumerate(rows):
+        operands[i, : len(row)] = row
+
+    return CompiledCircuit(
+        num_qubits,
+        np.array(opcodes, dtype=np.int16),
+        operands,
+        np.array(matrix_ids, dtype=np.int32),
+        matrices,
+        stats,
+        symbolic,
+    )
+
+
+__all__ = [
+    "CompiledCircuit",
+    "GateSpec",
+    "compile_gates",
+    "get_gate_spec",
+    "register_gate",
+]
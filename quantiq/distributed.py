@@ -0,0 +1,485 @@
+"""
+Distributed statevector simulation for quantIQ
+
+The statevector is split into 2^k shards held by separate rank processes.
+Physical qubit positions 0..k-1 are *global* (they select the rank) and
+the rest are *local* (they index amplitudes inside a shard). A coordinator
+keeps a layout mapping each circuit qubit to a physical position:
+
+- gates whose targets are local run independently on every shard;
+- global control qubits only select which ranks run the gate;
+- a gate targeting a global qubit first swaps that qubit with a free
+  local one, which exchanges half of each shard between paired ranks,
+  and the layout records the new position;
+- SWAP gates only relabel the layout.
+
+Ranks talk over a pluggable transport. Pipes and localhost sockets are
+provided so everything runs on one machine without MPI; a cluster
+transport only needs to hand out connected pairs with send/recv.
+"""
+
+import multiprocessing as mp
+import weakref
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .kernels import _axes_view, _fixed_index, apply_gate, apply_matrix
+from .observables import PauliSum
+from .results import Result
+from .simulator import MAX_STATEVECTOR_BYTES, Seed, Simulator, sample_counts
+
+
+class PipeTransport:
+    """Connect ranks with ``multiprocessing.Pipe``."""
+
+    def pair(self) -> Tuple[Connection, Connection]:
+        """Return two connected endpoints."""
+        return mp.Pipe(duplex=True)
+
+
+class SocketTransport:
+    """Connect ranks with TCP sockets on a local or remote interface."""
+
+    def __init__(self, host: str = "127.0.0.1"):
+        """
+        Initialize the transport.
+
+        Args:
+            host: Interface to listen on
+        """
+        self.host = host
+
+    def pair(self) -> Tuple[Connection, Connection]:
+        """Return two connected endpoints."""
+        with Listener((self.host, 0)) as listener:
+            client = Client(listener.address)
+            server = listener.accept()
+        return server, client
+
+
+# Transports selectable by name
+TRANSPORTS = {"pipe": PipeTransport, "socket": SocketTransport}
+
+
+def _rank_main(
+    rank: int,
+    local_qubits: int,
+    dtype: str,
+    control: Connection,
+    peers: Dict[int, Connection],
+) -> None:
+    """
+    Command loop of one rank process.
+
+    Commands arrive in circuit order on ``control``; only the ones that
+    need an answer (mass, sample, gather) are replied to, so gates are
+    pipelined. A failure is reported on the next reply.
+    """
+    shard = np.zeros(1 << local_qubits, dtype=dtype)
+    shard[0] = 1.0 if rank == 0 else 0.0
+    failure: Optional[str] = None
+
+    while True:
+        command, *args = control.recv()
+        if command == "stop":
+            break
+        try:
+            if command == "apply":
+                operation, kernel_args = args
+                kernel = apply_gate if operation == "gate" else apply_matrix
+                kernel(shard, *kernel_args)
+            elif command == "exchange":
+                partner, local, keep = args
+                view, axis = _axes_view(shard, [local], local_qubits)
+                half = view[tuple(_fixed_index(view, axis, {local: 1 - keep}))]
+                link = peers[partner]
+                # The lower rank sends first so large halves never deadlock
+                if rank < partner:
+                    link.send(half.copy())
+                    half[...] = link.recv()
+                else:
+                    incoming = link.recv()
+                    link.send(half.copy())
+                    half[...] = incoming
+            elif command == "reset":
+                shard[...] = 0
+                shard[0] = 1.0 if rank == 0 else 0.0
+            elif command == "mass":
+                control.send(("error", failure) if failure else ("ok", _mass(shard)))
+            elif command == "sample":
+                shots, seed = args
+                probabilities = np.abs(shard) ** 2
+                rng = np.random.default_rng(seed)
+                reply = sample_counts(probabilities, shots, rng)
+                control.send(("error", failure) if failure else ("ok", reply))
+            elif command == "gather":
+                control.send(("error", failure) if failure else ("ok", shard))
+        except Exception as error:  # reported to the coordinator on next reply
+            failure = f"rank {rank}: {error!r}"
+
+
+def _mass(shard: np.ndarray) -> float:
+    """Total probability held by a shard."""
+    return float(np.vdot(shard, shard).real)
+
+
+def _stop_ranks(controls: List[Connection], processes: List[Any]) -> None:
+    """Ask every rank to exit and wait for it."""
+    for control in controls:
+        try:
+            control.send(("stop",))
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+
+class DistributedSimulator(Simulator):
+    """
+    Statevector simulator whose state is sharded across rank processes.
+
+    Attributes:
+        num_shards: Number of ranks (a power of two)
+        global_qubits: Number of physical qubit positions selecting a rank
+        local_qubits: Number of qubits inside each shard
+        layout: Physical position of each circuit qubit
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        precision: str = "double",
+        shards: int = 2,
+        transport: Union[str, Any] = "pipe",
+    ):
+        """
+        Initialize a distributed simulator and start its ranks.
+
+        Args:
+            num_qubits: Number of qubits to simulate
+            precision: 'double' (complex128) or 'single' (complex64)
+            shards: Number of rank processes, a power of two
+            transport: 'pipe', 'socket' or an object whose pair() returns
+                two connected endpoints with send() and recv()
+        """
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("Number of shards must be a power of two")
+        self.num_shards = shards
+        self.global_qubits = shards.bit_length() - 1
+        if self.global_qubits >= num_qubits:
+            raise ValueError(
+                f"{shards} shards need more than {self.global_qubits} qubits"
+            )
+        self.local_qubits = num_qubits - self.global_qubits
+        self.transport = (
+            TRANSPORTS[transport]() if isinstance(transport, str) else transport
+        )
+        super().__init__(num_qubits, precision=precision)
+
+    def _check_capacity(self) -> None:
+        """Raise if one shard would not fit in a rank's memory budget."""
+        if (1 << self.local_qubits) * self.dtype.itemsize > MAX_STATEVECTOR_BYTES:
+            raise ValueError(
+                f"Cannot simulate {self.num_qubits} qubits on {self.num_shards} "
+                f"shards (memory constraint of {MAX_STATEVECTOR_BYTES // 2**20} "
+                "MiB per shard)"
+            )
+
+    def _allocate_state(self) -> None:
+        """Start the rank processes, each holding one shard; none is local."""
+        self.layout = list(range(self.num_qubits))
+        peers: List[Dict[int, Connection]] = [{} for _ in range(self.num_shards)]
+        for rank in range(self.num_shards):
+            for bit in range(self.global_qubits):
+                partner = rank ^ (1 << bit)
+                if rank < partner:
+                    peers[rank][partner], peers[partner][rank] = self.transport.pair()
+
+        context = mp.get_context()
+        self._controls: List[Connection] = []
+        self._processes = []
+        for rank in range(self.num_shards):
+            ours, theirs = self.transport.pair()
+            process = context.Process(
+                target=_rank_main,
+                args=(rank, self.local_qubits, self.dtype.str, theirs, peers[rank]),
+                daemon=True,
+            )
+            process.start()
+            theirs.close()
+            self._controls.append(ours)
+            self._processes.append(process)
+        for links in peers:
+            for link in links.values():
+                link.close()
+        self._finalizer = weakref.finalize(
+            self, _stop_ranks, self._controls, self._processes
+        )
+
+    def close(self) -> None:
+        """Stop the rank processes."""
+        self._finalizer()
+
+    def reset(self) -> None:
+        """Reset the statevector to |00...0⟩ state."""
+        for control in self._controls:
+            control.send(("reset",))
+        self.layout = list(range(self.num_qubits))
+
+    def _rank_bit(self, rank: int, position: int) -> int:
+        """Value of a global physical position on a rank."""
+        return (rank >> (self.global_qubits - 1 - position)) & 1
+
+    def _localize(self, qubit: int, busy: Sequence[int]) -> None:
+        """
+        Move a qubit at a global position to a free local position.
+
+        Every rank exchanges half of its shard with the rank that differs
+        in that global bit.
+        """
+        position = self.layout[qubit]
+        occupied = {self.layout[q] for q in busy}
+        free = [
+            p
+            for p in range(self.num_qubits - 1, self.global_qubits - 1, -1)
+            if p not in occupied
+        ]
+        if not free:
+            raise ValueError(
+                f"Gate needs more than the {self.local_qubits} local qubits per shard"
+            )
+        local = free[0]
+        for rank, control in enumerate(self._controls):
+            partner = rank ^ (1 << (self.global_qubits - 1 - position))
+            keep = self._rank_bit(rank, position)
+            control.send(("exchange", partner, local - self.global_qubits, keep))
+        other = self.layout.index(local)
+        self.layout[qubit], self.layout[other] = local, position
+
+    def _apply(
+        self,
+        operation: str,
+        targets: Sequence[int],
+        controls: Sequence[int],
+        build: Any,
+    ) -> None:
+        """
+        Send a gate to the ranks that hold amplitudes it changes.
+
+        Args:
+            operation: 'gate' or 'matrix'
+            targets: Qubits the gate acts on
+            controls: Control qubits
+            build: Called with a qubit -> local qubit function, returns the
+                kernel arguments after the shard
+        """
+        busy = [*targets, *controls]
+        for target in targets:
+            if self.layout[target] < self.global_qubits:
+                self._localize(target, busy)
+
+        global_controls = [
+            self.layout[c] for c in controls if self.layout[c] < self.global_qubits
+        ]
+
+        def local(qubit: int) -> int:
+            return self.layout[qubit] - self.global_qubits
+
+        args = build(local)
+        for rank, control in enumerate(self._controls):
+            if all(self._rank_bit(rank, p) for p in global_controls):
+                control.send(("apply", operation, args))
+
+    def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
+        """
+        Apply a single-qubit gate to the statevector.
+
+        Args:
+            gate: 2x2 unitary matrix
+            target_qubit: Qubit index to apply gate to
+        """
+        if target_qubit < 0 or target_qubit >= self.num_qubits:
+            raise ValueError(f"Invalid qubit index: {target_qubit}")
+        self.apply_controlled_gate(gate, [], target_qubit)
+
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
+        """
+        Apply a single-qubit gate conditioned on one or more control qubits.
+
+        Args:
+            gate: 2x2 unitary matrix applied to the target
+            controls: Control qubit indices
+            target: Target qubit index
+        """
+        self._validate_qubits([*controls, target])
+        gate = np.asarray(gate, dtype=self.dtype)
+        self._apply(
+            "gate",
+            [target],
+            controls,
+            lambda local: (
+                gate,
+                local(target),
+                self.local_qubits,
+                [local(c) for c in controls if local(c) >= 0],
+            ),
+        )
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """
+        Apply SWAP gate by exchanging the two qubits' layout positions.
+
+        Args:
+            qubit1: First qubit index
+            qubit2: Second qubit index
+        """
+        self._validate_qubits([qubit1, qubit2])
+        layout = self.layout
+        layout[qubit1], layout[qubit2] = layout[qubit2], layout[qubit1]
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a k-qubit unitary to the statevector.
+
+        Args:
+            matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+            qubits: Qubit indices the matrix acts on
+        """
+        self._validate_qubits(qubits)
+        if np.shape(matrix) != (2 ** len(qubits), 2 ** len(qubits)):
+            raise ValueError(
+                f"Matrix shape {np.shape(matrix)} doesn't match {len(qubits)} qubits"
+            )
+        matrix = np.asarray(matrix, dtype=self.dtype)
+        self._apply(
+            "matrix",
+            qubits,
+            [],
+            lambda local: (matrix, [local(q) for q in qubits], self.local_qubits),
+        )
+
+    def _request(self, command: Tuple) -> List[Any]:
+        """Send a command to every rank and collect the replies in rank order."""
+        for control in self._controls:
+            control.send(command)
+        return [self._reply(control) for control in self._controls]
+
+    @staticmethod
+    def _reply(control: Connection) -> Any:
+        """Receive one reply, raising if the rank reported a failure."""
+        status, payload = control.recv()
+        if status == "error":
+            raise RuntimeError(payload)
+        return payload
+
+    def _to_logical(self, physical: np.ndarray) -> np.ndarray:
+        """Translate physical basis-state indices to circuit bit order."""
+        n = self.num_qubits
+        if self.layout == list(range(n)):
+            return physical
+        logical = np.zeros_like(physical)
+        for qubit, position in enumerate(self.layout):
+            logical |= ((physical >> (n - 1 - position)) & 1) << (n - 1 - qubit)
+        return logical
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
+        """
+        Measure all qubits in computational basis.
+
+        Shots are split across ranks by a multinomial over the shard
+        masses; each rank samples its own shard and the per-shard counts
+        are merged into one Result.
+
+        Args:
+            shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            Result object with measurement outcomes
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        rng = np.random.default_rng(seed)
+        masses = np.array(self._request(("mass",)))
+        rank_shots = rng.multinomial(shots, masses / masses.sum())
+        seeds = rng.integers(2**63, size=self.num_shards)
+
+        outcomes: List[np.ndarray] = []
+        frequencies: List[np.ndarray] = []
+        active = np.flatnonzero(rank_shots).tolist()
+        for rank in active:
+            self._controls[rank].send(
+                ("sample", int(rank_shots[rank]), int(seeds[rank]))
+            )
+        for rank in active:
+            found, counts = self._reply(self._controls[rank])
+            outcomes.append(found + (rank << self.local_qubits))
+            frequencies.append(counts)
+
+        return Result.from_arrays(
+            self._to_logical(np.concatenate(outcomes)),
+            np.concatenate(frequencies),
+            shots,
+            self.num_qubits,
+        )
+
+    def snapshot(self) -> np.ndarray:
+        """Not available: the sharded statevector is updated in place."""
+        raise ValueError("distributed backend has no snapshots; use get_statevector()")
+
+    def fork(self) -> Simulator:
+        """Not available: the sharded statevector is updated in place."""
+        raise ValueError("distributed backend can't be forked")
+
+    def get_statevector(self) -> np.ndarray:
+        """
+        Gather the shards into one statevector in circuit qubit order.
+
+        Returns:
+            In-memory copy of the whole statevector
+        """
+        physical = np.concatenate(self._request(("gather",)))
+        tensor = physical.reshape((2,) * self.num_qubits)
+        return tensor.transpose(self.layout).reshape(-1).copy()
+
+    def get_probabilities(self) -> np.ndarray:
+        """
+        Get probability distribution from statevector.
+
+        Returns:
+            Array of probabilities for each computational basis state
+        """
+        return np.abs(self.get_statevector()) ** 2
+
+    def expectation(
+        self, observable: Union[PauliSum, str]
+    ) -> Union[float, complex, np.ndarray]:
+        """
+        Exact expectation value of an observable on the gathered state.
+
+        Args:
+            observable: PauliSum, or a single Pauli string such as 'ZZI'
+
+        Returns:
+            <psi|H|psi>
+        """
+        if isinstance(observable, str):
+            observable = PauliSum({observable: 1.0})
+        return observable.expectation(self.get_statevector())
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"DistributedSimulator(num_qubits={self.num_qubits}, "
+            f"shards={self.num_shards})"
+        )
+
+
+__all__ = ["DistributedSimulator", "PipeTransport", "SocketTransport"]
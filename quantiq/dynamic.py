@@ -0,0 +1,328 @@
+"""
+Shot-branching execution of dynamic circuits for quantIQ
+
+Circuits with mid-circuit measurements, resets or classically
+conditioned gates have no single final state. Rather than simulating
+every shot separately, shots are carried through the circuit in
+*branches*: a statevector, the classical bits seen so far and the
+number of shots in that situation. A measurement draws how many of a
+branch's shots see 1 from a binomial and splits the branch only when
+both outcomes occur, and branches left with the same bits and state are
+merged again. Cost therefore scales with the number of distinct
+branches, which is bounded by the number of shots and is usually far
+smaller.
+
+Measurements with no later gate, reset or condition on their qubit are
+deferred and sampled from each final branch in one multinomial draw, as
+run() does for static circuits.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .compiler import CompiledCircuit, compile_gates, get_gate_spec
+from .gates import X
+from .results import Result, _outcome_dtype
+from .simulator import Seed, Simulator, sample_counts
+from .transpiler import fuse_gates
+
+# Overlap above which two branch states count as identical
+_MERGE_FIDELITY = 1 - 1e-9
+
+# Gates that read out qubits
+MEASUREMENTS = {"MEASURE", "MEASURE_ALL"}
+
+
+class Branch:
+    """
+    Shots that share one statevector and classical record.
+
+    Attributes:
+        simulator: Simulator holding the branch state
+        bits: Latest measured value of each qubit (0 before any)
+        shots: Number of shots in the branch
+    """
+
+    def __init__(self, simulator: Simulator, bits: Tuple[int, ...], shots: int):
+        self.simulator = simulator
+        self.bits = bits
+        self.shots = shots
+
+    def __repr__(self) -> str:
+        return f"Branch(shots={self.shots}, bits={self.bits})"
+
+
+def is_dynamic(
+    num_qubits: int, gates: Sequence[Tuple], conditions: Dict[int, Tuple[int, int]]
+) -> bool:
+    """
+    Whether a gate list needs shot-branching execution.
+
+    True when it resets a qubit, conditions a gate on a measurement, or
+    acts on a qubit after measuring it.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        conditions: Classical condition of each conditioned gate index
+
+    Returns:
+        True if the circuit is dynamic
+    """
+    if conditions:
+        return True
+    measured: Set[int] = set()
+    for gate in gates:
+        if gate[0] == "RESET":
+            return True
+        if gate[0] == "MEASURE_ALL":
+            measured = set(range(num_qubits))
+        elif gate[0] == "MEASURE":
+            measured.update(gate[1:])
+        else:
+            qubits, _ = get_gate_spec(gate[0]).split(gate)
+            if measured.intersection(qubits):
+                return True
+    return False
+
+
+def plan_dynamic(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    conditions: Dict[int, Tuple[int, int]],
+    measured: Sequence[int],
+    fuse: bool = True,
+) -> Tuple[List[Tuple], List[int]]:
+    """
+    Split a dynamic circuit into operations for the branching engine.
+
+    Runs of unconditioned gates are compiled (and fused) into one
+    program. Measurements whose qubit is untouched and unread afterwards
+    are dropped from the operations and deferred to the end.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        conditions: Classical condition of each conditioned gate index
+        measured: Qubits reported in the result
+        fuse: Merge adjacent gates within each run
+
+    Returns:
+        Tuple of (operations, deferred qubits in ascending order);
+        operations are ('gates', program), ('if', qubit, value,
+        program), ('measure', qubit) or ('reset', qubit)
+    """
+    # Backward pass: a measurement is needed mid-circuit if its qubit is
+    # touched or its bit is read later on
+    needed: Dict[int, List[int]] = {}
+    later: Set[int] = set()
+    deferred: Set[int] = set()
+    for index in range(len(gates) - 1, -1, -1):
+        gate = gates[index]
+        if gate[0] in MEASUREMENTS:
+            qubits = gate[1:] if gate[0] == "MEASURE" else range(num_qubits)
+            needed[index] = [q for q in qubits if q in later]
+            deferred.update(q for q in qubits if q not in later)
+        else:
+            later.update(get_gate_spec(gate[0]).split(gate)[0])
+        if index in conditions:
+            later.add(conditions[index][0])
+    # Reported qubits that are never measured are read at the end
+    ever_measured = set(deferred).union(*needed.values())
+    deferred.update(q for q in measured if q not in ever_measured)
+
+    operations: List[Tuple] = []
+    segment: List[Tuple] = []
+
+    def flush() -> None:
+        if segment:
+            operations.append(("gates", _compile(num_qubits, segment, fuse)))
+            segment.clear()
+
+    for index, gate in enumerate(gates):
+        if gate[0] in MEASUREMENTS:
+            if needed[index]:
+                flush()
+                operations.extend(("measure", q) for q in needed[index])
+        elif gate[0] == "RESET":
+            flush()
+            operations.append(("reset", gate[1]))
+        elif index in conditions:
+            flush()
+            qubit, value = conditions[index]
+            operations.append(("if", qubit, value, compile_gates(num_qubits, [gate])))
+        else:
+            segment.append(gate)
+    flush()
+    return operations, sorted(deferred)
+
+
+def _compile(num_qubits: int, gates: Sequence[Tuple], fuse: bool) -> CompiledCircuit:
+    """Compile a run of unconditioned gates."""
+    if fuse:
+        fused, stats = fuse_gates(num_qubits, gates)
+        return compile_gates(num_qubits, fused, stats)
+    return compile_gates(num_qubits, gates)
+
+
+def run_dynamic(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    conditions: Dict[int, Tuple[int, int]],
+    measured: Sequence[int],
+    shots: int,
+    seed: Seed = None,
+    fuse: bool = True,
+    precision: str = "double",
+    backend_options: Optional[Dict[str, Any]] = None,
+) -> Result:
+    """
+    Sample a dynamic circuit by shot branching.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        conditions: Classical condition (qubit, value) of each conditioned
+            gate index; the gate runs when the qubit's latest measurement
+            equals value
+        measured: Qubits to report, in bit order; each reads its latest
+            measured value
+        shots: Number of shots
+        seed: Seed or np.random.Generator for reproducible sampling
+        fuse: Merge adjacent gates between measurements
+        precision: 'double' or 'single' (complex64) statevector
+        backend_options: Extra keyword arguments for the Simulator
+
+    Returns:
+        Result over the measured qubits; metadata holds the largest
+        number of live branches and how many were merged
+    """
+    rng = np.random.default_rng(seed)
+    operations, deferred = plan_dynamic(num_qubits, gates, conditions, measured, fuse)
+
+    simulator = Simulator(num_qubits, precision=precision, **(backend_options or {}))
+    branches = [Branch(simulator, (0,) * num_qubits, shots)]
+    peak, merged = 1, 0
+    for operation in operations:
+        kind = operation[0]
+        if kind == "gates":
+            for branch in branches:
+                operation[1].run(branch.simulator)
+        elif kind == "if":
+            _, qubit, value, program = operation
+            for branch in branches:
+                if branch.bits[qubit] == value:
+                    program.run(branch.simulator)
+        else:
+            reset = kind == "reset"
+            branches = [
+                split
+                for branch in branches
+                for split in _measure(branch, operation[1], rng, reset)
+            ]
+            peak = max(peak, len(branches))
+            before = len(branches)
+            branches = _merge(branches)
+            merged += before - len(branches)
+
+    result = _read_final(branches, deferred, measured, shots, rng)
+    for branch in branches:
+        branch.simulator.close()
+    result.metadata.update({"branches": peak, "merged_branches": merged})
+    return result
+
+
+def _measure(
+    branch: Branch, qubit: int, rng: np.random.Generator, reset: bool
+) -> List[Branch]:
+    """
+    Measure one qubit of a branch, splitting its shots by outcome.
+
+    With ``reset`` the outcome is not recorded and the qubit is returned
+    to 0.
+    """
+    probability = min(max(branch.simulator.qubit_probability(qubit), 0.0), 1.0)
+    ones = int(rng.binomial(branch.shots, probability))
+    counts = [(0, branch.shots - ones), (1, ones)]
+    counts = [(outcome, count) for outcome, count in counts if count]
+
+    splits = []
+    for i, (outcome, count) in enumerate(counts):
+        # The last outcome keeps the branch's simulator; others fork it
+        simulator = (
+            branch.simulator if i == len(counts) - 1 else branch.simulator.fork()
+        )
+        simulator.collapse(qubit, outcome)
+        bits = branch.bits
+        if reset:
+            if outcome:
+                simulator.apply_gate(X, qubit)
+        else:
+            bits = bits[:qubit] + (outcome,) + bits[qubit + 1 :]
+        splits.append(Branch(simulator, bits, count))
+    return splits
+
+
+def _merge(branches: List[Branch]) -> List[Branch]:
+    """Combine branches with equal classical bits and the same state."""
+    kept: Dict[Tuple[int, ...], List[Branch]] = {}
+    for branch in branches:
+        group = kept.setdefault(branch.bits, [])
+        state = branch.simulator.statevector
+        for other in group:
+            if (
+                other.simulator.statevector is state
+                or abs(np.vdot(other.simulator.statevector, state)) > _MERGE_FIDELITY
+            ):
+                other.shots += branch.shots
+                branch.simulator.close()
+                break
+        else:
+            group.append(branch)
+    return [branch for group in kept.values() for branch in group]
+
+
+def _read_final(
+    branches: List[Branch],
+    deferred: List[int],
+    measured: Sequence[int],
+    shots: int,
+    rng: np.random.Generator,
+) -> Result:
+    """Sample deferred qubits of every branch and assemble the result."""
+    width = len(measured)
+    dtype = _outcome_dtype(width)
+    num_qubits = branches[0].simulator.num_qubits
+    outcomes, frequencies = [], []
+    for branch in branches:
+        if deferred:
+            probabilities = np.abs(branch.simulator.statevector) ** 2
+            tensor = probabilities.reshape((2,) * num_qubits)
+            others = tuple(q for q in range(num_qubits) if q not in deferred)
+            marginal = tensor.sum(axis=others).ravel()
+            sampled, counts = sample_counts(marginal, branch.shots, rng)
+        else:
+            sampled = np.zeros(1, dtype=np.int64)
+            counts = np.array([branch.shots])
+
+        values = np.zeros(len(sampled), dtype=dtype)
+        for i, qubit in enumerate(measured):
+            if qubit in deferred:
+                shift = len(deferred) - 1 - deferred.index(qubit)
+                bit = (sampled >> shift) & 1
+            else:
+                bit = np.full(len(sampled), branch.bits[qubit])
+            values |= bit.astype(dtype) << (width - 1 - i)
+        outcomes.append(values)
+        frequencies.append(counts)
+
+    all_outcomes = np.concatenate(outcomes)
+    all_frequencies = np.concatenate(frequencies)
+    unique, inverse = np.unique(all_outcomes, return_inverse=True)
+    totals = np.zeros(len(unique), dtype=np.int64)
+    np.add.at(totals, inverse.ravel(), all_frequencies)
+    return Result.from_arrays(unique.astype(dtype), totals, shots, width)
+
+
+__all__ = ["Branch", "MEASUREMENTS", "is_dynamic", "plan_dynamic", "run_dynamic"]
@@ -38,47 +38,79 @@ CZ = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]], dtype=c
 SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)
 
 
+def controlled(gate: np.ndarray, num_controls: int = 1) -> np.ndarray:
+    """
+    Build the matrix of a controlled gate.
+
+    The control qubits come first in the basis order, so the gate acts on
+    the bottom-right block where every control is 1.
+
+    Args:
+        gate: 2x2 unitary matrix of the target operation
+        num_controls: Number of control qubits
+
+    Returns:
+        2^(k+1) x 2^(k+1) unitary matrix
+    """
+    dim = 2 ** (num_controls + 1)
+    matrix = np.eye(dim, dtype=complex)
+    matrix[-2:, -2:] = gate
+    return matrix
+
+
+# Toffoli gate (controlled-controlled-NOT)
+CCX = controlled(X, 2)
+
+
 # Rotation gates
-def rx(theta: float) -> np.ndarray:
+# Each accepts a scalar angle or an array of angles; an array of shape (B,)
+# gives a stack of B matrices with shape (B, 2, 2).
+def rx(theta) -> np.ndarray:
     """
     Rotation around X-axis.
 
     Args:
-        theta: Rotation angle in radians
+        theta: Rotation angle in radians (scalar or array)
 
     Returns:
-        2x2 unitary matrix
+        2x2 unitary matrix, or a stack of them for array input
     """
-    c = np.cos(theta / 2)
-    s = np.sin(theta / 2)
-    return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+    c = np.cos(np.asarray(theta) / 2)
+    s = np.sin(np.asarray(theta) / 2)
+    return _stack([[c, -1j * s], [-1j * s, c]])
 
 
-def ry(theta: float) -> np.ndarray:
+def ry(theta) -> np.ndarray:
     """
     Rotation around Y-axis.
 
     Args:
-        theta: Rotation angle in radians
+        theta: Rotation angle in radians (scalar or array)
 
     Returns:
-        2x2 unitary matrix
+        2x2 unitary matrix, or a stack of them for array input
     """
-    c = np.cos(theta / 2)
-    s = np.sin(theta / 2)
-    return np.array([[c, -s], [s, c]], dtype=complex)
+    c = np.cos(np.asarray(theta) / 2)
+    s = np.sin(np.asarray(theta) / 2)
+    return _stack([[c, -s], [s, c]])
 
 
-def rz(theta: float) -> np.ndarray:
+def rz(theta) -> np.ndarray:
     """
     Rotation around Z-axis.
 
     Args:
-        theta: Rotation angle in radians
+        theta: Rotation angle in radians (scalar or array)
 
     Returns:
-        2x2 unitary matrix
+        2x2 unitary matrix, or a stack of them for array input
     """
-    return np.array(
-        [[np.exp(-1j * theta / 2), 0], [0, np.exp(1j * theta / 2)]], dtype=complex
-    )
+    phase = np.exp(-0.5j * np.asarray(theta))
+    zero = np.zeros_like(phase)
+    return _stack([[phase, zero], [zero, phase.conj()]])
+
+
+def _stack(entries) -> np.ndarray:
+    """Assemble 2x2 matrices from entries that share a batch shape."""
+    rows = [np.stack(np.broadcast_arrays(*row), axis=-1) for row in entries]
+    return np.stack(rows, axis=-2).astype(complex)
@@ -0,0 +1,160 @@
+"""
+Gradients of expectation values for quantIQ
+
+The default method is adjoint differentiation. A forward pass gives
+|psi> = U_N ... U_1 |0>, and lambda = H|psi> is built from it. A backward
+sweep then undoes one gate at a time on both states. Each rotation
+R(theta) = exp(-i theta G / 2) contributes Im<lambda|G|psi_k> to the
+derivative of its angle. The whole gradient costs about three
+simulations and three statevectors, however many parameters there are.
+
+Parameter shift evaluates the expectation at theta +- pi/2 for every
+occurrence of a parameter. It costs two simulations per occurrence and
+is kept to verify the adjoint method.
+"""
+
+from typing import Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .compiler import compile_gates, get_gate_spec
+from .gates import X, Y, Z
+from .observables import PauliSum
+from .parameters import Parameter, collect_parameters
+from .simulator import Simulator
+
+# Methods accepted by QuantumCircuit.gradient()
+GRADIENT_METHODS = ("adjoint", "parameter_shift")
+
+# Generator G of each differentiable rotation exp(-i theta G / 2)
+_GENERATORS = {"RX": X, "RY": Y, "RZ": Z}
+
+Values = Mapping[Parameter, Union[float, np.ndarray]]
+
+
+def adjoint_gradient(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    observable: Union[PauliSum, str],
+    values: Values,
+    batch_size: Optional[int] = None,
+    precision: str = "double",
+) -> np.ndarray:
+    """
+    Gradient of <psi|H|psi> by adjoint differentiation.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        observable: Hermitian PauliSum, or a single Pauli string
+        values: Value of every Parameter, a scalar or one per batch element
+        batch_size: Number of bindings, or None for scalar values
+        precision: 'double' (complex128) or 'single' (complex64)
+
+    Returns:
+        Derivatives in the order of first use of each Parameter, with a
+        leading batch axis when batch_size is set
+    """
+    observable = _check_observable(observable, num_qubits)
+    parameters = collect_parameters(gates)
+    index = {id(param): i for i, param in enumerate(parameters)}
+
+    ket = Simulator(num_qubits, batch_size=batch_size, precision=precision)
+    steps = []
+    for gate in gates:
+        spec = get_gate_spec(gate[0])
+        if spec.kernel is None:
+            continue
+        qubits, params = spec.split(gate)
+        matrix = spec.resolve([_value(spec.name, p, values) for p in params])
+        spec.kernel(ket, qubits, matrix)
+        param = params[0] if params and isinstance(params[0], Parameter) else None
+        steps.append((spec, qubits, matrix, param))
+
+    bra = Simulator(num_qubits, batch_size=batch_size, precision=precision)
+    bra.statevector = observable.apply(ket.statevector).astype(ket.dtype)
+    scratch = Simulator(num_qubits, batch_size=batch_size, precision=precision)
+
+    gradient = np.zeros((batch_size or 1, len(parameters)))
+    for spec, qubits, matrix, param in reversed(steps):
+        if param is not None:
+            np.copyto(scratch.statevector, ket.statevector)
+            scratch.apply_gate(_GENERATORS[spec.name], qubits[0])
+            overlap = np.sum(bra.statevector.conj() * scratch.statevector, axis=-1)
+            gradient[:, index[id(param)]] += overlap.imag
+        inverse = None if matrix is None else np.conj(np.swapaxes(matrix, -1, -2))
+        spec.kernel(ket, qubits, inverse)
+        spec.kernel(bra, qubits, inverse)
+    return gradient if batch_size is not None else gradient[0]
+
+
+def parameter_shift_gradient(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    observable: Union[PauliSum, str],
+    values: Values,
+    batch_size: Optional[int] = None,
+    precision: str = "double",
+) -> np.ndarray:
+    """
+    Gradient of <psi|H|psi> by the parameter-shift rule.
+
+    Takes the same arguments and returns the same array as
+    ``adjoint_gradient``.
+    """
+    observable = _check_observable(observable, num_qubits)
+    parameters = collect_parameters(gates)
+    index = {id(param): i for i, param in enumerate(parameters)}
+    for gate in gates:
+        spec = get_gate_spec(gate[0])
+        for param in spec.split(gate)[1]:
+            _value(spec.name, param, values)
+
+    rows = batch_size or 1
+    gradient = np.zeros((rows, len(parameters)))
+    for position, gate in enumerate(gates):
+        param = gate[-1]
+        if not isinstance(param, Parameter):
+            continue
+        # Shift this occurrence alone; both shifts run as one batch
+        shifted = Parameter(param.name)
+        program = compile_gates(
+            num_qubits,
+            [*gates[:position], (*gate[:-1], shifted), *gates[position + 1 :]],
+        )
+        batch = {p: np.tile(np.atleast_1d(v), 2) for p, v in values.items()}
+        base = np.atleast_1d(values[param])
+        batch[shifted] = np.concatenate([base + np.pi / 2, base - np.pi / 2])
+        simulator = Simulator(num_qubits, batch_size=2 * rows, precision=precision)
+        program.run(simulator, batch)
+        energies = np.asarray(observable.expectation(simulator.statevector))
+        gradient[:, index[id(param)]] += (energies[:rows] - energies[rows:]) / 2
+    return gradient if batch_size is not None else gradient[0]
+
+
+def _check_observable(observable: Union[PauliSum, str], num_qubits: int) -> PauliSum:
+    """Convert a Pauli string and check the observable can be differentiated."""
+    if isinstance(observable, str):
+        observable = PauliSum({observable: 1.0})
+    if observable.num_qubits != num_qubits:
+        raise ValueError(
+            f"Observable acts on {observable.num_qubits} qubits, "
+            f"circuit has {num_qubits}"
+        )
+    if not observable.is_hermitian:
+        raise ValueError("Gradients need an observable with real coefficients")
+    return observable
+
+
+def _value(name: str, operand, values: Values):
+    """Bound value of a gate operand, checking the gate is differentiable."""
+    if not isinstance(operand, Parameter):
+        return operand
+    if name not in _GENERATORS:
+        raise ValueError(
+            f"Gradients support Parameters only in rx, ry and rz, not in {name}"
+        )
+    return values[operand]
+
+
+__all__ = ["GRADIENT_METHODS", "adjoint_gradient", "parameter_shift_gradient"]
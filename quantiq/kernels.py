@@ -0,0 +1,291 @@
+"""
+Statevector kernels for quantIQ
+
+Gates are applied in place on the statevector by viewing it as a tensor
+with one length-2 axis per qubit the gate touches. This keeps every gate
+at O(2^n) time and never materialises a 2^n x 2^n matrix.
+
+Qubit 0 is the most significant bit of the basis-state index, matching
+the bitstrings reported in ``Result``.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def _axes_view(
+    state: np.ndarray, qubits: Sequence[int], num_qubits: int
+) -> Tuple[np.ndarray, Dict[int, int]]:
+    """
+    Reshape the statevector so each of ``qubits`` has its own axis.
+
+    Qubits that are not listed are merged into contiguous blocks between
+    the listed ones, and any leading dimensions of ``state`` are collapsed
+    into the first axis.
+
+    Args:
+        state: Statevector whose last axis has length 2**num_qubits
+        qubits: Qubit indices that need an individual axis
+        num_qubits: Number of qubits in the statevector
+
+    Returns:
+        Tuple of (view, axis) where axis maps each qubit to its axis in view
+    """
+    shape = [-1]
+    axis: Dict[int, int] = {}
+    previous = 0
+    for qubit in sorted(set(qubits)):
+        shape.extend([1 << (qubit - previous), 2])
+        axis[qubit] = len(shape) - 1
+        previous = qubit + 1
+    shape.append(1 << (num_qubits - previous))
+    return state.reshape(shape), axis
+
+
+def _apply_2x2(a0: np.ndarray, a1: np.ndarray, gate: np.ndarray) -> None:
+    """
+    Apply a 2x2 matrix in place to a pair of amplitude views.
+
+    Args:
+        a0: Amplitudes where the target qubit is 0
+        a1: Amplitudes where the target qubit is 1
+        gate: 2x2 matrix, or a (B, 2, 2) stack applied row by row to a
+            batch of B statevectors on the leading axis
+    """
+    if gate.ndim == 3:
+        shape = (gate.shape[0],) + (1,) * (a0.ndim - 1)
+        g00, g01, g10, g11 = (entry.reshape(shape) for entry in gate.reshape(-1, 4).T)
+    else:
+        g00, g01, g10, g11 = gate[0, 0], gate[0, 1], gate[1, 0], gate[1, 1]
+
+    if not np.any(g01) and not np.any(g10):
+        # Diagonal gates (Z, S, T, RZ, ...) only rescale amplitudes
+        if np.any(g00 != 1):
+            a0 *= g00
+        if np.any(g11 != 1):
+            a1 *= g11
+        return
+
+    if not np.any(g00) and not np.any(g11):
+        # Anti-diagonal gates (X, Y) swap the halves with a phase
+        temp = a0.copy()
+        np.multiply(a1, g01, out=a0)
+        np.multiply(temp, g10, out=a1)
+        return
+
+    temp = a0.copy()
+    a0 *= g00
+    a0 += g01 * a1
+    a1 *= g11
+    a1 += g10 * temp
+
+
+def _fixed_index(
+    view: np.ndarray, axis: Dict[int, int], values: Mapping[int, int]
+) -> List[Union[int, slice]]:
+    """Index into an axes view selecting the given qubit values."""
+    index: List[Union[int, slice]] = [slice(None)] * view.ndim
+    for qubit, value in values.items():
+        index[axis[qubit]] = value
+    return index
+
+
+def _pair_views(
+    state: np.ndarray,
+    target: int,
+    num_qubits: int,
+    controls: Sequence[int] = (),
+    fixed: Optional[Mapping[int, int]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Views of the amplitudes with the target qubit at 0 and at 1.
+
+    Only the subspace where every control qubit is 1 is included, so a
+    controlled gate never touches the amplitudes it leaves unchanged.
+
+    Args:
+        state: Contiguous statevector of length 2**num_qubits
+        target: Target qubit index
+        num_qubits: Number of qubits in the statevector
+        controls: Control qubit indices
+        fixed: Qubits restricted to one value, so only that slice of the
+            state is included (used to split a gate between workers)
+
+    Returns:
+        Tuple of (a0, a1) views into state
+    """
+    fixed = fixed or {}
+    view, axis = _axes_view(state, [target, *controls, *fixed], num_qubits)
+    index = _fixed_index(view, axis, {**fixed, **{c: 1 for c in controls}})
+    index[axis[target]] = 0
+    a0 = view[tuple(index)]
+    index[axis[target]] = 1
+    a1 = view[tuple(index)]
+    return a0, a1
+
+
+def apply_gate(
+    state: np.ndarray,
+    gate: np.ndarray,
+    target: int,
+    num_qubits: int,
+    controls: Sequence[int] = (),
+    fixed: Optional[Mapping[int, int]] = None,
+) -> None:
+    """
+    Apply a (optionally controlled) single-qubit gate in place.
+
+    Args:
+        state: Contiguous statevector of length 2**num_qubits, or a
+            (B, 2**num_qubits) batch of statevectors
+        gate: 2x2 unitary matrix, or a (B, 2, 2) stack for a batch
+        target: Qubit index to apply the gate to
+        num_qubits: Number of qubits in the statevector
+        controls: Qubits that must all be 1 for the gate to act
+        fixed: Qubit values selecting the slice of the state to update
+    """
+    gate = np.asarray(gate, dtype=state.dtype)
+    a0, a1 = _pair_views(state, target, num_qubits, controls, fixed)
+    _apply_2x2(a0, a1, gate)
+
+
+def apply_swap(
+    state: np.ndarray,
+    qubit1: int,
+    qubit2: int,
+    num_qubits: int,
+    controls: Sequence[int] = (),
+    fixed: Optional[Mapping[int, int]] = None,
+) -> None:
+    """
+    Swap two qubits in place by exchanging the |01⟩ and |10⟩ amplitudes.
+
+    Args:
+        state: Contiguous statevector of length 2**num_qubits
+        qubit1: First qubit index
+        qubit2: Second qubit index
+        num_qubits: Number of qubits in the statevector
+        controls: Qubits that must all be 1 for the swap to act
+        fixed: Qubit values selecting the slice of the state to update
+    """
+    fixed = fixed or {}
+    view, axis = _axes_view(state, [qubit1, qubit2, *controls, *fixed], num_qubits)
+    index = _fixed_index(view, axis, {**fixed, **{c: 1 for c in controls}})
+    index[axis[qubit1]], index[axis[qubit2]] = 0, 1
+    a01 = view[tuple(index)]
+    index[axis[qubit1]], index[axis[qubit2]] = 1, 0
+    a10 = view[tuple(index)]
+    temp = a01.copy()
+    a01[...] = a10
+    a10[...] = temp
+
+
+def apply_matrix(
+    state: np.ndarray,
+    matrix: np.ndarray,
+    qubits: Sequence[int],
+    num_qubits: int,
+    fixed: Optional[Mapping[int, int]] = None,
+) -> None:
+    """
+    Apply a k-qubit unitary to the statevector in place.
+
+    The qubit axes are moved to the front of a view, multiplied as a
+    2^k x 2^(n-k) block and written back, which costs O(2^k * 2^n).
+
+    Args:
+        state: Contiguous statevector of length 2**num_qubits
+        matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+        qubits: Distinct qubit indices the matrix acts on
+        num_qubits: Number of qubits in the statevector
+        fixed: Qubit values selecting the slice of the state to update
+    """
+    if len(qubits) == 1:
+        apply_gate(state, matrix, qubits[0], num_qubits, fixed=fixed)
+        return
+
+    fixed = fixed or {}
+    matrix = np.asarray(matrix, dtype=state.dtype)
+    view, axis = _axes_view(state, [*qubits, *fixed], num_qubits)
+    if fixed:
+        view = view[tuple(_fixed_index(view, axis, fixed))]
+        # Indexing drops the fixed axes, shifting the ones after them
+        axis = {q: axis[q] - sum(axis[f] < axis[q] for f in fixed) for q in qubits}
+    front = np.moveaxis(view, [axis[q] for q in qubits], range(len(qubits)))
+    block = front.reshape(matrix.shape[1], -1)
+    front[...] = (matrix @ block).reshape(front.shape)
+
+
+def embed_matrix(
+    matrix: np.ndarray, qubits: Sequence[int], target_qubits: Sequence[int]
+) -> np.ndarray:
+    """
+    Extend a gate matrix to act on a larger, ordered set of qubits.
+
+    Args:
+        matrix: 2^k x 2^k gate matrix, qubits[0] being its most significant bit
+        qubits: Qubits the matrix acts on
+        target_qubits: Ordered superset of qubits to embed into
+
+    Returns:
+        2^m x 2^m matrix over target_qubits, identity on the extra qubits
+    """
+    if tuple(qubits) == tuple(target_qubits):
+        return matrix
+    rest = [q for q in target_qubits if q not in qubits]
+    full = np.kron(matrix, np.eye(1 << len(rest), dtype=complex))
+    # Axes of full are ordered (*qubits, *rest); permute them to target order
+    order = [*qubits, *rest]
+    perm = [order.index(q) for q in target_qubits]
+    m = len(order)
+    tensor = full.reshape((2,) * (2 * m))
+    tensor = tensor.transpose(perm + [p + m for p in perm])
+    return tensor.reshape(1 << m, 1 << m)
+
+
+def expand_matrix(
+    matrix: np.ndarray, qubits: Sequence[int], num_qubits: int
+) -> np.ndarray:
+    """
+    Build the dense 2^n x 2^n matrix of a gate acting on ``qubits``.
+
+    This is a reference implementation for testing the kernels; it costs
+    O(4^n) memory and is never used during simulation.
+
+    Args:
+        matrix: 2^k x 2^k gate matrix, qubits[0] being its most significant bit
+        qubits: Qubit indices the gate acts on
+        num_qubits: Number of qubits
+
+    Returns:
+        Full-space gate matrix
+    """
+    return embed_matrix(matrix, qubits, range(num_qubits))
+
+
+def expand_gate(gate: np.ndarray, target: int, num_qubits: int) -> np.ndarray:
+    """
+    Build the dense 2^n x 2^n matrix of a single-qubit gate.
+
+    Reference oracle for tests, see ``expand_matrix``.
+
+    Args:
+        gate: 2x2 gate matrix
+        target: Which qubit the gate acts on
+        num_qubits: Number of qubits
+
+    Returns:
+        Full-space gate matrix
+    """
+    return expand_matrix(gate, [target], num_qubits)
+
+
+__all__ = [
+    "apply_gate",
+    "apply_matrix",
+    "apply_swap",
+    "embed_matrix",
+    "expand_gate",
+    "expand_matrix",
+]
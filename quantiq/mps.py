@@ -0,0 +1,371 @@
+"""
+Matrix product state simulation for quantIQ
+
+The state is a chain of tensors A[s] of shape (left bond, 2, right bond),
+one per site, whose contraction gives every amplitude. Memory grows with
+the bond dimension rather than with 2^n, so shallow, nearest-neighbour
+circuits on many qubits stay cheap while their entanglement is low.
+
+A single-qubit gate updates one tensor. A k-qubit gate contracts the k
+neighbouring sites it acts on into one block, applies the matrix and
+splits the block back with SVDs, discarding singular values beyond the
+bond-dimension cap or below the truncation threshold. The chain is kept
+in mixed canonical form around the site being updated, so each SVD
+truncation is optimal for the whole state.
+
+Gates on non-adjacent qubits are routed: SWAPs move the qubits next to
+each other and the resulting site order is kept (``sites``), not undone.
+A circuit-level SWAP only relabels sites and costs nothing.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .gates import SWAP, controlled
+from .kernels import embed_matrix
+from .results import Result, _packed_to_indices
+from .simulator import PRECISIONS, Seed
+
+# Default cap on the bond dimension
+DEFAULT_MAX_BOND = 64
+
+# Default truncation threshold: largest discarded weight (sum of squared
+# singular values, relative to the kept norm) per SVD
+DEFAULT_CUTOFF = 1e-12
+
+
+class MPSSimulator:
+    """
+    Matrix product state simulator with bounded bond dimension.
+
+    Attributes:
+        num_qubits: Number of qubits
+        max_bond: Largest bond dimension kept by an SVD
+        cutoff: Discarded-weight threshold for each SVD
+        tensors: Site tensors of shape (left bond, 2, right bond)
+        sites: Qubit held by each site, left to right
+        truncation_error: Total weight discarded by truncations so far; an
+            estimate of 1 - fidelity with the exact state
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        precision: str = "double",
+        max_bond: int = DEFAULT_MAX_BOND,
+        cutoff: float = DEFAULT_CUTOFF,
+    ):
+        """
+        Initialize the product state |00...0⟩.
+
+        Args:
+            num_qubits: Number of qubits to simulate
+            precision: 'double' (complex128) or 'single' (complex64)
+            max_bond: Bond-dimension cap; larger is more exact and slower
+            cutoff: Singular values are dropped while the discarded weight
+                stays below this fraction of the total
+        """
+        if num_qubits <= 0:
+            raise ValueError("Number of qubits must be positive")
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision '{precision}', expected one of {list(PRECISIONS)}"
+            )
+        if max_bond < 1:
+            raise ValueError("Bond dimension cap must be at least 1")
+        if cutoff < 0:
+            raise ValueError("Truncation cutoff must be non-negative")
+
+        self.num_qubits = num_qubits
+        self.precision = precision
+        self.dtype = np.dtype(PRECISIONS[precision])
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.reset()
+
+    def close(self) -> None:
+        """Nothing to release; accepted so every backend can be closed."""
+
+    def reset(self) -> None:
+        """Reset to the |00...0⟩ state with the identity site order."""
+        zero = np.zeros((1, 2, 1), dtype=self.dtype)
+        zero[0, 0, 0] = 1.0
+        self.tensors: List[np.ndarray] = [zero.copy() for _ in range(self.num_qubits)]
+        self.sites = list(range(self.num_qubits))
+        self._position = list(range(self.num_qubits))
+        # Orthogonality center: tensors left of it are left-canonical and
+        # tensors right of it right-canonical
+        self._center = 0
+        self.truncation_error = 0.0
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        """Dimension of each of the n - 1 internal bonds."""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def _validate_qubits(self, qubits: Sequence[int]) -> None:
+        """Validate that qubit indices are in range and distinct."""
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate qubits must be different, got {list(qubits)}")
+        if not all(0 <= qubit < self.num_qubits for qubit in qubits):
+            raise ValueError("Invalid qubit indices")
+
+    def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
+        """
+        Apply a single-qubit gate to its site tensor.
+
+        Args:
+            gate: 2x2 unitary matrix
+            target_qubit: Qubit index to apply gate to
+        """
+        if target_qubit < 0 or target_qubit >= self.num_qubits:
+            raise ValueError(f"Invalid qubit index: {target_qubit}")
+        if np.ndim(gate) != 2:
+            raise ValueError("MPS backend doesn't support batched gates")
+        site = self._position[target_qubit]
+        # A unitary on the physical leg keeps the tensor's canonical form
+        self.tensors[site] = np.einsum(
+            "ij,ajb->aib", gate.astype(self.dtype, copy=False), self.tensors[site]
+        )
+
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
+        """
+        Apply a single-qubit gate conditioned on one or more control qubits.
+
+        Args:
+            gate: 2x2 unitary matrix applied to the target
+            controls: Control qubit indices
+            target: Target qubit index
+        """
+        if not controls:
+            self.apply_gate(gate, target)
+            return
+        self.apply_unitary(controlled(gate, len(controls)), [*controls, target])
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """
+        Apply SWAP gate by exchanging the sites of two qubits.
+
+        Args:
+            qubit1: First qubit index
+            qubit2: Second qubit index
+        """
+        self._validate_qubits([qubit1, qubit2])
+        site1, site2 = self._position[qubit1], self._position[qubit2]
+        self.sites[site1], self.sites[site2] = qubit2, qubit1
+        self._position[qubit1], self._position[qubit2] = site2, site1
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a k-qubit unitary, routing its qubits onto adjacent sites.
+
+        Args:
+            matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+            qubits: Qubit indices the matrix acts on
+        """
+        self._validate_qubits(qubits)
+        if np.shape(matrix) != (2 ** len(qubits), 2 ** len(qubits)):
+            raise ValueError(
+                f"Matrix shape {np.shape(matrix)} doesn't match {len(qubits)} qubits"
+            )
+        if len(qubits) == 1:
+            self.apply_gate(matrix, qubits[0])
+            return
+        start = self._gather(qubits)
+        block = self.sites[start : start + len(qubits)]
+        self._apply_block(embed_matrix(matrix, qubits, block), start, len(qubits))
+
+    def _gather(self, qubits: Sequence[int]) -> int:
+        """
+        Move qubits onto contiguous sites with adjacent SWAPs.
+
+        The other qubits are brought next to the site of qubits[0] one at
+        a time, each along the shortest path.
+
+        Returns:
+            First site of the block now holding the qubits
+        """
+        low = high = self._position[qubits[0]]
+        for qubit in qubits[1:]:
+            site = self._position[qubit]
+            if site > high:
+                for s in range(site - 1, high, -1):
+                    self._swap_sites(s)
+                high += 1
+            else:
+                for s in range(site, low - 1):
+                    self._swap_sites(s)
+                low -= 1
+        return low
+
+    def _swap_sites(self, site: int) -> None:
+        """Exchange the qubits on sites ``site`` and ``site + 1``."""
+        self._apply_block(SWAP, site, 2)
+        left, right = self.sites[site], self.sites[site + 1]
+        self.sites[site], self.sites[site + 1] = right, left
+        self._position[left], self._position[right] = site + 1, site
+
+    def _move_center(self, site: int) -> None:
+        """Shift the orthogonality center to ``site`` with QR sweeps."""
+        while self._center < site:
+            s = self._center
+            left, _, right = self.tensors[s].shape
+            q, r = np.linalg.qr(self.tensors[s].reshape(left * 2, right))
+            self.tensors[s] = q.reshape(left, 2, -1)
+            self.tensors[s + 1] = np.tensordot(r, self.tensors[s + 1], axes=1)
+            self._center += 1
+        while self._center > site:
+            s = self._center
+            left, _, right = self.tensors[s].shape
+            # LQ decomposition through the QR of the transpose
+            q, r = np.linalg.qr(self.tensors[s].reshape(left, 2 * right).T)
+            self.tensors[s] = q.T.reshape(-1, 2, right)
+            self.tensors[s - 1] = np.tensordot(self.tensors[s - 1], r.T, axes=1)
+            self._center -= 1
+
+    def _apply_block(self, matrix: np.ndarray, start: int, width: int) -> None:
+        """
+        Apply a matrix to ``width`` consecutive sites and split them again.
+
+        Args:
+            matrix: 2^width x 2^width matrix over the sites in order
+            start: First site of the block
+            width: Number of sites
+        """
+        self._move_center(start)
+        theta = self.tensors[start]
+        for s in range(start + 1, start + width):
+            theta = np.tensordot(theta, self.tensors[s], axes=1)
+        left, right = theta.shape[0], theta.shape[-1]
+        theta = np.einsum(
+            "ij,ajb->aib",
+            matrix.astype(self.dtype, copy=False),
+            theta.reshape(left, 1 << width, right),
+        )
+
+        # Peel one site off the left at a time; the singular values move
+        # right with the remainder, leaving the center on the last site
+        for s in range(start, start + width - 1):
+            rest = theta.shape[1] // 2
+            u, values, vh = np.linalg.svd(
+                theta.reshape(left * 2, rest * right), full_matrices=False
+            )
+            keep, values = self._truncate(values)
+            self.tensors[s] = u[:, :keep].reshape(left, 2, keep)
+            theta = (values[:, None] * vh[:keep]).reshape(keep, rest, right)
+            left = keep
+        self.tensors[start + width - 1] = theta.reshape(left, 2, right)
+        self._center = start + width - 1
+
+    def _truncate(self, values: np.ndarray) -> Tuple[int, np.ndarray]:
+        """
+        Choose how many singular values to keep and record the loss.
+
+        Args:
+            values: Singular values in decreasing order
+
+        Returns:
+            Tuple of (number kept, kept values rescaled to the original norm)
+        """
+        weights = values.astype(np.float64) ** 2
+        total = weights.sum()
+        # tail[i] is the weight discarded by keeping only the first i values
+        tail = np.append(np.cumsum(weights[::-1])[::-1], 0.0)
+        keep = max(1, int(np.count_nonzero(tail[1:] > self.cutoff * total)) + 1)
+        keep = min(keep, self.max_bond, len(values))
+        if total > 0 and tail[keep] > 0:
+            self.truncation_error += float(tail[keep] / total)
+            scale = np.sqrt(total / (total - tail[keep]))
+            return keep, (values[:keep] * scale).astype(values.dtype)
+        return keep, values[:keep]
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
+        """
+        Measure all qubits in computational basis.
+
+        Sites are sampled left to right, each conditioned on the bits drawn
+        so far, which needs the chain right-canonical from site 0. Shots
+        that share a prefix are carried as one row with a count and split
+        by a binomial draw at every site, so the cost is
+        O(n * rows * bond^2) with rows bounded by min(shots, distinct
+        outcomes), never 2^n.
+
+        Args:
+            shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            Result object with measurement outcomes; ``metadata`` holds
+            the truncation error and the largest bond dimension
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        rng = np.random.default_rng(seed)
+        self._move_center(0)
+        environment = np.ones((1, 1), dtype=self.dtype)
+        counts = np.array([shots], dtype=np.int64)
+        bits = np.zeros((1, self.num_qubits), dtype=np.uint8)
+        for site, tensor in enumerate(self.tensors):
+            branch = np.tensordot(environment, tensor, axes=1)
+            weights = np.atleast_1d(
+                np.sum(np.abs(branch) ** 2, axis=2, dtype=np.float64)
+            )
+            p1 = np.clip(weights[:, 1] / weights.sum(axis=1), 0.0, 1.0)
+            ones = rng.binomial(counts, p1)
+            zeros = counts - ones
+
+            rows0, rows1 = np.flatnonzero(zeros), np.flatnonzero(ones)
+            parent = np.concatenate([rows0, rows1])
+            bit = np.repeat(np.array([0, 1], dtype=np.uint8), [len(rows0), len(rows1)])
+            counts = np.concatenate([zeros[rows0], ones[rows1]])
+            norms = np.sqrt(weights[parent, bit])
+            environment = branch[parent, bit] / norms[:, None].astype(self.dtype)
+            bits = bits[parent]
+            bits[:, self.sites[site]] = bit
+
+        metadata = {
+            "truncation_error": self.truncation_error,
+            "bond_dimension": max(self.bond_dimensions, default=1),
+        }
+        return Result.from_arrays(
+            _packed_to_indices(np.packbits(bits, axis=1), self.num_qubits),
+            counts,
+            shots,
+            self.num_qubits,
+            metadata,
+        )
+
+    def get_statevector(self) -> np.ndarray:
+        """
+        Contract the chain into a dense statevector.
+
+        This costs O(2^n) memory and is meant for small circuits and tests.
+
+        Returns:
+            Statevector in the usual qubit order
+        """
+        state = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            state = np.tensordot(state, tensor, axes=1)
+        state = state.reshape((2,) * self.num_qubits)
+        return state.transpose(np.argsort(self.sites)).reshape(-1)
+
+    def get_probabilities(self) -> np.ndarray:
+        """
+        Get the probability distribution from the dense statevector.
+
+        Returns:
+            Array of probabilities for each computational basis state
+        """
+        return np.abs(self.get_statevector()) ** 2
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"MPSSimulator(num_qubits={self.num_qubits}, max_bond={self.max_bond})"
+
+
+__all__ = ["MPSSimulator"]
@@ -0,0 +1,338 @@
+"""
+Noisy simulation by quantum trajectories for quantIQ
+
+A density matrix would square the memory of a statevector, so noise is
+simulated as Monte Carlo trajectories instead: each trajectory evolves a
+pure state and, after every gate, applies one Kraus operator of each
+noise channel chosen at random. Averaged over trajectories, the
+measurement statistics converge to those of the noisy channel.
+
+Every trajectory draws one uniform number per noise location from its
+own stream (spawned from the run's seed with ``SeedSequence.spawn``), so
+results are reproducible and the errors drawn don't depend on how
+trajectories are grouped. Trajectories that have drawn the same errors
+so far share one row of a batched statevector and are only split when
+their errors differ; gates are applied to all rows at once, with
+per-row error operators stacked along the batch axis.
+
+Readout error is applied afterwards to the sampled counts: for each
+measured bit, the number of flips among the shots of every outcome is
+drawn from a binomial in one vectorized call.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .compiler import get_gate_spec
+from .gates import X, Y, Z
+from .parameters import is_symbolic
+from .results import Result
+from .simulator import MAX_STATEVECTOR_BYTES, PRECISIONS, Seed, Simulator, sample_counts
+
+# Default number of trajectories per run (fewer if there are fewer shots)
+DEFAULT_TRAJECTORIES = 1000
+
+# Error operators of the depolarizing channel, indexed by error choice
+_PAULIS = np.array([np.eye(2), X, Y, Z], dtype=complex)
+
+
+class NoiseModel:
+    """
+    Gate and readout noise applied uniformly to every qubit.
+
+    After each gate, every qubit it acts on goes through a depolarizing
+    channel (with probability p, a uniformly random X, Y or Z error) and
+    then amplitude damping (|1⟩ decays to |0⟩ with probability gamma).
+    Each measured bit is flipped with the readout error probabilities.
+
+    Attributes:
+        depolarizing: Depolarizing probability p per gate and qubit
+        amplitude_damping: Damping probability gamma per gate and qubit
+        readout: Tuple of (P(read 1 | 0), P(read 0 | 1))
+        trajectories: Number of trajectories to sample
+    """
+
+    def __init__(
+        self,
+        depolarizing: float = 0.0,
+        amplitude_damping: float = 0.0,
+        readout: Union[float, Tuple[float, float]] = 0.0,
+        trajectories: int = DEFAULT_TRAJECTORIES,
+    ):
+        """
+        Initialize a noise model.
+
+        Args:
+            depolarizing: Depolarizing probability per gate and qubit
+            amplitude_damping: Damping probability per gate and qubit
+            readout: Bit-flip probability of a measurement, or a pair
+                (P(read 1 | 0), P(read 0 | 1)) for asymmetric errors
+            trajectories: Number of trajectories; each gets an equal
+                share of the shots
+        """
+        if isinstance(readout, Sequence):
+            rates = readout
+        else:
+            rates = (readout, readout)
+        probabilities = [depolarizing, amplitude_damping, *rates]
+        if len(probabilities) != 4 or not all(0 <= p <= 1 for p in probabilities):
+            raise ValueError("Noise probabilities must be between 0 and 1")
+        if trajectories <= 0:
+            raise ValueError("Number of trajectories must be positive")
+        self.depolarizing = float(depolarizing)
+        self.amplitude_damping = float(amplitude_damping)
+        self.readout = (float(rates[0]), float(rates[1]))
+        self.trajectories = trajectories
+
+    @property
+    def has_gate_noise(self) -> bool:
+        """Whether any channel acts after gates, requiring trajectories."""
+        return self.depolarizing > 0 or self.amplitude_damping > 0
+
+    def locations(self, gates: Sequence[Tuple]) -> List[Tuple[int, str, int]]:
+        """
+        Points where a noise channel acts.
+
+        Args:
+            gates: Gate tuples (name, *qubits, *params)
+
+        Returns:
+            List of (gate index, channel, qubit) in execution order;
+            channel is 'depolarizing' or 'amplitude_damping'
+        """
+        channels = [
+            name
+            for name in ("depolarizing", "amplitude_damping")
+            if getattr(self, name) > 0
+        ]
+        locations: List[Tuple[int, str, int]] = []
+        for index, gate in enumerate(gates):
+            spec = get_gate_spec(gate[0])
+            if spec.kernel is None:
+                continue
+            qubits, _ = spec.split(gate)
+            for qubit in qubits:
+                locations.extend((index, channel, qubit) for channel in channels)
+        return locations
+
+    def apply_readout(
+        self, result: Result, seed: Union[Seed, np.random.SeedSequence] = None
+    ) -> Result:
+        """
+        Flip measured bits of a result with the readout error probabilities.
+
+        Args:
+            result: Noiseless measurement result
+            seed: Seed, SeedSequence or np.random.Generator for the flips
+
+        Returns:
+            Result with the same shots and metadata
+        """
+        p01, p10 = self.readout
+        if p01 == 0 and p10 == 0:
+            return result
+        rng = np.random.default_rng(seed)
+        outcomes, frequencies = result.outcomes, result.frequencies
+        width = result.num_qubits
+        for position in range(width):
+            mask = np.ones(1, dtype=outcomes.dtype) << (width - 1 - position)
+            ones = (outcomes & mask) != 0
+            flips = rng.binomial(frequencies, np.where(ones, p10, p01))
+            outcomes = np.concatenate([outcomes, outcomes ^ mask])
+            frequencies = np.concatenate([frequencies - flips, flips])
+            keep = frequencies > 0
+            outcomes, inverse = np.unique(outcomes[keep], return_inverse=True)
+            frequencies = np.bincount(
+                inverse.ravel(), weights=frequencies[keep], minlength=len(outcomes)
+            ).astype(np.int64)
+        return Result.from_arrays(
+            outcomes, frequencies, result.shots, width, result.metadata
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"NoiseModel(depolarizing={self.depolarizing}, "
+            f"amplitude_damping={self.amplitude_damping}, "
+            f"readout={self.readout}, trajectories={self.trajectories})"
+        )
+
+
+def noise_streams(seed: Seed) -> Tuple[np.random.SeedSequence, np.random.SeedSequence]:
+    """
+    Independent seed sequences for trajectories and readout.
+
+    Args:
+        seed: Seed or np.random.Generator of the run
+
+    Returns:
+        Tuple of (trajectory seed, readout seed)
+    """
+    if isinstance(seed, np.random.Generator):
+        root = np.random.SeedSequence(int(seed.integers(2**63)))
+    else:
+        root = np.random.SeedSequence(seed)
+    trajectory, readout = root.spawn(2)
+    return trajectory, readout
+
+
+def run_trajectories(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    noise: NoiseModel,
+    shots: int,
+    seed: Optional[np.random.SeedSequence] = None,
+    precision: str = "double",
+) -> Result:
+    """
+    Sample a circuit under gate noise with batched trajectories.
+
+    Trajectories are processed in chunks whose statevectors and random
+    draws fit the statevector memory bound; within a chunk, those with
+    identical error histories share a batch row.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params), parameters bound
+        noise: Noise model with gate noise
+        shots: Total number of shots
+        seed: SeedSequence from which one stream per trajectory (and one
+            for sampling) is spawned
+        precision: 'double' or 'single' (complex64) statevector
+
+    Returns:
+        Result over all qubits; metadata holds the number of
+        trajectories and of distinct error patterns
+    """
+    seed = seed if seed is not None else np.random.SeedSequence()
+    locations = noise.locations(gates)
+    count = min(noise.trajectories, shots)
+    streams = seed.spawn(count + 1)
+    sampler = np.random.default_rng(streams[-1])
+    trajectory_shots = np.full(count, shots // count, dtype=np.int64)
+    trajectory_shots[: shots % count] += 1
+
+    # Each trajectory of a chunk needs a statevector row and its draws
+    itemsize = np.dtype(PRECISIONS[precision]).itemsize
+    row_bytes = (1 << num_qubits) * itemsize + len(locations) * 8
+    chunk = max(1, MAX_STATEVECTOR_BYTES // row_bytes)
+    outcomes, frequencies, patterns = [], [], 0
+    for start in range(0, count, chunk):
+        stop = min(start + chunk, count)
+        draws = np.array(
+            [
+                np.random.default_rng(stream).random(len(locations))
+                for stream in streams[start:stop]
+            ]
+        ).reshape(stop - start, len(locations))
+        simulator, rows = _evolve(num_qubits, gates, noise, locations, draws, precision)
+        batch = simulator.batch_size or 1
+        row_shots = np.bincount(
+            rows, weights=trajectory_shots[start:stop], minlength=batch
+        ).astype(np.int64)
+        for probabilities, row_total in zip(simulator.get_probabilities(), row_shots):
+            sampled, counts = sample_counts(probabilities, int(row_total), sampler)
+            outcomes.append(sampled)
+            frequencies.append(counts)
+        patterns += batch
+
+    unique, inverse = np.unique(np.concatenate(outcomes), return_inverse=True)
+    totals = np.bincount(
+        inverse.ravel(), weights=np.concatenate(frequencies), minlength=len(unique)
+    ).astype(np.int64)
+    return Result.from_arrays(
+        unique,
+        totals,
+        shots,
+        num_qubits,
+        {"trajectories": count, "error_patterns": patterns},
+    )
+
+
+def _evolve(
+    num_qubits: int,
+    gates: Sequence[Tuple],
+    noise: NoiseModel,
+    locations: List[Tuple[int, str, int]],
+    draws: np.ndarray,
+    precision: str,
+) -> Tuple[Simulator, np.ndarray]:
+    """
+    Evolve a chunk of trajectories, grouped by error history.
+
+    Args:
+        draws: (trajectories, locations) uniform numbers of the chunk
+
+    Returns:
+        Tuple of (batched simulator with one row per distinct error
+        history, row of each trajectory)
+    """
+    simulator = Simulator(num_qubits, batch_size=1, precision=precision)
+    rows = np.zeros(len(draws), dtype=np.intp)
+    next_location = 0
+    for index, gate in enumerate(gates):
+        spec = get_gate_spec(gate[0])
+        if spec.kernel is None:
+            continue
+        qubits, params = spec.split(gate)
+        if is_symbolic(params):
+            raise ValueError("Bind all parameters before simulating noise")
+        spec.kernel(simulator, qubits, spec.resolve(params))
+
+        while next_location < len(locations) and locations[next_location][0] == index:
+            _, channel, qubit = locations[next_location]
+            draw = draws[:, next_location]
+            next_location += 1
+            if channel == "depolarizing":
+                p = noise.depolarizing
+                # Uniform below p picks X, Y or Z by which third it falls in
+                choice = np.where(draw < p, 1 + np.minimum(3 * draw / p, 2), 0)
+                choice = choice.astype(np.intp)
+            else:
+                halves = simulator.statevector.reshape(
+                    simulator.batch_size or 1, 1 << qubit, 2, -1
+                )
+                excited = np.sum(np.abs(halves[:, :, 1]) ** 2, axis=(1, 2))
+                jump = noise.amplitude_damping * excited
+                choice = (draw < jump[rows]).astype(np.intp)
+
+            keys, rows = np.unique(rows * 4 + choice, return_inverse=True)
+            rows = rows.ravel()
+            parents, choices = keys // 4, keys % 4
+            if len(keys) != simulator.batch_size:
+                simulator.statevector = simulator.statevector[parents]
+                simulator.batch_size = len(keys)
+            if channel == "depolarizing":
+                if choices.any():
+                    simulator.apply_gate(_PAULIS[choices], qubit)
+            else:
+                simulator.apply_gate(
+                    _damping_operators(noise.amplitude_damping, jump[parents], choices),
+                    qubit,
+                )
+    return simulator, rows
+
+
+def _damping_operators(
+    gamma: float, jump: np.ndarray, choices: np.ndarray
+) -> np.ndarray:
+    """
+    Normalized amplitude-damping Kraus operator of each row.
+
+    Args:
+        gamma: Damping probability
+        jump: Probability of decay in each row
+        choices: 1 where the row decays, 0 where it doesn't
+
+    Returns:
+        (rows, 2, 2) stack of operators
+    """
+    operators = np.zeros((len(choices), 2, 2), dtype=complex)
+    stay = choices == 0
+    operators[stay, 0, 0] = 1 / np.sqrt(1 - jump[stay])
+    operators[stay, 1, 1] = np.sqrt(1 - gamma) / np.sqrt(1 - jump[stay])
+    operators[~stay, 0, 1] = np.sqrt(gamma) / np.sqrt(jump[~stay])
+    return operators
+
+
+__all__ = ["DEFAULT_TRAJECTORIES", "NoiseModel", "noise_streams", "run_trajectories"]
@@ -0,0 +1,220 @@
+"""
+Pauli-sum observables and exact statevector expectation values
+"""
+
+from collections import defaultdict
+from functools import reduce
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from .gates import I, X, Y, Z
+
+PAULIS = {"I": I, "X": X, "Y": Y, "Z": Z}
+
+Terms = Union[Mapping[str, complex], Sequence[Tuple[str, complex]]]
+
+
+class PauliSum:
+    """
+    A weighted sum of Pauli strings, e.g. 0.5 * ZZI - 1.2 * XIX.
+
+    Character i of a Pauli string acts on qubit i. Terms that flip the
+    same qubits (the X and Y positions) are grouped, and each group is
+    evaluated with one pass over the statevector.
+
+    Attributes:
+        num_qubits: Number of qubits the observable acts on
+        paulis: Pauli strings, one per term
+        coeffs: Complex coefficient of each term
+    """
+
+    # A group with more terms than this multiple of num_qubits is
+    # evaluated with a Walsh-Hadamard transform instead of term by term
+    _TRANSFORM_RATIO = 1
+
+    def __init__(self, terms: Terms):
+        """
+        Initialize a Pauli sum.
+
+        Args:
+            terms: Mapping or sequence of (Pauli string, coefficient);
+                repeated strings are added together
+        """
+        items = terms.items() if isinstance(terms, Mapping) else terms
+        combined: Dict[str, complex] = {}
+        for pauli, coeff in items:
+            combined[pauli] = combined.get(pauli, 0) + complex(coeff)
+        if not combined:
+            raise ValueError("PauliSum needs at least one term")
+
+        lengths = {len(pauli) for pauli in combined}
+        if len(lengths) != 1 or 0 in lengths:
+            raise ValueError("All Pauli strings must have the same non-zero length")
+        for pauli in combined:
+            if set(pauli) - set(PAULIS):
+                raise ValueError(f"Invalid Pauli string '{pauli}'")
+
+        self.num_qubits = lengths.pop()
+        self.paulis: List[str] = list(combined)
+        self.coeffs = np.array(list(combined.values()), dtype=complex)
+        self._groups = self._group_terms()
+
+    def _group_terms(self) -> List[Tuple[Tuple[int, ...], np.ndarray, np.ndarray]]:
+        """
+        Group terms by the qubits they flip.
+
+        Returns:
+            List of (flipped qubits, Z masks, complex weights) per group,
+            where the weight folds the i^ny phase of Y = iXZ into the
+            coefficient
+        """
+        groups: Dict[Tuple[int, ...], List[Tuple[int, complex]]] = defaultdict(list)
+        for pauli, coeff in zip(self.paulis, self.coeffs):
+            flips = tuple(q for q, p in enumerate(pauli) if p in "XY")
+            z_mask = 0
+            for q, p in enumerate(pauli):
+                if p in "YZ":
+                    z_mask |= 1 << (self.num_qubits - 1 - q)
+            groups[flips].append((z_mask, coeff * 1j ** pauli.count("Y")))
+        return [
+            (
+                flips,
+                np.array([z for z, _ in members], dtype=np.int64),
+                np.array([w for _, w in members], dtype=complex),
+            )
+            for flips, members in groups.items()
+        ]
+
+    @property
+    def is_hermitian(self) -> bool:
+        """Whether every coefficient is real."""
+        return bool(np.all(self.coeffs.imag == 0))
+
+    def expectation(self, statevector: np.ndarray) -> Union[complex, np.ndarray]:
+        """
+        Compute <psi|H|psi> exactly.
+
+        Args:
+            statevector: State of shape (2**n,) or a batch of shape
+                (batch, 2**n)
+
+        Returns:
+            Expectation value (a float for real coefficients), or an
+            array with one value per batch element
+        """
+        n = self.num_qubits
+        if statevector.shape[-1] != 2**n:
+            raise ValueError(
+                f"Statevector size {statevector.shape[-1]} doesn't match "
+                f"{n}-qubit observable"
+            )
+        # Axis q + 1 holds qubit q; axis 0 is the batch
+        psi = statevector.reshape(-1, *([2] * n))
+        total = np.zeros(psi.shape[0], dtype=complex)
+
+        for flips, z_masks, weights in self._groups:
+            # prod[b] = conj(psi[b ^ x]) * psi[b] for the group's flip mask x
+            flipped = np.flip(psi, axis=tuple(q + 1 for q in flips)) if flips else psi
+            prod = (np.conj(flipped) * psi).reshape(psi.shape[0], -1)
+            if len(z_masks) > self._TRANSFORM_RATIO * n:
+                # All 2**n Z-parities at once: sum_b prod[b] (-1)^(b.z)
+                total += _walsh_hadamard(prod, n)[:, z_masks] @ weights
+            else:
+                for z_mask, weight in zip(z_masks.tolist(), weights):
+                    total += weight * _parity_sum(prod, z_mask, n)
+
+        if self.is_hermitian:
+            total = total.real
+        return total if statevector.ndim > 1 else total[0].item()
+
+    def apply(self, statevector: np.ndarray) -> np.ndarray:
+        """
+        Compute H|psi> without building the matrix.
+
+        Args:
+            statevector: State of shape (2**n,) or a batch of shape
+                (batch, 2**n)
+
+        Returns:
+            Complex array of the same shape
+        """
+        n = self.num_qubits
+        if statevector.shape[-1] != 2**n:
+            raise ValueError(
+                f"Statevector size {statevector.shape[-1]} doesn't match "
+                f"{n}-qubit observable"
+            )
+        psi = statevector.reshape(-1, *([2] * n))
+        result = np.zeros(psi.shape, dtype=complex)
+
+        for flips, z_masks, weights in self._groups:
+            # Z parts are diagonal; the group's X parts then flip the same qubits
+            diagonal = sum(
+                weight * _parity_signs(z_mask, n)
+                for z_mask, weight in zip(z_masks.tolist(), weights)
+            )
+            term = psi * diagonal.reshape([2] * n)
+            result += np.flip(term, axis=tuple(q + 1 for q in flips)) if flips else term
+        return result.reshape(statevector.shape)
+
+    def to_matrix(self) -> np.ndarray:
+        """
+        Dense 2**n x 2**n matrix of the observable.
+
+        Intended as a reference for small systems; expectation() never
+        builds it.
+
+        Returns:
+            Complex matrix
+        """
+        matrix = np.zeros((2**self.num_qubits, 2**self.num_qubits), dtype=complex)
+        for pauli, coeff in zip(self.paulis, self.coeffs):
+            term = np.array([[coeff]])
+            for p in pauli:
+                term = np.kron(term, PAULIS[p])
+            matrix += term
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.paulis)
+
+    def __repr__(self) -> str:
+        terms = " + ".join(
+            f"({coeff:g})*{pauli}" for pauli, coeff in zip(self.paulis, self.coeffs)
+        )
+        return f"PauliSum({terms})"
+
+
+def _parity_sum(prod: np.ndarray, z_mask: int, n: int) -> np.ndarray:
+    """Sum of prod[b] * (-1)^popcount(b & z_mask) over b, per batch row."""
+    z_qubits = [q for q in range(n) if z_mask >> (n - 1 - q) & 1]
+    if not z_qubits:
+        return prod.sum(axis=1)
+    tensor = prod.reshape(prod.shape[0], *([2] * n))
+    other = tuple(q + 1 for q in range(n) if q not in z_qubits)
+    reduced = tensor.sum(axis=other).reshape(prod.shape[0], -1) if other else prod
+    signs = reduce(np.kron, [np.array([1, -1])] * len(z_qubits))
+    return reduced @ signs
+
+
+def _parity_signs(z_mask: int, n: int) -> np.ndarray:
+    """(-1)^popcount(b & z_mask) for every basis index b."""
+    factors = [
+        np.array([1, -1]) if z_mask >> (n - 1 - q) & 1 else np.ones(2, dtype=int)
+        for q in range(n)
+    ]
+    return reduce(np.kron, factors)
+
+
+def _walsh_hadamard(prod: np.ndarray, n: int) -> np.ndarray:
+    """Unnormalized Walsh-Hadamard transform over the last axis."""
+    result = prod.reshape(prod.shape[0], *([2] * n))
+    for axis in range(1, n + 1):
+        a0 = np.take(result, 0, axis=axis)
+        a1 = np.take(result, 1, axis=axis)
+        result = np.stack([a0 + a1, a0 - a1], axis=axis)
+    return result.reshape(prod.shape[0], -1)
+
+
+__all__ = ["PauliSum"]
@@ -0,0 +1,354 @@
+"""
+Out-of-core statevector simulation for quantIQ
+
+The statevector lives in an ``np.memmap`` file and is processed in
+chunks of 2^L contiguous amplitudes. The low-order L qubits are *local*:
+a gate that only touches them is applied to one chunk at a time. The
+remaining high-order qubits are *global* and select the chunk; a gate
+targeting global qubits gathers the 2^k chunks that differ in those k
+bits into one in-memory buffer, applies the ordinary kernel to it and
+writes the buffer back. Global control qubits just restrict which chunks
+are visited.
+
+The largest simulable circuit is therefore bounded by free disk space
+(the whole statevector) and a RAM budget (a few chunks), not by a fixed
+qubit count.
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .kernels import apply_gate, apply_matrix, apply_swap
+from .results import Result
+from .simulator import Seed, Simulator, sample_counts
+
+# Default RAM budget for chunk buffers, in bytes
+DEFAULT_RAM_BUDGET = 2**28
+
+# Chunks are sized so this many of them fit in the RAM budget, enough for
+# any gate with up to two global target qubits
+_CHUNKS_IN_BUDGET = 4
+
+
+class OutOfCoreSimulator(Simulator):
+    """
+    Statevector simulator that keeps the state in a memory-mapped file.
+
+    Attributes:
+        chunk_qubits: Number of local (low-order) qubits per chunk
+        ram_budget: Bytes of RAM available for chunk buffers
+        path: Location of the memory-mapped statevector file
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        precision: str = "double",
+        ram_budget: int = DEFAULT_RAM_BUDGET,
+        directory: Optional[str] = None,
+    ):
+        """
+        Initialize an out-of-core simulator.
+
+        Args:
+            num_qubits: Number of qubits to simulate
+            precision: 'double' (complex128) or 'single' (complex64)
+            ram_budget: Bytes of RAM to use for chunk buffers; gates with
+                more than two global target qubits need proportionally more
+            directory: Directory for the statevector file (defaults to the
+                system temporary directory)
+        """
+        self.ram_budget = ram_budget
+        self.directory = directory if directory is not None else tempfile.gettempdir()
+        super().__init__(num_qubits, precision=precision)
+
+    def _check_capacity(self) -> None:
+        """Raise if the statevector doesn't fit on disk or chunks in RAM."""
+        needed = self.num_states * self.dtype.itemsize
+        free = shutil.disk_usage(self.directory).free
+        if needed > free:
+            raise ValueError(
+                f"Cannot simulate {self.num_qubits} qubits: the statevector "
+                f"needs {needed // 2**20} MiB, {free // 2**20} MiB free in "
+                f"{self.directory}"
+            )
+
+        amplitudes = self.ram_budget // (_CHUNKS_IN_BUDGET * self.dtype.itemsize)
+        if amplitudes < 2:
+            raise ValueError(f"RAM budget of {self.ram_budget} bytes is too small")
+        self.chunk_qubits = min(self.num_qubits, amplitudes.bit_length() - 1)
+
+    @property
+    def global_qubits(self) -> int:
+        """Number of high-order qubits that select the chunk."""
+        return self.num_qubits - self.chunk_qubits
+
+    @property
+    def num_chunks(self) -> int:
+        """Number of chunks the statevector is split into."""
+        return 1 << self.global_qubits
+
+    def _initialize_statevector(self) -> np.ndarray:
+        """
+        Create the statevector file in the |00...0⟩ state.
+
+        Returns:
+            Memory-mapped statevector
+        """
+        fd, self.path = tempfile.mkstemp(suffix=".statevector", dir=self.directory)
+        os.close(fd)
+        # The file is removed once the simulator is garbage collected
+        weakref.finalize(self, _remove_file, self.path)
+        # A fresh memmap is a sparse, zero-filled file
+        statevector = np.memmap(
+            self.path, dtype=self.dtype, mode="w+", shape=(self.num_states,)
+        )
+        statevector[0] = 1.0
+        return statevector
+
+    def reset(self) -> None:
+        """Reset the statevector to |00...0⟩ state."""
+        for chunk in range(self.num_chunks):
+            self._chunk(chunk)[...] = 0
+        self.statevector[0] = 1.0
+
+    def _chunk(self, chunk: int) -> np.ndarray:
+        """View of one chunk of the memory-mapped statevector."""
+        size = 1 << self.chunk_qubits
+        return self.statevector[chunk * size : (chunk + 1) * size]
+
+    def _chunk_groups(
+        self, global_targets: Sequence[int], global_controls: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Chunk indices to process together, one group per row.
+
+        Each row holds the 2^k chunks that differ only in the k global
+        target bits, ordered so the first target is the most significant
+        bit; only chunks whose global control bits are all 1 appear.
+        """
+        position = {q: self.global_qubits - 1 - q for q in range(self.global_qubits)}
+        target_mask = sum(1 << position[q] for q in global_targets)
+        control_mask = sum(1 << position[q] for q in global_controls)
+
+        chunks = np.arange(self.num_chunks, dtype=np.int64)
+        base = chunks[
+            ((chunks & target_mask) == 0) & ((chunks & control_mask) == control_mask)
+        ]
+        k = len(global_targets)
+        offsets = np.zeros(1 << k, dtype=np.int64)
+        for i, qubit in enumerate(global_targets):
+            bit = (np.arange(1 << k) >> (k - 1 - i)) & 1
+            offsets |= bit << position[qubit]
+        return base[:, None] + offsets[None, :]
+
+    def _apply_chunked(
+        self,
+        targets: Sequence[int],
+        controls: Sequence[int],
+        kernel: Callable[[np.ndarray, Dict[int, int], List[int], int], None],
+    ) -> None:
+        """
+        Apply a gate chunk by chunk.
+
+        Args:
+            targets: Qubits the gate acts on
+            controls: Control qubits
+            kernel: Called as kernel(buffer, remap, controls, width) to
+                apply the gate to a buffer of width qubits, where remap
+                translates circuit qubits to buffer qubits and controls
+                are the local controls already translated
+        """
+        boundary = self.global_qubits
+        global_targets = sorted(q for q in targets if q < boundary)
+        global_controls = [q for q in controls if q < boundary]
+        k = len(global_targets)
+
+        # Buffer layout: global targets on top, then the chunk's local qubits
+        remap = {q: i for i, q in enumerate(global_targets)}
+        remap.update(
+            {q: k + q - boundary for q in (*targets, *controls) if q >= boundary}
+        )
+        local_controls = [remap[q] for q in controls if q >= boundary]
+        width = k + self.chunk_qubits
+
+        for group in self._chunk_groups(global_targets, global_controls).tolist():
+            if k == 0:
+                # Local gate: the chunk itself is updated in place
+                kernel(self._chunk(group[0]), remap, local_controls, width)
+                continue
+            buffer = np.concatenate([self._chunk(chunk) for chunk in group])
+            kernel(buffer, remap, local_controls, width)
+            for chunk, block in zip(group, np.split(buffer, len(group))):
+                self._chunk(chunk)[...] = block
+
+    def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
+        """
+        Apply a single-qubit gate to the statevector in place.
+
+        Args:
+            gate: 2x2 unitary matrix
+            target_qubit: Qubit index to apply gate to
+        """
+        if target_qubit < 0 or target_qubit >= self.num_qubits:
+            raise ValueError(f"Invalid qubit index: {target_qubit}")
+        self.apply_controlled_gate(gate, [], target_qubit)
+
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
+        """
+        Apply a single-qubit gate conditioned on one or more control qubits.
+
+        Args:
+            gate: 2x2 unitary matrix applied to the target
+            controls: Control qubit indices
+            target: Target qubit index
+        """
+        self._validate_qubits([*controls, target])
+        self._apply_chunked(
+            [target],
+            controls,
+            lambda buffer, remap, local, width: apply_gate(
+                buffer, gate, remap[target], width, local
+            ),
+        )
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """
+        Apply SWAP gate to the statevector.
+
+        Args:
+            qubit1: First qubit index
+            qubit2: Second qubit index
+        """
+        self._validate_qubits([qubit1, qubit2])
+        self._apply_chunked(
+            [qubit1, qubit2],
+            [],
+            lambda buffer, remap, local, width: apply_swap(
+                buffer, remap[qubit1], remap[qubit2], width
+            ),
+        )
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a k-qubit unitary to the statevector.
+
+        Args:
+            matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+            qubits: Qubit indices the matrix acts on
+        """
+        self._validate_qubits(qubits)
+        if np.shape(matrix) != (2 ** len(qubits), 2 ** len(qubits)):
+            raise ValueError(
+                f"Matrix shape {np.shape(matrix)} doesn't match {len(qubits)} qubits"
+            )
+        self._apply_chunked(
+            qubits,
+            [],
+            lambda buffer, remap, local, width: apply_matrix(
+                buffer, matrix, [remap[q] for q in qubits], width
+            ),
+        )
+
+    def iter_probabilities(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Stream the probability distribution chunk by chunk.
+
+        Yields:
+            Tuples of (index of the chunk's first basis state, probabilities)
+        """
+        for chunk in range(self.num_chunks):
+            yield chunk << self.chunk_qubits, np.abs(self._chunk(chunk)) ** 2
+
+    def get_probabilities(self) -> np.ndarray:
+        """
+        Get probability distribution from statevector.
+
+        This materializes all 2^n probabilities in RAM; prefer
+        iter_probabilities() for large states.
+
+        Returns:
+            Array of probabilities for each computational basis state
+        """
+        return np.concatenate([probs for _, probs in self.iter_probabilities()])
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
+        """
+        Measure all qubits in computational basis.
+
+        Shots are first split across chunks by a multinomial draw over the
+        chunk probabilities, then drawn within each chunk that received
+        any, which is equivalent to one multinomial over the whole state.
+
+        Args:
+            shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            Result object with measurement outcomes
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        rng = np.random.default_rng(seed)
+        masses = np.array(
+            [probs.sum(dtype=np.float64) for _, probs in self.iter_probabilities()]
+        )
+        chunk_shots = rng.multinomial(shots, masses / masses.sum())
+
+        outcomes: List[np.ndarray] = []
+        frequencies: List[np.ndarray] = []
+        for chunk in np.flatnonzero(chunk_shots).tolist():
+            probs = np.abs(self._chunk(chunk)) ** 2
+            found, counts = sample_counts(probs, int(chunk_shots[chunk]), rng)
+            outcomes.append(found + (chunk << self.chunk_qubits))
+            frequencies.append(counts)
+
+        return Result.from_arrays(
+            np.concatenate(outcomes),
+            np.concatenate(frequencies),
+            shots,
+            self.num_qubits,
+        )
+
+    def snapshot(self) -> np.ndarray:
+        """Not available: the memory-mapped statevector is updated in place."""
+        raise ValueError("outofcore backend has no snapshots; use get_statevector()")
+
+    def fork(self) -> Simulator:
+        """Not available: the memory-mapped statevector is updated in place."""
+        raise ValueError("outofcore backend can't be forked")
+
+    def get_statevector(self) -> np.ndarray:
+        """
+        Get current statevector.
+
+        Returns:
+            In-memory copy of the whole statevector
+        """
+        return np.array(self.statevector)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"OutOfCoreSimulator(num_qubits={self.num_qubits}, "
+            f"chunk_qubits={self.chunk_qubits})"
+        )
+
+
+def _remove_file(path: str) -> None:
+    """Delete a statevector file if it still exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = ["OutOfCoreSimulator"]
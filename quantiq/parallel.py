@@ -0,0 +1,138 @@
+"""
+Multi-core gate application for quantIQ
+
+The statevector is placed in ``multiprocessing.shared_memory`` and a
+persistent pool of worker processes attaches to it once. Each gate is
+split across workers by fixing a few *partition* qubits: every worker
+updates the slice of the state where those qubits take one combination
+of values. Partition qubits are chosen per gate as the highest-order
+qubits the gate does not touch, so the amplitude pairs (or 2^k-tuples)
+a gate mixes always lie in the same slice and workers never write to
+each other's amplitudes.
+"""
+
+import multiprocessing as mp
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .kernels import apply_gate, apply_matrix, apply_swap
+
+# Statevector attached to by each worker process
+_WORKER_STATE: Optional[np.ndarray] = None
+_WORKER_MEMORY: Optional[shared_memory.SharedMemory] = None
+
+# Gate operations a worker can run, by name
+_OPERATIONS: Dict[str, Callable[..., None]] = {
+    "gate": apply_gate,
+    "swap": apply_swap,
+    "matrix": apply_matrix,
+}
+
+
+def _attach(name: str, shape: Tuple[int, ...], dtype: str) -> None:
+    """Worker initializer: map the shared statevector into this process."""
+    global _WORKER_STATE, _WORKER_MEMORY
+    _WORKER_MEMORY = shared_memory.SharedMemory(name=name)
+    _WORKER_STATE = np.ndarray(shape, dtype=dtype, buffer=_WORKER_MEMORY.buf)
+
+
+def _run(task: Tuple[str, Tuple, Dict[str, Any]]) -> None:
+    """Worker entry point: apply one slice of a gate in place."""
+    operation, args, kwargs = task
+    _OPERATIONS[operation](_WORKER_STATE, *args, **kwargs)
+
+
+class WorkerPool:
+    """
+    A shared-memory statevector and the worker processes that update it.
+
+    Attributes:
+        workers: Number of worker processes
+        state: Statevector array backed by the shared memory block
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: np.dtype, workers: int):
+        """
+        Allocate the shared statevector and start the workers.
+
+        Args:
+            shape: Statevector shape
+            dtype: Statevector dtype
+            workers: Number of worker processes
+        """
+        self.workers = workers
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(shape)) * np.dtype(dtype).itemsize
+        )
+        self.state: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=self._memory.buf)
+        self._pool = mp.get_context().Pool(
+            workers,
+            initializer=_attach,
+            initargs=(self._memory.name, shape, np.dtype(dtype).str),
+        )
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._memory)
+
+    def partition(self, num_qubits: int, touched: Sequence[int]) -> List[int]:
+        """
+        Qubits to split a gate on.
+
+        Args:
+            num_qubits: Number of qubits in the statevector
+            touched: Qubits the gate acts on or is controlled by
+
+        Returns:
+            Highest-order untouched qubits, enough for one slice per worker
+        """
+        count = max(self.workers - 1, 0).bit_length()
+        free = [q for q in range(num_qubits) if q not in set(touched)]
+        return free[:count]
+
+    def apply(
+        self,
+        operation: str,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        num_qubits: int,
+        touched: Sequence[int],
+    ) -> None:
+        """
+        Apply a gate with every worker handling one slice of the state.
+
+        Args:
+            operation: 'gate', 'swap' or 'matrix'
+            args: Positional arguments after the state for the kernel
+            kwargs: Keyword arguments for the kernel
+            num_qubits: Number of qubits in the statevector
+            touched: Qubits the gate acts on or is controlled by
+        """
+        split = self.partition(num_qubits, touched)
+        tasks = []
+        for values in range(1 << len(split)):
+            fixed = {
+                qubit: (values >> (len(split) - 1 - i)) & 1
+                for i, qubit in enumerate(split)
+            }
+            tasks.append((operation, args, {**kwargs, "fixed": fixed}))
+        self._pool.map(_run, tasks, chunksize=1)
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        self._finalizer()
+
+
+def _release(pool, memory: shared_memory.SharedMemory) -> None:
+    """Shut down a pool and unlink its shared memory block."""
+    pool.terminate()
+    pool.join()
+    try:
+        memory.close()
+    except BufferError:
+        # Arrays still viewing the block keep the mapping alive
+        pass
+    memory.unlink()
+
+
+__all__ = ["WorkerPool"]
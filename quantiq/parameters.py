@@ -0,0 +1,99 @@
+"""
+Symbolic circuit parameters for quantIQ
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class Parameter:
+    """
+    A named placeholder for a gate angle, bound to values at run time.
+
+    Parameters compare by identity, so two Parameter("theta") objects are
+    different parameters; bindings may be keyed by either the Parameter
+    or its name.
+
+    Attributes:
+        name: Display name of the parameter
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize a parameter.
+
+        Args:
+            name: Display name of the parameter
+        """
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Parameter({self.name!r})"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+Bindings = Mapping[Union[Parameter, str], Any]
+
+
+def is_symbolic(params: Sequence) -> bool:
+    """Whether any operand in params is an unbound Parameter."""
+    return any(isinstance(param, Parameter) for param in params)
+
+
+def collect_parameters(gates: Sequence[Tuple]) -> List[Parameter]:
+    """
+    Unique Parameters used by a gate list, in order of first use.
+
+    Args:
+        gates: Gate tuples
+
+    Returns:
+        List of Parameter objects
+    """
+    seen: Dict[int, Parameter] = {}
+    for gate in gates:
+        for operand in gate[1:]:
+            if isinstance(operand, Parameter) and id(operand) not in seen:
+                seen[id(operand)] = operand
+    return list(seen.values())
+
+
+def resolve_bindings(
+    parameters: Sequence[Parameter], bindings: Bindings
+) -> Tuple[Dict[Parameter, np.ndarray], int]:
+    """
+    Match bindings to parameters and check the batch size.
+
+    Args:
+        parameters: Parameters that need a value
+        bindings: Mapping of Parameter or parameter name to a scalar or
+            a 1-D array of values, one per batch element
+
+    Returns:
+        Tuple of (values keyed by Parameter, batch size)
+    """
+    by_name = {param.name: param for param in parameters}
+    values: Dict[Parameter, np.ndarray] = {}
+    for key, value in bindings.items():
+        param = by_name.get(key) if isinstance(key, str) else key
+        if param is None or param not in parameters:
+            raise ValueError(f"Circuit has no parameter {key!r}")
+        values[param] = np.asarray(value, dtype=float)
+
+    missing = [param.name for param in parameters if param not in values]
+    if missing:
+        raise ValueError(f"No values bound for parameters: {missing}")
+
+    sizes = {array.shape[0] for array in values.values() if array.ndim == 1}
+    if any(array.ndim > 1 for array in values.values()) or len(sizes) > 1:
+        raise ValueError("Each parameter needs a scalar or 1-D array of equal length")
+    batch_size = sizes.pop() if sizes else 1
+    return {
+        param: np.broadcast_to(array, (batch_size,)) for param, array in values.items()
+    }, batch_size
+
+
+__all__ = ["Parameter", "collect_parameters", "is_symbolic", "resolve_bindings"]
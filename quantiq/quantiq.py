@@ -2,18 +2,72 @@
 Main QuantumCircuit class for quantIQ
 """
 
-from typing import List, Optional, Tuple
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from .gates import CX, H, X, Y, Z
-from .results import Result
-from .simulator import Simulator
+from .cache import DEFAULT_CHECKPOINT_BYTES, StatevectorCache, get_cache
+from .compiler import CompiledCircuit, compile_gates, get_gate_spec
+from .distributed import DistributedSimulator
+from .dynamic import MEASUREMENTS, is_dynamic, run_dynamic
+from .gradients import (
+    GRADIENT_METHODS,
+    Values,
+    adjoint_gradient,
+    parameter_shift_gradient,
+)
+from .mps import MPSSimulator
+from .noise import NoiseModel, noise_streams, run_trajectories
+from .observables import PauliSum
+from .outofcore import OutOfCoreSimulator
+from .parameters import Bindings, Parameter, collect_parameters, resolve_bindings
+from .results import Result, _outcome_dtype
+from .simulator import Seed, Simulator, sample_counts
+from .sparse import SparseSimulator
+from .stabilizer import StabilizerSimulator, is_clifford
+from .tensornetwork import (
+    DEFAULT_MAX_SIZE,
+    ContractionPlan,
+    build_plan,
+    parse_bitstrings,
+)
+from .transpiler import circuit_depth, fuse_gates, lightcone, transpile
 from .visualization import CircuitDrawer
 
+# Simulator classes selectable through the ``backend`` argument
+BACKENDS = {
+    "statevector": Simulator,
+    "outofcore": OutOfCoreSimulator,
+    "distributed": DistributedSimulator,
+    "stabilizer": StabilizerSimulator,
+    "mps": MPSSimulator,
+    "sparse": SparseSimulator,
+}
+
+# run() switches all-Clifford circuits of at least this many qubits to
+# the stabilizer backend when no backend is given
+STABILIZER_MIN_QUBITS = 16
+
+# Intermediate checkpoints lie this many gates before the end of the
+# circuit, then twice as many, and so on; closer ones would mostly split
+# fusion blocks
+CHECKPOINT_MIN_DISTANCE = 16
+
 
 class QuantumCircuit:
-    """A quantum circuit for building and simulating quantum algorithms."""
+    """
+    A quantum circuit for building and simulating quantum algorithms.
+
+    Attributes:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params) in order
+        conditions: Classical condition (qubit, value) of each gate index
+            made conditional with c_if()
+        checkpoints: Statevectors of simulated prefixes of the circuit,
+            keyed by prefix hash; statevector simulations resume from the
+            longest one still present
+    """
 
     def __init__(self, num_qubits: int):
         """
@@ -27,35 +81,44 @@ class QuantumCircuit:
 
         self.num_qubits = num_qubits
         self.gates: List[Tuple] = []
+        self.conditions: Dict[int, Tuple[int, int]] = {}
         self._simulator: Optional[Simulator] = None
         self._drawer = CircuitDrawer(num_qubits)
+        self._compiled: Dict[bool, CompiledCircuit] = {}
+        self._pruned: Optional[Tuple] = None
+        self._plans: Dict[int, ContractionPlan] = {}
+        self._chain: List[bytes] = [hashlib.sha256(f"{num_qubits};".encode()).digest()]
+        self.checkpoints = StatevectorCache(DEFAULT_CHECKPOINT_BYTES)
+        self._dynamic: Optional[bool] = None
 
     def h(self, qubit: int) -> "QuantumCircuit":
         """Apply Hadamard gate to qubit."""
         self._validate_qubit(qubit)
-        self.gates.append(("H", qubit))
-        self._drawer.add_gate("H", qubit)
+        self._append(("H", qubit))
         return self
 
     def x(self, qubit: int) -> "QuantumCircuit":
         """Apply Pauli-X (NOT) gate to qubit."""
         self._validate_qubit(qubit)
-        self.gates.append(("X", qubit))
-        self._drawer.add_gate("X", qubit)
+        self._append(("X", qubit))
         return self
 
     def y(self, qubit: int) -> "QuantumCircuit":
         """Apply Pauli-Y gate to qubit."""
         self._validate_qubit(qubit)
-        self.gates.append(("Y", qubit))
-        self._drawer.add_gate("Y", qubit)
+        self._append(("Y", qubit))
         return self
 
     def z(self, qubit: int) -> "QuantumCircuit":
         """Apply Pauli-Z gate to qubit."""
         self._validate_qubit(qubit)
-        self.gates.append(("Z", qubit))
-        self._drawer.add_gate("Z", qubit)
+        self._append(("Z", qubit))
+        return self
+
+    def s(self, qubit: int) -> "QuantumCircuit":
+        """Apply S (phase) gate to qubit."""
+        self._validate_qubit(qubit)
+        self._append(("S", qubit))
         return self
 
     def cx(self, control: int, target: int) -> "QuantumCircuit":
@@ -64,27 +127,453 @@ class QuantumCircuit:
         self._validate_qubit(target)
         if control == target:
             raise ValueError("Control and target qubits must be different")
-        self.gates.append(("CX", control, target))
-        self._drawer.add_gate("CX", control, target)
+        self._append(("CX", control, target))
+        return self
+
+    def cz(self, control: int, target: int) -> "QuantumCircuit":
+        """Apply controlled-Z gate."""
+        self._validate_distinct(control, target)
+        self._append(("CZ", control, target))
+        return self
+
+    def swap(self, qubit1: int, qubit2: int) -> "QuantumCircuit":
+        """Apply SWAP gate, exchanging the states of two qubits."""
+        self._validate_distinct(qubit1, qubit2)
+        self._append(("SWAP", qubit1, qubit2))
+        return self
+
+    def ccx(self, control1: int, control2: int, target: int) -> "QuantumCircuit":
+        """Apply Toffoli (controlled-controlled-X) gate."""
+        self._validate_distinct(control1, control2, target)
+        self._append(("CCX", control1, control2, target))
+        return self
+
+    def mcx(self, controls: Sequence[int], target: int) -> "QuantumCircuit":
+        """Apply X to target when every control qubit is 1."""
+        if not controls:
+            raise ValueError("At least one control qubit is required")
+        self._validate_distinct(*controls, target)
+        self._append(("MCX", *controls, target))
+        return self
+
+    def cu(self, gate: np.ndarray, control: int, target: int) -> "QuantumCircuit":
+        """Apply an arbitrary 2x2 unitary to target, controlled on control."""
+        gate = np.asarray(gate, dtype=complex)
+        if gate.shape != (2, 2):
+            raise ValueError("Controlled gate must be a 2x2 matrix")
+        self._validate_distinct(control, target)
+        self._append(("CU", control, target, gate))
+        return self
+
+    def rx(self, theta: Union[float, Parameter], qubit: int) -> "QuantumCircuit":
+        """Apply rotation by theta around the X-axis to qubit."""
+        self._validate_qubit(qubit)
+        self._append(("RX", qubit, theta))
+        return self
+
+    def ry(self, theta: Union[float, Parameter], qubit: int) -> "QuantumCircuit":
+        """Apply rotation by theta around the Y-axis to qubit."""
+        self._validate_qubit(qubit)
+        self._append(("RY", qubit, theta))
+        return self
+
+    def rz(self, theta: Union[float, Parameter], qubit: int) -> "QuantumCircuit":
+        """Apply rotation by theta around the Z-axis to qubit."""
+        self._validate_qubit(qubit)
+        self._append(("RZ", qubit, theta))
+        return self
+
+    def append(self, name: str, *operands) -> "QuantumCircuit":
+        """
+        Apply any registered gate, including custom ones.
+
+        Args:
+            name: Gate name passed to ``register_gate``
+            *operands: Qubit indices followed by the gate's parameters
+
+        Returns:
+            The circuit, for chaining
+        """
+        spec = get_gate_spec(name)
+        qubits, _ = spec.split((name, *operands))
+        if spec.num_qubits is not None and len(qubits) != spec.num_qubits:
+            raise ValueError(
+                f"Gate '{name}' acts on {spec.num_qubits} qubits, got {len(qubits)}"
+            )
+        self._validate_distinct(*qubits)
+        self._append((name, *operands))
         return self
 
     def measure_all(self) -> "QuantumCircuit":
         """Measure all qubits in the computational basis."""
-        self.gates.append(("MEASURE_ALL",))
-        self._drawer.add_gate("MEASURE_ALL")
+        self._append(("MEASURE_ALL",))
         return self
 
+    def measure(self, qubits: Union[int, Sequence[int]]) -> "QuantumCircuit":
+        """
+        Measure a subset of qubits in the computational basis.
+
+        Results hold one bit per measured qubit, in the order they were
+        first measured, with the qubit's latest outcome. A measurement
+        followed by gates on its qubit is taken mid-circuit (see
+        ``is_dynamic``); otherwise it is read out when the circuit
+        finishes and gates outside the measured qubits' lightcone are not
+        simulated.
+
+        Args:
+            qubits: Qubit index or indices to measure
+
+        Returns:
+            The circuit, for chaining
+        """
+        qubits = [qubits] if isinstance(qubits, int) else list(qubits)
+        if not qubits:
+            raise ValueError("No qubits to measure")
+        self._validate_distinct(*qubits)
+        self._append(("MEASURE", *qubits))
+        return self
+
+    def reset(self, qubit: int) -> "QuantumCircuit":
+        """
+        Return a qubit to |0⟩ mid-circuit.
+
+        The qubit is measured and flipped if it was 1; the outcome is not
+        recorded.
+
+        Args:
+            qubit: Qubit index
+
+        Returns:
+            The circuit, for chaining
+        """
+        self._validate_qubit(qubit)
+        self._append(("RESET", qubit))
+        return self
+
+    def c_if(self, qubit: int, value: int = 1) -> "QuantumCircuit":
+        """
+        Make the last gate conditional on a measurement result.
+
+        The gate only runs in shots where the latest measurement of
+        ``qubit`` gave ``value`` (0 before any measurement).
+
+        Args:
+            qubit: Qubit whose measured value is tested
+            value: Required value, 0 or 1
+
+        Returns:
+            The circuit, for chaining
+
+        Example:
+            circuit.h(0).measure(0).x(1).c_if(0, 1)
+        """
+        self._validate_qubit(qubit)
+        if value not in (0, 1):
+            raise ValueError(f"Condition value must be 0 or 1, got {value}")
+        if not self.gates or get_gate_spec(self.gates[-1][0]).kernel is None:
+            raise ValueError("c_if() must follow a gate")
+        index = len(self.gates) - 1
+        self.conditions[index] = (qubit, value)
+        # The last gate's hash and any compiled form are now stale
+        del self._chain[index + 1 :]
+        self._invalidate()
+        return self
+
+    @property
+    def is_dynamic(self) -> bool:
+        """
+        Whether the circuit measures mid-circuit, resets or uses c_if().
+
+        Dynamic circuits have no single final state: run() samples them
+        by shot branching (see ``dynamic``), and methods that need the
+        statevector raise.
+        """
+        if self._dynamic is None:
+            self._dynamic = is_dynamic(self.num_qubits, self.gates, self.conditions)
+        return self._dynamic
+
+    def _require_static(self) -> None:
+        """Raise for dynamic circuits, which have no single final state."""
+        if self.is_dynamic:
+            raise ValueError(
+                "Circuit has mid-circuit measurements, resets or conditions; "
+                "only run() supports it"
+            )
+
+    @property
+    def measured_qubits(self) -> List[int]:
+        """
+        Qubits read out by run(), in result bit order.
+
+        All qubits unless the circuit measures a subset with measure()
+        and never calls measure_all().
+        """
+        measured: Dict[int, None] = {}
+        for gate in self.gates:
+            if gate[0] == "MEASURE_ALL":
+                return list(range(self.num_qubits))
+            if gate[0] == "MEASURE":
+                measured.update(dict.fromkeys(gate[1:]))
+        return list(measured) if measured else list(range(self.num_qubits))
+
+    def _append(self, gate: Tuple) -> None:
+        """Record a gate tuple and invalidate the compiled program."""
+        self.gates.append(gate)
+        spec = get_gate_spec(gate[0])
+        qubits, _ = spec.split(gate)
+        self._drawer.add_gate(gate[0], *qubits)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop everything derived from the gate list."""
+        self._compiled.clear()
+        self._pruned = None
+        self._plans.clear()
+        self._dynamic = None
+
+    def truncate(self, num_gates: int) -> "QuantumCircuit":
+        """
+        Drop every gate after the first num_gates.
+
+        Checkpoints of the kept prefix stay valid, so editing the tail
+        and simulating again only replays the gates that changed.
+
+        Args:
+            num_gates: Number of gates to keep
+
+        Returns:
+            The circuit, for chaining
+        """
+        if not 0 <= num_gates <= len(self.gates):
+            raise ValueError(f"Cannot keep {num_gates} of {len(self.gates)} gates")
+        del self.gates[num_gates:]
+        del self._drawer.gates[num_gates:]
+        del self._chain[num_gates + 1 :]
+        for index in [i for i in self.conditions if i >= num_gates]:
+            del self.conditions[index]
+        self._invalidate()
+        return self
+
+    @property
+    def parameters(self) -> List[Parameter]:
+        """Unbound Parameters in the circuit, in order of first use."""
+        return collect_parameters(self.gates)
+
+    def bind(self, bindings: Bindings) -> "QuantumCircuit":
+        """
+        Substitute values for Parameters.
+
+        Args:
+            bindings: Mapping of Parameter (or its name) to a number;
+                parameters not mentioned stay symbolic
+
+        Returns:
+            New circuit with the bound values in place of the Parameters
+        """
+        parameters = self.parameters
+        by_name = {param.name: param for param in parameters}
+        values: Dict[Parameter, Any] = {}
+        for key, value in bindings.items():
+            param = by_name.get(key) if isinstance(key, str) else key
+            if param is None or param not in parameters:
+                raise ValueError(f"Circuit has no parameter {key!r}")
+            values[param] = value
+        bound = QuantumCircuit(self.num_qubits)
+        for index, gate in enumerate(self.gates):
+            bound._append(
+                tuple(
+                    (
+                        float(values[op])
+                        if isinstance(op, Parameter) and op in values
+                        else op
+                    )
+                    for op in gate
+                )
+            )
+            if index in self.conditions:
+                bound.c_if(*self.conditions[index])
+        return bound
+
+    def compile(self, fuse: bool = False) -> CompiledCircuit:
+        """
+        Lower the gate list to a compact instruction array.
+
+        The compiled program is cached on the circuit and rebuilt only
+        after a gate is appended.
+
+        Args:
+            fuse: Merge adjacent gates into larger unitaries first
+                (see ``transpiler.fuse_gates``)
+
+        Returns:
+            CompiledCircuit used by run() and get_statevector()
+        """
+        if fuse not in self._compiled:
+            self._require_static()
+            if fuse:
+                gates, stats = fuse_gates(self.num_qubits, self.gates)
+                program = compile_gates(self.num_qubits, gates, stats)
+            else:
+                program = compile_gates(self.num_qubits, self.gates)
+            self._compiled[fuse] = program
+        return self._compiled[fuse]
+
+    def content_hash(self) -> str:
+        """
+        Hash of the qubit count and the normalized gate list.
+
+        Operands are normalized before hashing (qubits as ints, numbers as
+        complex128, matrices by their complex128 bytes, Parameters by
+        name), so identical circuits built separately hash the same.
+        Measurement markers are left out as they don't change the final
+        state, except in dynamic circuits. Used as the key of the
+        statevector cache (see ``cache``).
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        chain = self._prefix_hashes()
+        if not self.is_dynamic:
+            return chain[-1].hex()
+        digest = hashlib.sha256(chain[-1])
+        for index, gate in enumerate(self.gates):
+            if gate[0] in MEASUREMENTS:
+                digest.update(f"{index}{[int(op) for op in gate[1:]]}".encode())
+        return digest.hexdigest()
+
+    def _prefix_hashes(self) -> List[bytes]:
+        """
+        Hash chain over the gate list.
+
+        Entry i hashes the qubit count and the first i gates, each entry
+        extending the previous one, so appending a gate costs one hash.
+
+        Returns:
+            len(gates) + 1 SHA-256 digests
+        """
+        for index in range(len(self._chain) - 1, len(self.gates)):
+            gate = self.gates[index]
+            previous = self._chain[-1]
+            if gate[0] in MEASUREMENTS:
+                self._chain.append(previous)
+                continue
+            qubits, params = get_gate_spec(gate[0]).split(gate)
+            digest = hashlib.sha256(previous)
+            digest.update(f"{gate[0]}{[int(q) for q in qubits]}".encode())
+            for param in params:
+                digest.update(_operand_bytes(param))
+            if index in self.conditions:
+                digest.update("if{}={}".format(*self.conditions[index]).encode())
+            self._chain.append(digest.digest())
+        return self._chain
+
+    def prune(self) -> Tuple["QuantumCircuit", List[int], Dict[str, int]]:
+        """
+        Restrict the circuit to the lightcone of its measured qubits.
+
+        The result is cached until a gate is appended. Each pruned
+        circuit shares this circuit's ``checkpoints``, so growing the
+        circuit resumes from the previous pruned simulation.
+
+        Returns:
+            Tuple of (circuit over the compacted register, original index
+            of each of its qubits, stats with pruned_gates and
+            pruned_qubits); see ``transpiler.lightcone``
+        """
+        if self._pruned is None:
+            self._require_static()
+            gates, register, stats = lightcone(
+                self.num_qubits, self.gates, self.measured_qubits
+            )
+            pruned = QuantumCircuit(len(register))
+            for gate in gates:
+                pruned._append(gate)
+            # Keys hash the pruned gates and register, so they can't
+            # collide with this circuit's own prefixes
+            pruned.checkpoints = self.checkpoints
+            self._pruned = (pruned, register, stats)
+        return self._pruned
+
+    def optimize(
+        self, passes: Sequence[str] = ("cancel", "merge_diagonal")
+    ) -> Tuple["QuantumCircuit", Dict[str, int]]:
+        """
+        Remove redundant gates with peephole passes.
+
+        Args:
+            passes: Pass names from ``transpiler.PASSES``
+
+        Returns:
+            Tuple of (optimized copy of the circuit, stats with gates
+            removed and depth before and after)
+        """
+        self._require_static()
+        return transpile(self, passes)
+
+    def depth(self) -> int:
+        """Number of gate layers in the circuit."""
+        return circuit_depth(self.num_qubits, self.gates)
+
     def _validate_qubit(self, qubit: int) -> None:
         """Validate qubit index."""
         if not 0 <= qubit < self.num_qubits:
             raise ValueError(f"Qubit index {qubit} out of range [0, {self.num_qubits})")
 
-    def run(self, shots: int = 1000) -> Result:
+    def _validate_distinct(self, *qubits: int) -> None:
+        """Validate qubit indices of a multi-qubit gate."""
+        for qubit in qubits:
+            self._validate_qubit(qubit)
+        if len(set(qubits)) != len(qubits):
+            raise ValueError("Control and target qubits must be different")
+
+    def run(
+        self,
+        shots: int = 1000,
+        fuse: bool = True,
+        seed: Seed = None,
+        precision: str = "double",
+        backend: Optional[str] = None,
+        backend_options: Optional[Dict[str, Any]] = None,
+        prune: bool = True,
+        cache: bool = True,
+        noise: Optional[NoiseModel] = None,
+    ) -> Result:
         """
         Simulate the circuit and return measurement results.
 
+        Only the measured qubits are reported (see ``measure``). Dynamic
+        circuits (see ``is_dynamic``) are sampled by shot branching on the
+        statevector backend, reporting the largest number of branches in
+        ``result.metadata``. For other circuits, with ``prune`` set, gates
+        outside their backward lightcone and qubits no remaining gate
+        touches are left out of the simulation; the numbers removed are
+        reported in ``result.metadata``.
+
         Args:
             shots: Number of times to run the circuit
+            fuse: Merge adjacent gates before simulating; the number of
+                gates fused away is reported in ``result.metadata``
+            seed: Seed or np.random.Generator for reproducible sampling
+            precision: 'double' or 'single' (complex64) statevector
+            backend: Simulator to use, a key of ``BACKENDS``; 'outofcore'
+                keeps the statevector in a memory-mapped file,
+                'distributed' shards it across rank processes,
+                'stabilizer' runs Clifford circuits on a tableau, 'mps'
+                uses a bond-limited matrix product state and 'sparse'
+                stores only the nonzero amplitudes. By
+                default, all-Clifford circuits of STABILIZER_MIN_QUBITS or
+                more qubits use 'stabilizer' and the rest 'statevector'
+            backend_options: Extra keyword arguments for the backend, e.g.
+                ``{"ram_budget": 2**30, "directory": "/scratch"}`` or
+                ``{"max_bond": 32, "cutoff": 1e-10}`` for 'mps'
+            prune: Simulate only the lightcone of the measured qubits
+            cache: Reuse and store the final statevector in the
+                process-wide cache and the circuit's prefix checkpoints
+                (statevector backend only); whether the final state was
+                cached is reported as ``result.metadata["cache_hit"]``
+            noise: Noise model; gate noise is sampled with batched
+                trajectories on the statevector backend (see ``noise``)
+                and readout error is applied to the measured bits
 
         Returns:
             Result object with measurement outcomes
@@ -92,57 +581,449 @@ class QuantumCircuit:
         if shots <= 0:
             raise ValueError("Number of shots must be positive")
 
-        # Initialize simulator
-        simulator = Simulator(self.num_qubits)
+        trajectory_seed = readout_seed = None
+        if noise is not None:
+            trajectory_seed, readout_seed = noise_streams(seed)
+        gate_noise = noise is not None and noise.has_gate_noise
+        if gate_noise and backend not in (None, "statevector"):
+            raise ValueError(f"Backend '{backend}' can't simulate gate noise")
 
-        # Apply gates
-        for gate in self.gates:
-            gate_type = gate[0]
-
-            if gate_type == "H":
-                simulator.apply_gate(H, gate[1])
-            elif gate_type == "X":
-                simulator.apply_gate(X, gate[1])
-            elif gate_type == "Y":
-                simulator.apply_gate(Y, gate[1])
-            elif gate_type == "Z":
-                simulator.apply_gate(Z, gate[1])
-            elif gate_type == "CX":
-                simulator.apply_cx(gate[1], gate[2])
-            elif gate_type == "MEASURE_ALL":
-                # Measurement is handled after all gates
-                pass
+        if self.is_dynamic:
+            if noise is not None:
+                raise ValueError("Noise models don't support dynamic circuits yet")
+            if backend not in (None, "statevector"):
+                raise ValueError(
+                    f"Backend '{backend}' can't run mid-circuit measurements"
+                )
+            result = run_dynamic(
+                self.num_qubits,
+                self.gates,
+                self.conditions,
+                self.measured_qubits,
+                shots,
+                seed,
+                fuse,
+                precision,
+                backend_options,
+            )
+            result.metadata["backend"] = "statevector"
+            return result
+
+        if prune:
+            circuit, register, stats = self.prune()
+            if not any(stats.values()):
+                # Nothing to prune; simulate this circuit and its checkpoints
+                circuit = self
+        else:
+            circuit, register, stats = self, list(range(self.num_qubits)), {}
+
+        if backend is None:
+            backend = "statevector"
+            if (
+                not gate_noise
+                and circuit.num_qubits >= STABILIZER_MIN_QUBITS
+                and is_clifford(circuit.gates)
+            ):
+                backend = "stabilizer"
+        if backend == "stabilizer":
+            # The tableau needs the named Clifford gates, not fused unitaries
+            fuse = False
+
+        hit = None
+        program_stats: Dict[str, int]
+        if gate_noise and noise is not None:
+            sampled = run_trajectories(
+                circuit.num_qubits,
+                circuit.gates,
+                noise,
+                shots,
+                trajectory_seed,
+                precision,
+            )
+            program_stats = {}
+        elif backend == "statevector":
+            if (
+                cache
+                and circuit is not self
+                and (self.content_hash(), precision, fuse) in get_cache()
+            ):
+                # A full final state, e.g. from get_statevector(), serves
+                # any readout
+                circuit, register, stats = self, list(range(self.num_qubits)), {}
+            statevector, program_stats, hit = circuit._final_state(
+                fuse, precision, backend_options, cache
+            )
+            rng = np.random.default_rng(seed)
+            outcomes, frequencies = sample_counts(np.abs(statevector) ** 2, shots, rng)
+            sampled = Result.from_arrays(
+                outcomes, frequencies, shots, circuit.num_qubits
+            )
+        else:
+            program = circuit.compile(fuse=fuse)
+            simulator = circuit._make_simulator(backend, precision, backend_options)
+            try:
+                program.run(simulator)
+                sampled = simulator.measure_all(shots, seed)
+            finally:
+                # Stops rank processes and worker pools right away
+                simulator.close()
+            program_stats = program.stats
 
         # Perform measurement
-        result = simulator.measure_all(shots)
+        result = _read_out(sampled, register, self.measured_qubits)
+        if noise is not None:
+            result = noise.apply_readout(result, readout_seed)
+        result.metadata.update(program_stats)
+        result.metadata.update(stats)
+        result.metadata["backend"] = backend
+        if hit is not None:
+            result.metadata["cache_hit"] = hit
 
         return result
 
-    def get_statevector(self) -> np.ndarray:
+    def _final_state(
+        self,
+        fuse: bool,
+        precision: str,
+        backend_options: Optional[Dict[str, Any]],
+        cache: bool,
+    ) -> Tuple[np.ndarray, Dict[str, int], bool]:
+        """
+        Final statevector, taken from or added to the statevector cache.
+
+        On a miss, simulation resumes from the longest prefix in
+        ``checkpoints``; the number of gates skipped is reported as
+        ``resumed_gates``. The final state and intermediate prefixes
+        (see ``_checkpoint_positions``) are checkpointed in turn.
+
+        Returns:
+            Tuple of (statevector, read-only when cached; compilation
+            stats; whether it came from the cache)
+        """
+        key = (self.content_hash(), precision, fuse)
+        if cache:
+            entry = get_cache().get(key)
+            if entry is not None:
+                return entry[0], entry[1], True
+
+        chain = self._prefix_hashes()
+        start, checkpoint = 0, None
+        if cache:
+            for length in range(len(chain) - 1, 0, -1):
+                if (chain[length], precision) in self.checkpoints:
+                    stored = self.checkpoints.get((chain[length], precision))
+                    if stored is not None:
+                        start, checkpoint = length, stored[0]
+                        break
+
+        simulator = self._make_simulator("statevector", precision, backend_options)
+        if checkpoint is not None:
+            # Shared until the first gate copies it (see Simulator.fork)
+            simulator.statevector = checkpoint
+        stops = [start]
+        if cache:
+            stops += self._checkpoint_positions(start, simulator.statevector.nbytes)
+        stops.append(len(self.gates))
+
+        if stops == [0, len(self.gates)]:
+            program = self.compile(fuse=fuse)
+            program.run(simulator)
+            stats = dict(program.stats)
+        else:
+            stats = {}
+            for begin, end in zip(stops, stops[1:]):
+                if begin > start:
+                    self.checkpoints.put(
+                        (chain[begin], precision), simulator.snapshot()
+                    )
+                gates = self.gates[begin:end]
+                if fuse:
+                    gates, segment_stats = fuse_gates(self.num_qubits, gates)
+                    program = compile_gates(self.num_qubits, gates, segment_stats)
+                else:
+                    program = compile_gates(self.num_qubits, gates)
+                program.run(simulator)
+                for name, value in program.stats.items():
+                    stats[name] = stats.get(name, 0) + value
+            if start:
+                stats["resumed_gates"] = start
+        # Moves the state out of shared memory if workers were used
+        simulator.close()
+        if cache:
+            self.checkpoints.put((chain[-1], precision), simulator.statevector)
+            get_cache().put(key, simulator.statevector, stats)
+        return simulator.statevector, stats, False
+
+    def _checkpoint_positions(self, start: int, state_bytes: int) -> List[int]:
+        """
+        Prefix lengths to checkpoint while simulating from ``start``.
+
+        They lie d, 2d, 4d, ... gates before the end, where d is
+        ``CHECKPOINT_MIN_DISTANCE``, so truncating the last m gates later
+        replays fewer than max(2m, d) of the kept ones. Only
+        as many as fit in ``checkpoints`` beside the final state are
+        taken, nearest the end first.
+
+        Args:
+            start: Prefix length the simulation resumes from
+            state_bytes: Size of one statevector
+
+        Returns:
+            Increasing prefix lengths strictly between start and the end
+        """
+        end = len(self.gates)
+        slots = self.checkpoints.max_bytes // state_bytes - 1
+        positions: List[int] = []
+        distance = CHECKPOINT_MIN_DISTANCE
+        while end - distance > start and len(positions) < slots:
+            positions.append(end - distance)
+            distance *= 2
+        return positions[::-1]
+
+    def get_statevector(
+        self,
+        fuse: bool = True,
+        precision: str = "double",
+        backend: str = "statevector",
+        backend_options: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
+    ) -> np.ndarray:
         """
         Get the statevector after applying all gates (no measurement).
 
+        Args:
+            fuse: Merge adjacent gates before simulating
+            precision: 'double' (complex128) or 'single' (complex64)
+            backend: Simulator to use, a key of ``BACKENDS``
+            backend_options: Extra keyword arguments for the backend
+            cache: Reuse and store the result in the process-wide
+                statevector cache and the circuit's prefix checkpoints
+                (statevector backend only)
+
         Returns:
             Complex numpy array representing the statevector
         """
-        simulator = Simulator(self.num_qubits)
+        self._require_static()
+        if backend == "statevector":
+            statevector, _, _ = self._final_state(
+                fuse, precision, backend_options, cache
+            )
+            return statevector.copy()
 
-        # Apply gates (excluding measurements)
-        for gate in self.gates:
-            gate_type = gate[0]
+        if backend == "stabilizer":
+            # The tableau needs the named Clifford gates, not fused unitaries
+            fuse = False
+        simulator = self._make_simulator(backend, precision, backend_options)
+        try:
+            self.compile(fuse=fuse).run(simulator)
+            return simulator.get_statevector()
+        finally:
+            simulator.close()
+
+    def amplitude(self, bitstring: str, max_size: int = DEFAULT_MAX_SIZE) -> complex:
+        """
+        Single amplitude <bitstring|psi> by tensor-network contraction.
+
+        Args:
+            bitstring: Basis state, qubit 0 first (e.g. '0101')
+            max_size: Largest intermediate tensor, in elements; indices
+                are sliced to stay within it
+
+        Returns:
+            Complex amplitude
+        """
+        return complex(self.amplitudes([bitstring], max_size)[0])
+
+    def amplitudes(
+        self, bitstrings: Sequence[str], max_size: int = DEFAULT_MAX_SIZE
+    ) -> np.ndarray:
+        """
+        Amplitudes of several basis states without building the statevector.
 
-            if gate_type == "H":
-                simulator.apply_gate(H, gate[1])
-            elif gate_type == "X":
-                simulator.apply_gate(X, gate[1])
-            elif gate_type == "Y":
-                simulator.apply_gate(Y, gate[1])
-            elif gate_type == "Z":
-                simulator.apply_gate(Z, gate[1])
-            elif gate_type == "CX":
-                simulator.apply_cx(gate[1], gate[2])
+        The circuit is contracted as a tensor network along a greedy path
+        that is planned once and cached until a gate is appended, so later
+        queries skip the path search (see ``tensornetwork``).
 
-        return simulator.get_statevector()
+        Args:
+            bitstrings: Basis states, qubit 0 first
+            max_size: Largest intermediate tensor, in elements
+
+        Returns:
+            Complex array with one amplitude per bitstring
+        """
+        bits = parse_bitstrings(bitstrings, self.num_qubits)
+        return self.contraction_plan(max_size).amplitudes(bits)
+
+    def contraction_plan(self, max_size: int = DEFAULT_MAX_SIZE) -> ContractionPlan:
+        """
+        Cached tensor-network contraction plan of the circuit.
+
+        Args:
+            max_size: Largest intermediate tensor, in elements
+
+        Returns:
+            ContractionPlan, rebuilt only after a gate is appended
+        """
+        if max_size not in self._plans:
+            self._require_static()
+            self._plans[max_size] = build_plan(self.num_qubits, self.gates, max_size)
+        return self._plans[max_size]
+
+    def expectation(
+        self,
+        observable: Union[PauliSum, str],
+        bindings: Optional[Bindings] = None,
+        fuse: bool = True,
+        precision: str = "double",
+    ) -> Union[float, complex, np.ndarray]:
+        """
+        Exact expectation value of an observable after the circuit.
+
+        Args:
+            observable: PauliSum, or a single Pauli string such as 'ZZI'
+            bindings: Optional parameter bindings; with 1-D arrays of
+                values the result has one entry per batch element
+            fuse: Merge adjacent gates before simulating
+            precision: 'double' (complex128) or 'single' (complex64)
+
+        Returns:
+            <psi|H|psi>, or an array of values for batched bindings
+        """
+        if bindings is None:
+            simulator = Simulator(self.num_qubits, precision=precision)
+            self.compile(fuse=fuse).run(simulator)
+        else:
+            simulator = self._simulate_batch(bindings, fuse, precision)
+        return simulator.expectation(observable)
+
+    def gradient(
+        self,
+        observable: Union[PauliSum, str],
+        bindings: Bindings,
+        method: str = "adjoint",
+        precision: str = "double",
+    ) -> np.ndarray:
+        """
+        Gradient of an exact expectation value with respect to Parameters.
+
+        Parameters may appear only as rx, ry or rz angles; a Parameter
+        used by several gates gets the sum of their contributions.
+
+        Args:
+            observable: PauliSum with real coefficients, or a single Pauli
+                string such as 'ZZI'
+            bindings: Value of every Parameter; with 1-D arrays of values
+                the result has one row per batch element
+            method: 'adjoint' (about three simulations in total) or
+                'parameter_shift' (two per parameter occurrence, for
+                verification; see ``gradients``)
+            precision: 'double' (complex128) or 'single' (complex64)
+
+        Returns:
+            Derivatives in the order of ``parameters``, or an array of
+            shape (batch, num_parameters) for batched bindings
+        """
+        self._require_static()
+        if method not in GRADIENT_METHODS:
+            raise ValueError(
+                f"Unknown gradient method '{method}', "
+                f"expected one of {list(GRADIENT_METHODS)}"
+            )
+        arrays, rows = resolve_bindings(self.parameters, bindings)
+        values: Values = arrays
+        batch_size: Optional[int] = rows
+        if not any(np.ndim(value) for value in bindings.values()):
+            values = {param: float(value[0]) for param, value in arrays.items()}
+            batch_size = None
+        differentiate = (
+            adjoint_gradient if method == "adjoint" else parameter_shift_gradient
+        )
+        return differentiate(
+            self.num_qubits, self.gates, observable, values, batch_size, precision
+        )
+
+    def _make_simulator(
+        self,
+        backend: str,
+        precision: str,
+        backend_options: Optional[Dict[str, Any]] = None,
+    ) -> Simulator:
+        """Construct the simulator for a backend name."""
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}', expected one of {list(BACKENDS)}"
+            )
+        return BACKENDS[backend](
+            self.num_qubits, precision=precision, **(backend_options or {})
+        )
+
+    def get_statevectors(
+        self, bindings: Bindings, fuse: bool = True, precision: str = "double"
+    ) -> np.ndarray:
+        """
+        Simulate every parameter binding at once.
+
+        All bindings are evolved together as one (batch, 2**n) tensor, with
+        the rotation matrices for the whole batch built in one vectorized
+        call per gate.
+
+        Args:
+            bindings: Mapping of Parameter (or its name) to a 1-D array of
+                values, one per batch element; scalars apply to all
+            fuse: Merge adjacent fixed gates before simulating
+            precision: 'double' (complex128) or 'single' (complex64)
+
+        Returns:
+            Complex array of shape (batch, 2**num_qubits)
+        """
+        return self._simulate_batch(bindings, fuse, precision).get_statevector()
+
+    def run_batch(
+        self,
+        bindings: Bindings,
+        shots: int = 1000,
+        fuse: bool = True,
+        seed: Seed = None,
+        precision: str = "double",
+    ) -> List[Result]:
+        """
+        Simulate and measure every parameter binding at once.
+
+        Args:
+            bindings: Mapping of Parameter (or its name) to a 1-D array of
+                values, one per batch element; scalars apply to all
+            shots: Number of shots per binding
+            fuse: Merge adjacent fixed gates before simulating
+            seed: Seed or np.random.Generator for reproducible sampling
+            precision: 'double' (complex128) or 'single' (complex64)
+
+        Returns:
+            One Result per binding, in batch order
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        simulator = self._simulate_batch(bindings, fuse, precision)
+        register = list(range(self.num_qubits))
+        results = [
+            _read_out(result, register, self.measured_qubits)
+            for result in simulator.measure_batch(shots, seed)
+        ]
+        for result in results:
+            result.metadata.update(self.compile(fuse=fuse).stats)
+        return results
+
+    def _simulate_batch(
+        self, bindings: Bindings, fuse: bool, precision: str = "double"
+    ) -> Simulator:
+        """Run the compiled program over a batch of parameter bindings."""
+        program = self.compile(fuse=fuse)
+        values, batch_size = resolve_bindings(program.parameters, bindings)
+        simulator = Simulator(
+            self.num_qubits, batch_size=batch_size, precision=precision
+        )
+        program.run(simulator, values)
+        return simulator
 
     def draw(self) -> str:
         """
@@ -160,4 +1041,44 @@ class QuantumCircuit:
         return self.draw()
 
 
+def _operand_bytes(operand: Any) -> bytes:
+    """Canonical bytes of a gate parameter for content hashing."""
+    if isinstance(operand, Parameter):
+        return b"P" + operand.name.encode()
+    array = np.asarray(operand, dtype=np.complex128)
+    return b"A" + str(array.shape).encode() + array.tobytes()
+
+
+def _read_out(result: Result, register: List[int], measured: List[int]) -> Result:
+    """
+    Outcomes of the measured qubits from a run over a compacted register.
+
+    Args:
+        result: Result over the simulated qubits
+        register: Circuit qubit held by each simulated qubit
+        measured: Circuit qubits to report, in bit order
+
+    Returns:
+        Result over the measured qubits
+    """
+    if register == measured:
+        return result
+    position = {q: i for i, q in enumerate(register)}
+    simulated = [q for q in measured if q in position]
+    reduced = result.marginal([position[q] for q in simulated])
+    if len(simulated) == len(measured):
+        return reduced
+
+    # Measured qubits that were never simulated always read 0
+    width = len(measured)
+    dtype = _outcome_dtype(width)
+    outcomes = np.zeros(len(reduced.outcomes), dtype=dtype)
+    for i, qubit in enumerate(simulated):
+        bit = (reduced.outcomes >> (len(simulated) - 1 - i)) & 1
+        outcomes |= bit.astype(dtype) << (width - 1 - measured.index(qubit))
+    return Result.from_arrays(
+        outcomes, reduced.frequencies, result.shots, width, result.metadata
+    )
+
+
 __all__ = ["QuantumCircuit"]
@@ -2,57 +2,239 @@
 Quantum circuit execution results
 """
 
-from collections import Counter
-from typing import Dict, List, Tuple
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Registers wider than this keep outcome indices as Python ints
+_MAX_INT64_QUBITS = 63
+
+
+def _outcome_dtype(num_qubits: int) -> Any:
+    """Array dtype able to hold basis-state indices of num_qubits qubits."""
+    return np.int64 if num_qubits <= _MAX_INT64_QUBITS else object
+
+
+_object_popcount = np.frompyfunc(int.bit_count, 1, 1)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits in each integer of values."""
+    if values.dtype == object:
+        return _object_popcount(values).astype(np.int64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    # SWAR popcount for NumPy < 2.0
+    v = values.astype(np.uint64)
+    v = v - ((v >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    v = (v & np.uint64(0x3333333333333333)) + (
+        (v >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    v = (v + (v >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((v * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def _packed_to_indices(packed: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Basis-state indices of bit rows packed by np.packbits."""
+    pad = 8 * packed.shape[1] - num_qubits
+    if num_qubits <= _MAX_INT64_QUBITS:
+        wide = np.zeros((len(packed), 8), dtype=np.uint8)
+        wide[:, 8 - packed.shape[1] :] = packed
+        return (wide.view(">u8").ravel() >> np.uint64(pad)).astype(np.int64)
+    return np.array(
+        [int.from_bytes(row.tobytes(), "big") >> pad for row in packed], dtype=object
+    )
+
+
+def _bitstrings(outcomes: np.ndarray, num_qubits: int) -> List[str]:
+    """Format outcome indices as bitstrings, qubit 0 first."""
+    if outcomes.dtype == object or len(outcomes) == 0:
+        return [format(int(outcome), f"0{num_qubits}b") for outcome in outcomes]
+    shifts = np.arange(num_qubits - 1, -1, -1, dtype=np.int64)
+    bits = ((outcomes[:, None] >> shifts) & 1).astype(np.uint8) + ord("0")
+    return bits.view(f"S{num_qubits}").ravel().astype(str).tolist()
+
+
+class OutcomeView(Mapping):
+    """
+    Read-only dictionary view of per-outcome values keyed by bitstring.
+
+    Backed by the Result's arrays; bitstrings are only formatted when the
+    view is iterated, and lookups are binary searches.
+    """
+
+    def __init__(self, outcomes: np.ndarray, values: np.ndarray, num_qubits: int):
+        self._outcomes = outcomes
+        self._values = values
+        self._num_qubits = num_qubits
+
+    def _index(self, bitstring: Any) -> int:
+        """Position of bitstring in the outcome array, or -1."""
+        if not isinstance(bitstring, str) or len(bitstring) != self._num_qubits:
+            return -1
+        try:
+            outcome = int(bitstring, 2)
+        except ValueError:
+            return -1
+        position = int(np.searchsorted(self._outcomes, outcome))
+        if position < len(self._outcomes) and self._outcomes[position] == outcome:
+            return position
+        return -1
+
+    def __getitem__(self, bitstring: str) -> Any:
+        position = self._index(bitstring)
+        if position < 0:
+            raise KeyError(bitstring)
+        return self._values[position].item()
+
+    def __contains__(self, bitstring: object) -> bool:
+        return self._index(bitstring) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_bitstrings(self._outcomes, self._num_qubits))
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    def items(self):  # type: ignore[override]
+        return dict(
+            zip(_bitstrings(self._outcomes, self._num_qubits), self._values.tolist())
+        ).items()
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
 
 
 class Result:
     """
     Stores and analyzes quantum circuit execution results.
 
+    Outcomes are held as parallel NumPy arrays of basis-state indices
+    (qubit 0 is the most significant bit) and their counts; ``counts``
+    and ``probabilities()`` are dictionary views built on demand.
+
     Attributes:
-        counts: Dictionary mapping measurement outcomes to counts
+        counts: Mapping of measurement outcomes to counts
         shots: Total number of circuit executions
         num_qubits: Number of qubits measured
+        outcomes: Sorted array of observed basis-state indices
+        frequencies: Count of each entry in outcomes
+        metadata: Execution details such as optimization statistics
     """
 
-    def __init__(self, counts: Dict[str, int], shots: int, num_qubits: int):
+    def __init__(
+        self,
+        counts: Optional[Dict[str, int]],
+        shots: int,
+        num_qubits: int,
+        metadata: Optional[Dict[str, Any]] = None,
+        *,
+        outcomes: Optional[np.ndarray] = None,
+        frequencies: Optional[np.ndarray] = None,
+    ):
         """
         Initialize a Result object.
 
         Args:
-            counts: Dictionary of measurement outcomes and their counts
+            counts: Dictionary of measurement outcomes and their counts,
+                or None when outcomes and frequencies are given
             shots: Total number of shots executed
             num_qubits: Number of qubits in the circuit
+            metadata: Optional execution details (e.g. fused gate counts)
+            outcomes: Basis-state indices that were observed
+            frequencies: Count of each outcome
         """
-        self.counts = counts
         self.shots = shots
         self.num_qubits = num_qubits
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+
+        dtype = _outcome_dtype(num_qubits)
+        if counts is not None:
+            for bitstring in counts:
+                if len(bitstring) != num_qubits:
+                    raise ValueError(
+                        f"Bitstring '{bitstring}' length doesn't match num_qubits ({num_qubits})"
+                    )
+            outcomes = np.array([int(b, 2) for b in counts], dtype=dtype)
+            frequencies = np.fromiter(
+                counts.values(), dtype=np.int64, count=len(counts)
+            )
+        elif outcomes is None or frequencies is None:
+            raise ValueError("Either counts or outcomes and frequencies are required")
+
+        outcomes = np.asarray(outcomes, dtype=dtype)
+        frequencies = np.asarray(frequencies, dtype=np.int64)
+        order = np.argsort(outcomes, kind="stable")
+        self.outcomes = outcomes[order]
+        self.frequencies = frequencies[order]
         self._validate()
 
+    @classmethod
+    def from_arrays(
+        cls,
+        outcomes: np.ndarray,
+        frequencies: np.ndarray,
+        shots: int,
+        num_qubits: int,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "Result":
+        """
+        Build a Result straight from outcome indices and their counts.
+
+        Args:
+            outcomes: Distinct basis-state indices that were observed
+            frequencies: Count of each outcome
+            shots: Total number of shots executed
+            num_qubits: Number of qubits measured
+            metadata: Optional execution details
+
+        Returns:
+            Result object
+        """
+        return cls(
+            None,
+            shots,
+            num_qubits,
+            metadata,
+            outcomes=outcomes,
+            frequencies=frequencies,
+        )
+
     def _validate(self) -> None:
         """Validate result data."""
-        total_counts = sum(self.counts.values())
+        if self.outcomes.shape != self.frequencies.shape:
+            raise ValueError("Outcomes and frequencies must have the same length")
+
+        total_counts = int(self.frequencies.sum())
         if total_counts != self.shots:
             raise ValueError(
                 f"Sum of counts ({total_counts}) doesn't match shots ({self.shots})"
             )
 
-        # Validate bitstring lengths
-        for bitstring in self.counts.keys():
-            if len(bitstring) != self.num_qubits:
-                raise ValueError(
-                    f"Bitstring '{bitstring}' length doesn't match num_qubits ({self.num_qubits})"
-                )
+        # Validate outcome range (the bitstring length for dict input)
+        if len(self.outcomes) and (
+            self.outcomes[0] < 0 or self.outcomes[-1] >= 2**self.num_qubits
+        ):
+            raise ValueError(
+                f"Outcome index out of range for num_qubits ({self.num_qubits})"
+            )
 
-    def probabilities(self) -> Dict[str, float]:
+    @property
+    def counts(self) -> OutcomeView:
+        """Mapping of bitstring outcomes to counts."""
+        return OutcomeView(self.outcomes, self.frequencies, self.num_qubits)
+
+    def probabilities(self) -> OutcomeView:
         """
         Calculate probability distribution from counts.
 
         Returns:
-            Dictionary mapping outcomes to probabilities
+            Mapping of outcomes to probabilities
         """
-        return {outcome: count / self.shots for outcome, count in self.counts.items()}
+        return OutcomeView(
+            self.outcomes, self.frequencies / self.shots, self.num_qubits
+        )
 
     def most_common(self, n: int = 5) -> List[Tuple[str, int]]:
         """
@@ -64,8 +246,14 @@ class Result:
         Returns:
             List of (outcome, count) tuples sorted by count
         """
-        counter = Counter(self.counts)
-        return counter.most_common(n)
+        n = min(n, len(self.outcomes))
+        if n <= 0:
+            return []
+        top = np.argpartition(-self.frequencies, n - 1)[:n]
+        # Sort the top n by count, breaking ties by outcome index
+        top = top[np.lexsort((top, -self.frequencies[top]))]
+        bitstrings = _bitstrings(self.outcomes[top], self.num_qubits)
+        return list(zip(bitstrings, self.frequencies[top].tolist()))
 
     def get_counts(self, outcome: str) -> int:
         """
@@ -79,28 +267,89 @@ class Result:
         """
         return self.counts.get(outcome, 0)
 
+    def _mask(self, qubits: Sequence[int]) -> int:
+        """Integer with the bits of the given qubits set."""
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Qubits must be different, got {list(qubits)}")
+        mask = 0
+        for qubit in qubits:
+            if not 0 <= qubit < self.num_qubits:
+                raise ValueError(
+                    f"Qubit index {qubit} out of range [0, {self.num_qubits})"
+                )
+            mask |= 1 << (self.num_qubits - 1 - qubit)
+        return mask
+
+    def marginal(self, qubits: Sequence[int]) -> "Result":
+        """
+        Marginal distribution over a subset of qubits.
+
+        Args:
+            qubits: Qubits to keep, in the bit order of the new outcomes
+
+        Returns:
+            Result over len(qubits) qubits with the same number of shots
+        """
+        self._mask(qubits)
+        width = len(qubits)
+        dtype = _outcome_dtype(width)
+        reduced = np.zeros(len(self.outcomes), dtype=dtype)
+        for position, qubit in enumerate(qubits):
+            bit = (self.outcomes >> (self.num_qubits - 1 - qubit)) & 1
+            reduced |= bit.astype(dtype) << (width - 1 - position)
+
+        outcomes, inverse = np.unique(reduced, return_inverse=True)
+        frequencies = np.zeros(len(outcomes), dtype=np.int64)
+        np.add.at(frequencies, inverse.ravel(), self.frequencies)
+        return Result.from_arrays(
+            outcomes, frequencies, self.shots, width, self.metadata
+        )
+
     def expectation_value(self, observable: str = "Z") -> float:
         """
         Calculate expectation value for a given observable.
 
         Args:
-            observable: Observable to measure ('Z' for computational basis)
+            observable: 'Z' for the parity of the whole register, or a
+                string of 'I' and 'Z' with one character per qubit
+                (e.g. 'ZIZI' for <Z0 Z2>)
 
         Returns:
             Expectation value
         """
-        if observable != "Z":
-            raise NotImplementedError("Only Z observable supported currently")
+        if observable == "Z":
+            qubits = list(range(self.num_qubits))
+        else:
+            if len(observable) != self.num_qubits:
+                raise ValueError(
+                    f"Observable '{observable}' length doesn't match "
+                    f"num_qubits ({self.num_qubits})"
+                )
+            if set(observable) - {"I", "Z"}:
+                raise NotImplementedError(
+                    "Only I and Z observables can be estimated from counts"
+                )
+            qubits = [q for q, pauli in enumerate(observable) if pauli == "Z"]
+        return float(self.correlators([qubits])[0])
+
+    def correlators(self, subsets: Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        Z-parity correlators <Z_a Z_b ...> for many qubit subsets at once.
 
-        expectation = 0.0
-        for outcome, count in self.counts.items():
-            # Count number of 1s in outcome
-            parity = sum(int(bit) for bit in outcome) % 2
-            # (-1)^parity gives +1 for even, -1 for odd
-            sign = 1 if parity == 0 else -1
-            expectation += sign * (count / self.shots)
+        Args:
+            subsets: Qubit subsets, e.g. [(0, 3), (1, 2), (0, 1, 2)]
 
-        return expectation
+        Returns:
+            Array with one expectation value per subset
+        """
+        dtype = _outcome_dtype(self.num_qubits)
+        masks = np.array([self._mask(subset) for subset in subsets], dtype=dtype)
+        if len(masks) == 0:
+            return np.zeros(0)
+        # (-1)^parity gives +1 for even, -1 for odd
+        parity = _popcount(self.outcomes[None, :] & masks[:, None]) & 1
+        signs = 1 - 2 * parity
+        return (signs @ self.frequencies) / self.shots
 
     def to_dict(self) -> Dict:
         """
@@ -109,11 +358,15 @@ class Result:
         Returns:
             Dictionary representation of the result
         """
+        bitstrings = _bitstrings(self.outcomes, self.num_qubits)
         return {
-            "counts": self.counts,
+            "counts": dict(zip(bitstrings, self.frequencies.tolist())),
             "shots": self.shots,
             "num_qubits": self.num_qubits,
-            "probabilities": self.probabilities(),
+            "probabilities": dict(
+                zip(bitstrings, (self.frequencies / self.shots).tolist())
+            ),
+            "metadata": self.metadata,
         }
 
     def __repr__(self) -> str:
@@ -135,10 +388,10 @@ class Result:
             bar = "█" * bar_length
             lines.append(f"|{outcome}⟩: {count:4d} ({prob:6.2%}) {bar}")
 
-        if len(self.counts) > 10:
-            lines.append(f"... and {len(self.counts) - 10} more outcomes")
+        if len(self.outcomes) > 10:
+            lines.append(f"... and {len(self.outcomes) - 10} more outcomes")
 
         return "\n".join(lines)
 
 
-__all__ = ["Result"]
+__all__ = ["OutcomeView", "Result"]
@@ -2,41 +2,132 @@
 Quantum circuit simulator using statevector representation
 """
 
-from typing import Dict, List, Tuple
+import copy
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from .gates import CX, H, X, Y, Z
+from .gates import X, Z
+from .kernels import apply_gate, apply_matrix, apply_swap
+from .observables import PauliSum
+from .parallel import WorkerPool
 from .results import Result
 
+Seed = Union[None, int, np.random.Generator]
+
+# Statevector dtype for each supported precision
+PRECISIONS = {"single": np.complex64, "double": np.complex128}
+
+# Largest statevector allowed, in bytes (2^25 double-precision amplitudes)
+MAX_STATEVECTOR_BYTES = 2**25 * 16
+
+# Below this size gates run in the calling process even with workers, as
+# dispatch would cost more than the gate
+PARALLEL_MIN_QUBITS = 16
+
+# In-process kernels for the operations a worker pool can run
+_KERNELS: Dict[str, Callable[..., None]] = {
+    "gate": apply_gate,
+    "swap": apply_swap,
+    "matrix": apply_matrix,
+}
+
+
+def sample_counts(
+    probabilities: np.ndarray, shots: int, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw measurement counts directly from a probability vector.
+
+    Args:
+        probabilities: Outcome probabilities (normalized here)
+        shots: Number of shots
+        rng: Random generator
+
+    Returns:
+        Tuple of (outcome indices that occurred, their counts)
+    """
+    # Normalize (in case of numerical errors); multinomial works in
+    # float64, so single-precision probabilities are widened only here
+    probabilities = probabilities.astype(np.float64)
+    probabilities /= probabilities.sum()
+    counts = rng.multinomial(shots, probabilities)
+    outcomes = np.flatnonzero(counts)
+    return outcomes, counts[outcomes]
+
 
 class Simulator:
     """
     Statevector-based quantum circuit simulator.
 
     Simulates quantum circuits by maintaining and evolving the full
-    statevector representation.
+    statevector representation. With ``batch_size`` set, a stack of
+    statevectors of shape (batch_size, 2**num_qubits) is evolved at once;
+    gates then accept either one matrix for every row or a (B, 2, 2)
+    stack with one matrix per row. With ``workers`` set, the statevector
+    lives in shared memory and each gate is split across worker processes
+    (see ``parallel.WorkerPool``).
+
+    A read-only statevector is treated as shared (by ``snapshot``,
+    ``fork`` or a cache) and copied before the next gate writes to it.
     """
 
-    def __init__(self, num_qubits: int):
+    def __init__(
+        self,
+        num_qubits: int,
+        batch_size: Optional[int] = None,
+        precision: str = "double",
+        workers: Optional[int] = None,
+    ):
         """
         Initialize simulator.
 
         Args:
             num_qubits: Number of qubits to simulate
+            batch_size: Number of statevectors to evolve together, or None
+                for a single statevector
+            precision: 'double' (complex128) or 'single' (complex64); single
+                precision halves memory and fits one more qubit
+            workers: Number of worker processes sharing the statevector
+                through shared memory; None or 1 runs in this process
         """
         if num_qubits <= 0:
             raise ValueError("Number of qubits must be positive")
-        if num_qubits > 25:
+        if precision not in PRECISIONS:
             raise ValueError(
-                "Cannot simulate more than 25 qubits (memory constraint). "
-                f"Requested: {num_qubits}"
+                f"Unknown precision '{precision}', expected one of {list(PRECISIONS)}"
             )
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        if workers is not None and workers <= 0:
+            raise ValueError("Number of workers must be positive")
 
         self.num_qubits = num_qubits
         self.num_states = 2**num_qubits
+        self.batch_size = batch_size
+        self.precision = precision
+        self.dtype = np.dtype(PRECISIONS[precision])
+        self._check_capacity()
+        self._pool: Optional[WorkerPool] = None
+        if workers is not None and workers > 1:
+            self._pool = WorkerPool(self._shape(), self.dtype, workers)
+        self._allocate_state()
+
+    def _allocate_state(self) -> None:
+        """Create the state storage in |00...0⟩; called once on construction."""
         self.statevector = self._initialize_statevector()
 
+    def _check_capacity(self) -> None:
+        """Raise if the statevector (batch) would not fit in the memory budget."""
+        rows = self.batch_size or 1
+        if rows * self.num_states * self.dtype.itemsize > MAX_STATEVECTOR_BYTES:
+            batch = f" x {rows}" if self.batch_size is not None else ""
+            raise ValueError(
+                f"Cannot simulate {self.num_qubits} qubits{batch} in "
+                f"{self.precision} precision (memory constraint of "
+                f"{MAX_STATEVECTOR_BYTES // 2**20} MiB)"
+            )
+
     def _initialize_statevector(self) -> np.ndarray:
         """
         Initialize statevector to |00...0⟩ state.
@@ -44,17 +135,95 @@ class Simulator:
         Returns:
             Statevector array
         """
-        statevector = np.zeros(self.num_states, dtype=complex)
-        statevector[0] = 1.0  # |00...0⟩ state
+        if self._pool is not None:
+            # Reuse the shared block the workers are attached to
+            statevector = self._pool.state
+            statevector[...] = 0
+        else:
+            statevector = np.zeros(self._shape(), dtype=self.dtype)
+        statevector[..., 0] = 1.0  # |00...0⟩ state
         return statevector
 
+    def _shape(self) -> Tuple[int, ...]:
+        """Shape of the statevector array."""
+        if self.batch_size is not None:
+            return (self.batch_size, self.num_states)
+        return (self.num_states,)
+
+    def _dispatch(
+        self, operation: str, args: Tuple, touched: Sequence[int], **kwargs
+    ) -> None:
+        """
+        Run a kernel on the statevector, in parallel when workers are set.
+
+        Args:
+            operation: 'gate', 'swap' or 'matrix'
+            args: Kernel arguments after the statevector
+            touched: Qubits the gate acts on or is controlled by
+            **kwargs: Keyword arguments for the kernel
+        """
+        if self._pool is None or self.num_qubits < PARALLEL_MIN_QUBITS:
+            if not self.statevector.flags.writeable:
+                # Copy on first write after snapshot() or fork()
+                self.statevector = self.statevector.copy()
+            _KERNELS[operation](self.statevector, *args, **kwargs)
+            return
+        if self.statevector is not self._pool.state:
+            # The statevector was replaced; move it into shared memory
+            self._pool.state[...] = self.statevector
+            self.statevector = self._pool.state
+        self._pool.apply(operation, args, kwargs, self.num_qubits, touched)
+
+    def close(self) -> None:
+        """Stop any worker processes and release shared memory."""
+        if self._pool is not None:
+            self.statevector = self.statevector.copy()
+            self._pool.close()
+            self._pool = None
+
     def reset(self) -> None:
         """Reset the statevector to |00...0⟩ state."""
         self.statevector = self._initialize_statevector()
 
+    def snapshot(self) -> np.ndarray:
+        """
+        Read-only view of the current statevector.
+
+        Unlike get_statevector(), nothing is copied up front: the
+        simulator copies its buffer before the next gate instead, so the
+        snapshot keeps the state it was taken at.
+
+        Returns:
+            Read-only statevector
+        """
+        if self._pool is not None:
+            # Workers keep writing the shared block in place
+            state = self.statevector.copy()
+        else:
+            state = self.statevector
+        state.flags.writeable = False
+        return state
+
+    def fork(self) -> "Simulator":
+        """
+        Independent simulator starting from the current state.
+
+        Both simulators share the statevector until either applies a
+        gate, which copies it first. Evolving N branches from a common
+        prefix costs N copies at most, made only as branches diverge.
+        Worker processes are not shared; the fork runs in this process.
+
+        Returns:
+            New simulator in the current state
+        """
+        branch = copy.copy(self)
+        branch._pool = None
+        branch.statevector = self.snapshot()
+        return branch
+
     def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
         """
-        Apply a single-qubit gate to the statevector.
+        Apply a single-qubit gate to the statevector in place.
 
         Args:
             gate: 2x2 unitary matrix
@@ -63,38 +232,25 @@ class Simulator:
         if target_qubit < 0 or target_qubit >= self.num_qubits:
             raise ValueError(f"Invalid qubit index: {target_qubit}")
 
-        # Create identity matrices for all other qubits
-        gate_matrix = self._expand_gate_to_full_space(gate, target_qubit)
-
-        # Apply gate to statevector
-        self.statevector = gate_matrix @ self.statevector
+        self._dispatch("gate", (gate, target_qubit, self.num_qubits), [target_qubit])
 
-    def _expand_gate_to_full_space(
-        self, gate: np.ndarray, target_qubit: int
-    ) -> np.ndarray:
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
         """
-        Expand a single-qubit gate to act on full Hilbert space.
+        Apply a single-qubit gate conditioned on one or more control qubits.
 
-        Args:
-            gate: 2x2 gate matrix
-            target_qubit: Which qubit the gate acts on
+        Only the amplitudes where every control qubit is 1 are touched.
 
-        Returns:
-            Full-space gate matrix
+        Args:
+            gate: 2x2 unitary matrix applied to the target
+            controls: Control qubit indices
+            target: Target qubit index
         """
-        # Create the full matrix by tensor product
-        if target_qubit == 0:
-            result = gate
-        else:
-            result = np.eye(2, dtype=complex)
-
-        for i in range(1, self.num_qubits):
-            if i == target_qubit:
-                result = np.kron(result, gate)
-            else:
-                result = np.kron(result, np.eye(2, dtype=complex))
-
-        return result
+        self._validate_qubits([*controls, target])
+        self._dispatch(
+            "gate", (gate, target, self.num_qubits, controls), [*controls, target]
+        )
 
     def apply_cx(self, control: int, target: int) -> None:
         """
@@ -104,71 +260,152 @@ class Simulator:
             control: Control qubit index
             target: Target qubit index
         """
-        if control == target:
-            raise ValueError("Control and target qubits must be different")
-        if not (0 <= control < self.num_qubits and 0 <= target < self.num_qubits):
-            raise ValueError("Invalid qubit indices")
-
-        # Create full CNOT matrix
-        cx_matrix = self._create_cx_matrix(control, target)
-        self.statevector = cx_matrix @ self.statevector
+        self.apply_controlled_gate(X, [control], target)
 
-    def _create_cx_matrix(self, control: int, target: int) -> np.ndarray:
+    def apply_cz(self, control: int, target: int) -> None:
         """
-        Create CNOT gate matrix for arbitrary control and target qubits.
+        Apply controlled-Z gate to the statevector.
 
         Args:
             control: Control qubit index
             target: Target qubit index
+        """
+        self.apply_controlled_gate(Z, [control], target)
 
-        Returns:
-            Full-space CNOT matrix
+    def apply_mcx(self, controls: Sequence[int], target: int) -> None:
         """
-        matrix = np.eye(self.num_states, dtype=complex)
+        Apply a multi-controlled X gate (Toffoli for two controls).
 
-        for i in range(self.num_states):
-            # Check if control qubit is 1
-            if (i >> (self.num_qubits - 1 - control)) & 1:
-                # Flip target qubit
-                j = i ^ (1 << (self.num_qubits - 1 - target))
-                if i != j:
-                    # Swap rows i and j
-                    matrix[i, i] = 0
-                    matrix[j, j] = 0
-                    matrix[i, j] = 1
-                    matrix[j, i] = 1
+        Args:
+            controls: Control qubit indices
+            target: Target qubit index
+        """
+        self.apply_controlled_gate(X, controls, target)
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """
+        Apply SWAP gate to the statevector.
+
+        Args:
+            qubit1: First qubit index
+            qubit2: Second qubit index
+        """
+        self._validate_qubits([qubit1, qubit2])
+        self._dispatch("swap", (qubit1, qubit2, self.num_qubits), [qubit1, qubit2])
 
-        return matrix
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a k-qubit unitary to the statevector.
 
-    def measure_all(self, shots: int = 1000) -> Result:
+        Args:
+            matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+            qubits: Qubit indices the matrix acts on
+        """
+        self._validate_qubits(qubits)
+        if np.shape(matrix) != (2 ** len(qubits), 2 ** len(qubits)):
+            raise ValueError(
+                f"Matrix shape {np.shape(matrix)} doesn't match {len(qubits)} qubits"
+            )
+        self._dispatch("matrix", (matrix, qubits, self.num_qubits), qubits)
+
+    def _validate_qubits(self, qubits: Sequence[int]) -> None:
+        """Validate that qubit indices are in range and distinct."""
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate qubits must be different, got {list(qubits)}")
+        if not all(0 <= qubit < self.num_qubits for qubit in qubits):
+            raise ValueError("Invalid qubit indices")
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
         """
         Measure all qubits in computational basis.
 
+        Shots are drawn as one multinomial sample over the probability
+        vector, so the cost is O(2^n) however many shots are requested.
+
         Args:
             shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
 
         Returns:
             Result object with measurement outcomes
         """
         if shots <= 0:
             raise ValueError("Number of shots must be positive")
+        if self.batch_size is not None:
+            raise ValueError("Use measure_batch() on a batched simulator")
+
+        rng = np.random.default_rng(seed)
+        return self._sample(self.get_probabilities(), shots, rng)
+
+    def measure_batch(self, shots: int = 1000, seed: Seed = None) -> List[Result]:
+        """
+        Measure every statevector of a batched simulator.
+
+        Args:
+            shots: Number of measurements per statevector
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            One Result per batch element
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+        if self.batch_size is None:
+            return [self.measure_all(shots, seed)]
 
-        # Calculate probabilities from statevector
-        probabilities = np.abs(self.statevector) ** 2
+        rng = np.random.default_rng(seed)
+        return [self._sample(row, shots, rng) for row in self.get_probabilities()]
+
+    def _sample(
+        self, probabilities: np.ndarray, shots: int, rng: np.random.Generator
+    ) -> Result:
+        """Sample measurement outcomes from one probability vector."""
+        outcomes, frequencies = sample_counts(probabilities, shots, rng)
+        return Result.from_arrays(outcomes, frequencies, shots, self.num_qubits)
+
+    def qubit_probability(self, qubit: int) -> float:
+        """
+        Probability that measuring a qubit gives 1.
 
-        # Normalize (in case of numerical errors)
-        probabilities /= np.sum(probabilities)
+        Args:
+            qubit: Qubit index
 
-        # Sample from probability distribution
-        outcomes = np.random.choice(self.num_states, size=shots, p=probabilities)
+        Returns:
+            Probability in [0, 1]
+        """
+        self._validate_single(qubit)
+        halves = self.statevector.reshape(1 << qubit, 2, -1)
+        return float(np.sum(np.abs(halves[:, 1]) ** 2, dtype=np.float64))
 
-        # Convert to bitstrings and count
-        counts: Dict[str, int] = {}
-        for outcome in outcomes:
-            bitstring = format(outcome, f"0{self.num_qubits}b")
-            counts[bitstring] = counts.get(bitstring, 0) + 1
+    def collapse(self, qubit: int, outcome: int) -> None:
+        """
+        Project a qubit onto a measurement outcome and renormalize.
 
-        return Result(counts=counts, shots=shots, num_qubits=self.num_qubits)
+        A shared (read-only) statevector is not copied first: the
+        projection is written to a new array instead.
+
+        Args:
+            qubit: Qubit index
+            outcome: Measured value, 0 or 1
+        """
+        self._validate_single(qubit)
+        halves = self.statevector.reshape(1 << qubit, 2, -1)
+        norm = np.sqrt(np.sum(np.abs(halves[:, outcome]) ** 2, dtype=np.float64))
+        if norm == 0:
+            raise ValueError(f"Outcome {outcome} of qubit {qubit} has probability 0")
+        if not self.statevector.flags.writeable:
+            self.statevector = np.zeros_like(self.statevector)
+            projected = self.statevector.reshape(1 << qubit, 2, -1)
+            projected[:, outcome] = halves[:, outcome] / norm
+            return
+        halves[:, 1 - outcome] = 0
+        halves[:, outcome] /= norm
+
+    def _validate_single(self, qubit: int) -> None:
+        """Validate a qubit index for single-state measurement operations."""
+        if self.batch_size is not None:
+            raise ValueError("Mid-circuit measurement needs an unbatched simulator")
+        self._validate_qubits([qubit])
 
     def get_statevector(self) -> np.ndarray:
         """
@@ -179,18 +416,45 @@ class Simulator:
         """
         return self.statevector.copy()
 
+    def expectation(
+        self, observable: Union[PauliSum, str]
+    ) -> Union[float, complex, np.ndarray]:
+        """
+        Exact expectation value of an observable on the current state.
+
+        Args:
+            observable: PauliSum, or a single Pauli string such as 'ZZI'
+
+        Returns:
+            <psi|H|psi>, or an array with one value per batch element
+        """
+        if isinstance(observable, str):
+            observable = PauliSum({observable: 1.0})
+        if observable.num_qubits != self.num_qubits:
+            raise ValueError(
+                f"Observable acts on {observable.num_qubits} qubits, "
+                f"simulator has {self.num_qubits}"
+            )
+        return observable.expectation(self.statevector)
+
     def get_probabilities(self) -> np.ndarray:
         """
         Get probability distribution from statevector.
 
         Returns:
-            Array of probabilities for each computational basis state
+            Array of probabilities for each computational basis state,
+            float32 in single precision and float64 in double
         """
         return np.abs(self.statevector) ** 2
 
     def __repr__(self) -> str:
         """String representation."""
+        if self.batch_size is not None:
+            return (
+                f"Simulator(num_qubits={self.num_qubits}, "
+                f"batch_size={self.batch_size})"
+            )
         return f"Simulator(num_qubits={self.num_qubits})"
 
 
-__all__ = ["Simulator"]
+__all__ = ["Simulator", "sample_counts"]
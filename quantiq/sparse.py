@@ -0,0 +1,380 @@
+"""
+Sparse statevector simulation for quantIQ
+
+Arithmetic and oracle circuits built mostly from X, CX, Z and swaps keep
+only a few nonzero amplitudes. The sparse backend stores just those, as
+a sorted array of basis-state indices and a parallel array of
+amplitudes, so its cost follows the number of nonzero entries instead of
+2^n and it can address up to 63 qubits.
+
+Gates whose matrix has one nonzero per column (X, Y, Z, S, CX, SWAP,
+Toffoli, ...) are pure index remaps with a phase. Other gates split each
+entry into the 2^k basis states they mix; contributions to the same
+index are summed and entries that cancel are dropped. Once the fraction
+of nonzero amplitudes passes ``density_threshold`` the state is handed to
+the dense ``Simulator``, which is faster there.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .results import Result
+from .simulator import MAX_STATEVECTOR_BYTES, PRECISIONS, Seed, Simulator, sample_counts
+
+# Indices are int64, with qubit 0 as the most significant bit
+MAX_SPARSE_QUBITS = 63
+
+# Default fraction of nonzero amplitudes above which the dense
+# statevector takes over
+DEFAULT_DENSITY_THRESHOLD = 1 / 16
+
+# Amplitudes smaller than this many machine epsilons count as zero
+_ZERO_EPSILONS = 8
+
+
+class SparseSimulator:
+    """
+    Statevector simulator that stores only the nonzero amplitudes.
+
+    Attributes:
+        num_qubits: Number of qubits
+        density_threshold: Nonzero fraction that triggers the dense fallback
+        indices: Sorted basis-state indices of the nonzero amplitudes
+        amplitudes: Amplitude of each entry in indices
+        peak_memory_bytes: Largest state size reached so far, in bytes
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        precision: str = "double",
+        density_threshold: float = DEFAULT_DENSITY_THRESHOLD,
+    ):
+        """
+        Initialize the |00...0⟩ state.
+
+        Args:
+            num_qubits: Number of qubits to simulate
+            precision: 'double' (complex128) or 'single' (complex64)
+            density_threshold: Switch to a dense statevector once this
+                fraction of the 2^n amplitudes is nonzero; 1 never switches.
+                States too large for the dense simulator stay sparse
+        """
+        if num_qubits <= 0:
+            raise ValueError("Number of qubits must be positive")
+        if num_qubits > MAX_SPARSE_QUBITS:
+            raise ValueError(
+                f"Sparse backend supports at most {MAX_SPARSE_QUBITS} qubits"
+            )
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision '{precision}', expected one of {list(PRECISIONS)}"
+            )
+        if not 0 < density_threshold <= 1:
+            raise ValueError("Density threshold must be in (0, 1]")
+
+        self.num_qubits = num_qubits
+        self.num_states = 2**num_qubits
+        self.precision = precision
+        self.dtype = np.dtype(PRECISIONS[precision])
+        self.density_threshold = density_threshold
+        self._tolerance = _ZERO_EPSILONS * np.finfo(self.dtype).eps
+        self.reset()
+
+    def close(self) -> None:
+        """Nothing to release; accepted so every backend can be closed."""
+
+    def reset(self) -> None:
+        """Reset to the |00...0⟩ state in sparse form."""
+        self.indices = np.zeros(1, dtype=np.int64)
+        self.amplitudes = np.ones(1, dtype=self.dtype)
+        self._dense: Optional[Simulator] = None
+        self.peak_memory_bytes = self.memory_bytes
+
+    @property
+    def is_dense(self) -> bool:
+        """Whether the state has been handed to the dense simulator."""
+        return self._dense is not None
+
+    @property
+    def num_nonzero(self) -> int:
+        """Number of stored amplitudes."""
+        if self._dense is not None:
+            return self.num_states
+        return len(self.indices)
+
+    @property
+    def density(self) -> float:
+        """Fraction of the 2^n amplitudes that are stored."""
+        return self.num_nonzero / self.num_states
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the current state representation."""
+        if self._dense is not None:
+            return self._dense.statevector.nbytes
+        return self.indices.nbytes + self.amplitudes.nbytes
+
+    def _mask(self, qubit: int) -> int:
+        """Bit of a qubit in the basis-state index."""
+        return 1 << (self.num_qubits - 1 - qubit)
+
+    def _validate_qubits(self, qubits: Sequence[int]) -> None:
+        """Validate that qubit indices are in range and distinct."""
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate qubits must be different, got {list(qubits)}")
+        if not all(0 <= qubit < self.num_qubits for qubit in qubits):
+            raise ValueError("Invalid qubit indices")
+
+    def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
+        """
+        Apply a single-qubit gate.
+
+        Args:
+            gate: 2x2 unitary matrix
+            target_qubit: Qubit index to apply gate to
+        """
+        if target_qubit < 0 or target_qubit >= self.num_qubits:
+            raise ValueError(f"Invalid qubit index: {target_qubit}")
+        if np.ndim(gate) != 2:
+            raise ValueError("Sparse backend doesn't support batched gates")
+        if self._dense is not None:
+            self._dense.apply_gate(gate, target_qubit)
+            return
+        self._apply_sparse(gate, [target_qubit], [])
+
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
+        """
+        Apply a single-qubit gate conditioned on one or more control qubits.
+
+        Only the entries whose control bits are all 1 are touched.
+
+        Args:
+            gate: 2x2 unitary matrix applied to the target
+            controls: Control qubit indices
+            target: Target qubit index
+        """
+        self._validate_qubits([*controls, target])
+        if self._dense is not None:
+            self._dense.apply_controlled_gate(gate, controls, target)
+            return
+        self._apply_sparse(gate, [target], controls)
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """
+        Apply SWAP gate by exchanging two bits of every index.
+
+        Args:
+            qubit1: First qubit index
+            qubit2: Second qubit index
+        """
+        self._validate_qubits([qubit1, qubit2])
+        if self._dense is not None:
+            self._dense.apply_swap(qubit1, qubit2)
+            return
+        mask1, mask2 = self._mask(qubit1), self._mask(qubit2)
+        differ = ((self.indices & mask1) != 0) != ((self.indices & mask2) != 0)
+        self._store(
+            np.where(differ, self.indices ^ (mask1 | mask2), self.indices),
+            self.amplitudes,
+            unique=True,
+        )
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a k-qubit unitary.
+
+        Args:
+            matrix: 2^k x 2^k unitary, qubits[0] being its most significant bit
+            qubits: Qubit indices the matrix acts on
+        """
+        self._validate_qubits(qubits)
+        if np.shape(matrix) != (2 ** len(qubits), 2 ** len(qubits)):
+            raise ValueError(
+                f"Matrix shape {np.shape(matrix)} doesn't match {len(qubits)} qubits"
+            )
+        if self._dense is not None:
+            self._dense.apply_unitary(matrix, qubits)
+            return
+        self._apply_sparse(np.asarray(matrix), qubits, [])
+
+    def _apply_sparse(
+        self, matrix: np.ndarray, qubits: Sequence[int], controls: Sequence[int]
+    ) -> None:
+        """
+        Apply a matrix to the stored entries whose controls are all 1.
+
+        Args:
+            matrix: 2^k x 2^k matrix over qubits
+            qubits: Target qubits, qubits[0] being the matrix's top bit
+            controls: Control qubits
+        """
+        control_mask = sum(self._mask(q) for q in controls)
+        selected = (self.indices & control_mask) == control_mask
+        indices, amplitudes = self.indices[selected], self.amplitudes[selected]
+
+        # Local value of each entry on the target qubits
+        k = len(qubits)
+        local = np.zeros(len(indices), dtype=np.int64)
+        for i, qubit in enumerate(qubits):
+            local |= ((indices & self._mask(qubit)) != 0).astype(np.int64) << (
+                k - 1 - i
+            )
+        base = indices & ~sum(self._mask(q) for q in qubits)
+        deposit = np.zeros(1 << k, dtype=np.int64)
+        for i, qubit in enumerate(qubits):
+            deposit |= ((np.arange(1 << k) >> (k - 1 - i)) & 1) * self._mask(qubit)
+
+        # One output per nonzero matrix entry in each entry's column
+        matrix = matrix.astype(self.dtype, copy=False)
+        rows, columns = np.nonzero(matrix)
+        monomial = len(columns) == len(set(columns.tolist()))
+        new_indices = [self.indices[~selected]]
+        new_amplitudes = [self.amplitudes[~selected]]
+        for row in np.unique(rows).tolist():
+            weights = matrix[row, local]
+            keep = weights != 0
+            new_indices.append(base[keep] | deposit[row])
+            new_amplitudes.append(weights[keep] * amplitudes[keep])
+
+        # A monomial unitary maps entries one-to-one, so nothing collides
+        self._store(
+            np.concatenate(new_indices), np.concatenate(new_amplitudes), monomial
+        )
+
+    def _store(self, indices: np.ndarray, amplitudes: np.ndarray, unique: bool) -> None:
+        """
+        Sort, merge and prune a new set of entries.
+
+        Args:
+            indices: Basis-state index of each entry, possibly repeated
+            amplitudes: Amplitude of each entry
+            unique: Whether indices are known to be distinct
+        """
+        if unique:
+            order = np.argsort(indices, kind="stable")
+            indices, amplitudes = indices[order], amplitudes[order]
+        else:
+            indices, inverse = np.unique(indices, return_inverse=True)
+            summed = np.zeros(len(indices), dtype=self.dtype)
+            np.add.at(summed, inverse, amplitudes)
+            amplitudes = summed
+            nonzero = np.abs(amplitudes) > self._tolerance
+            indices, amplitudes = indices[nonzero], amplitudes[nonzero]
+
+        self.indices, self.amplitudes = indices, amplitudes
+        self.peak_memory_bytes = max(self.peak_memory_bytes, self.memory_bytes)
+        if self.density > self.density_threshold and self._dense_fits():
+            self._densify()
+
+    def _dense_fits(self) -> bool:
+        """Whether a dense statevector of this size is allowed."""
+        return self.num_states * self.dtype.itemsize <= MAX_STATEVECTOR_BYTES
+
+    def _densify(self) -> None:
+        """Hand the state over to a dense Simulator."""
+        self._dense = Simulator(self.num_qubits, precision=self.precision)
+        self._dense.statevector[0] = 0
+        self._dense.statevector[self.indices] = self.amplitudes
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.amplitudes = np.zeros(0, dtype=self.dtype)
+        self.peak_memory_bytes = max(self.peak_memory_bytes, self.memory_bytes)
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
+        """
+        Measure all qubits in computational basis.
+
+        Shots are drawn by one multinomial over the stored entries only.
+
+        Args:
+            shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            Result object with measurement outcomes; ``metadata`` reports
+            the peak state memory, the final number of nonzero amplitudes
+            and whether the dense fallback was used
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        if self._dense is not None:
+            result = self._dense.measure_all(shots, seed)
+        else:
+            rng = np.random.default_rng(seed)
+            chosen, frequencies = sample_counts(
+                np.abs(self.amplitudes) ** 2, shots, rng
+            )
+            result = Result.from_arrays(
+                self.indices[chosen], frequencies, shots, self.num_qubits
+            )
+        result.metadata.update(self.memory_stats())
+        return result
+
+    def memory_stats(self) -> Dict[str, object]:
+        """
+        Memory use of the simulation so far.
+
+        Returns:
+            Dictionary with memory_bytes (current), peak_memory_bytes,
+            nonzero_amplitudes and dense_fallback
+        """
+        return {
+            "memory_bytes": self.memory_bytes,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "nonzero_amplitudes": self.num_nonzero,
+            "dense_fallback": self.is_dense,
+        }
+
+    def get_sparse_state(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the nonzero amplitudes without expanding the state.
+
+        Returns:
+            Tuple of (sorted basis-state indices, amplitudes), copied
+        """
+        if self._dense is not None:
+            statevector = self._dense.statevector
+            indices = np.flatnonzero(np.abs(statevector) > self._tolerance)
+            return indices, statevector[indices].copy()
+        return self.indices.copy(), self.amplitudes.copy()
+
+    def get_statevector(self) -> np.ndarray:
+        """
+        Get the state as a dense statevector.
+
+        Returns:
+            Array of all 2^n amplitudes
+        """
+        if self._dense is not None:
+            return self._dense.get_statevector()
+        if not self._dense_fits():
+            raise ValueError(
+                f"A dense statevector of {self.num_qubits} qubits exceeds the "
+                f"memory constraint; use get_sparse_state()"
+            )
+        statevector = np.zeros(self.num_states, dtype=self.dtype)
+        statevector[self.indices] = self.amplitudes
+        return statevector
+
+    def get_probabilities(self) -> np.ndarray:
+        """
+        Get probability distribution from the dense statevector.
+
+        Returns:
+            Array of probabilities for each computational basis state
+        """
+        return np.abs(self.get_statevector()) ** 2
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"SparseSimulator(num_qubits={self.num_qubits}, "
+            f"nonzero={self.num_nonzero})"
+        )
+
+
+__all__ = ["SparseSimulator"]
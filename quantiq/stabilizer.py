@@ -0,0 +1,335 @@
+"""
+Stabilizer (Clifford tableau) simulation for quantIQ
+
+Circuits built only from Clifford gates (H, S, X, Y, Z, CX, CZ, SWAP)
+keep the state a stabilizer state, which the Aaronson-Gottesman tableau
+describes with 2n Pauli rows instead of 2^n amplitudes. Each row's X and
+Z bits are packed into 64-bit words, so a gate is a handful of bitwise
+operations over one column of every row.
+
+The computational-basis distribution of a stabilizer state is uniform
+over an affine subspace v0 + span(G). It is extracted once by Gaussian
+elimination of the stabilizer rows, after which every shot is a random
+combination of the generators G.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .gates import H, S, X, Y, Z
+from .results import Result, _packed_to_indices, _popcount
+from .simulator import Seed
+
+# Gate names a tableau can simulate
+CLIFFORD_GATES = frozenset(
+    {"H", "S", "X", "Y", "Z", "CX", "CZ", "SWAP", "MEASURE_ALL", "MEASURE"}
+)
+
+# Largest coefficient space sampled with one multinomial over all cosets
+_MULTINOMIAL_BITS = 20
+
+_ONE = np.uint64(1)
+
+
+def is_clifford(gates: Sequence[Tuple]) -> bool:
+    """Whether every gate in a gate list can run on the tableau."""
+    return all(gate[0] in CLIFFORD_GATES for gate in gates)
+
+
+class StabilizerSimulator:
+    """
+    Clifford circuit simulator on a bit-packed stabilizer tableau.
+
+    Rows 0..n-1 of the tableau are destabilizers and rows n..2n-1 are
+    stabilizers; ``x`` and ``z`` hold their Pauli bits, qubit q in bit
+    q % 64 of word q // 64, and ``r`` their signs. Words are stored
+    word-major so the column a gate touches is contiguous.
+
+    Attributes:
+        num_qubits: Number of qubits
+        x: X bits of each row, shape (words, 2n)
+        z: Z bits of each row, shape (words, 2n)
+        r: Sign bit of each row
+    """
+
+    def __init__(self, num_qubits: int, precision: str = "double"):
+        """
+        Initialize the tableau in the |00...0⟩ state.
+
+        Args:
+            num_qubits: Number of qubits to simulate
+            precision: Unused; accepted so every backend takes it
+        """
+        if num_qubits <= 0:
+            raise ValueError("Number of qubits must be positive")
+        self.num_qubits = num_qubits
+        self.precision = precision
+        self.reset()
+
+    def close(self) -> None:
+        """Nothing to release; accepted so every backend can be closed."""
+
+    def reset(self) -> None:
+        """Reset to |00...0⟩: destabilizers X_i, stabilizers Z_i."""
+        n = self.num_qubits
+        words = (n + 63) // 64
+        self.x = np.zeros((words, 2 * n), dtype=np.uint64)
+        self.z = np.zeros((words, 2 * n), dtype=np.uint64)
+        self.r = np.zeros(2 * n, dtype=np.uint64)
+        rows = np.arange(n)
+        bits = _ONE << (rows % 64).astype(np.uint64)
+        self.x[rows // 64, rows] = bits
+        self.z[rows // 64, rows + n] = bits
+
+    @staticmethod
+    def _column(matrix: np.ndarray, qubit: int) -> np.ndarray:
+        """Bit of every row at one qubit."""
+        return (matrix[qubit // 64] >> np.uint64(qubit % 64)) & _ONE
+
+    @staticmethod
+    def _flip(matrix: np.ndarray, qubit: int, bits: np.ndarray) -> None:
+        """XOR bits into one qubit's column."""
+        matrix[qubit // 64] ^= bits << np.uint64(qubit % 64)
+
+    def _h(self, a: int) -> None:
+        xa, za = self._column(self.x, a), self._column(self.z, a)
+        self.r ^= xa & za
+        self._flip(self.x, a, xa ^ za)
+        self._flip(self.z, a, xa ^ za)
+
+    def _s(self, a: int) -> None:
+        xa, za = self._column(self.x, a), self._column(self.z, a)
+        self.r ^= xa & za
+        self._flip(self.z, a, xa)
+
+    def _cx(self, a: int, b: int) -> None:
+        xa, za = self._column(self.x, a), self._column(self.z, a)
+        xb, zb = self._column(self.x, b), self._column(self.z, b)
+        self.r ^= xa & zb & (xb ^ za ^ _ONE)
+        self._flip(self.x, b, xa)
+        self._flip(self.z, a, zb)
+
+    def _pauli(self, a: int, flip_x: bool, flip_z: bool) -> None:
+        # A Pauli gate negates the rows it anticommutes with
+        if flip_x:
+            self.r ^= self._column(self.z, a)
+        if flip_z:
+            self.r ^= self._column(self.x, a)
+
+    def apply_gate(self, gate: np.ndarray, target_qubit: int) -> None:
+        """
+        Apply a single-qubit Clifford gate.
+
+        Args:
+            gate: 2x2 matrix of H, S, S†, X, Y or Z
+            target_qubit: Qubit index to apply gate to
+        """
+        self._validate_qubits([target_qubit])
+        gate = np.asarray(gate)
+        if np.allclose(gate, H):
+            self._h(target_qubit)
+        elif np.allclose(gate, S):
+            self._s(target_qubit)
+        elif np.allclose(gate, S.conj()):
+            self._s(target_qubit)
+            self._pauli(target_qubit, False, True)
+        elif np.allclose(gate, X):
+            self._pauli(target_qubit, True, False)
+        elif np.allclose(gate, Y):
+            self._pauli(target_qubit, True, True)
+        elif np.allclose(gate, Z):
+            self._pauli(target_qubit, False, True)
+        elif not np.allclose(gate, np.eye(2)):
+            raise ValueError("Stabilizer simulator only supports Clifford gates")
+
+    def apply_controlled_gate(
+        self, gate: np.ndarray, controls: Sequence[int], target: int
+    ) -> None:
+        """
+        Apply a singly-controlled X or Z.
+
+        Args:
+            gate: X or Z matrix
+            controls: One control qubit
+            target: Target qubit index
+        """
+        self._validate_qubits([*controls, target])
+        if len(controls) != 1:
+            raise ValueError("Stabilizer simulator only supports Clifford gates")
+        if np.allclose(gate, X):
+            self._cx(controls[0], target)
+        elif np.allclose(gate, Z):
+            self._h(target)
+            self._cx(controls[0], target)
+            self._h(target)
+        else:
+            raise ValueError("Stabilizer simulator only supports Clifford gates")
+
+    def apply_cx(self, control: int, target: int) -> None:
+        """Apply CNOT gate."""
+        self.apply_controlled_gate(X, [control], target)
+
+    def apply_cz(self, control: int, target: int) -> None:
+        """Apply controlled-Z gate."""
+        self.apply_controlled_gate(Z, [control], target)
+
+    def apply_swap(self, qubit1: int, qubit2: int) -> None:
+        """Apply SWAP gate by exchanging two tableau columns."""
+        self._validate_qubits([qubit1, qubit2])
+        for matrix in (self.x, self.z):
+            diff = self._column(matrix, qubit1) ^ self._column(matrix, qubit2)
+            self._flip(matrix, qubit1, diff)
+            self._flip(matrix, qubit2, diff)
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """Arbitrary unitaries are not Clifford in general."""
+        raise ValueError("Stabilizer simulator only supports Clifford gates")
+
+    def _validate_qubits(self, qubits: Sequence[int]) -> None:
+        """Validate that qubit indices are in range and distinct."""
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate qubits must be different, got {list(qubits)}")
+        if not all(0 <= qubit < self.num_qubits for qubit in qubits):
+            raise ValueError("Invalid qubit indices")
+
+    def _support(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Affine subspace holding the measurement outcomes.
+
+        Returns:
+            Tuple of (offset bits v0 of shape (n,), generator bits of
+            shape (k, n)); every outcome v0 ^ (c @ G) is equally likely
+        """
+        n = self.num_qubits
+        # Row-major copies of the stabilizers, as elimination works on rows
+        x, z, r = self.x[:, n:].T.copy(), self.z[:, n:].T.copy(), self.r[n:].copy()
+
+        # Row-reduce the X part; multiplying stabilizers tracks the sign
+        row = 0
+        for qubit in range(n):
+            column = _row_bits(x, qubit)
+            pivots = np.flatnonzero(column[row:])
+            if len(pivots) == 0:
+                continue
+            pivot = row + pivots[0]
+            for matrix in (x, z, r):
+                matrix[[row, pivot]] = matrix[[pivot, row]]
+            others = np.flatnonzero(_row_bits(x, qubit))
+            others = others[others != row]
+            if len(others):
+                r[others] = _product_sign(x, z, r, others, row)
+                x[others] ^= x[row]
+                z[others] ^= z[row]
+            row += 1
+        generators = _unpack(x[:row], n)
+
+        # The rest are ±Z strings fixing parities: z . b = r (mod 2)
+        zx, zr = z[row:], r[row:]
+        offset = np.zeros(n, dtype=np.uint8)
+        pivot_row = 0
+        pivots_found = []
+        for qubit in range(n):
+            column = _row_bits(zx, qubit)
+            pivots = np.flatnonzero(column[pivot_row:])
+            if len(pivots) == 0:
+                continue
+            pivot = pivot_row + pivots[0]
+            zx[[pivot_row, pivot]] = zx[[pivot, pivot_row]]
+            zr[[pivot_row, pivot]] = zr[[pivot, pivot_row]]
+            others = np.flatnonzero(_row_bits(zx, qubit))
+            others = others[others != pivot_row]
+            zx[others] ^= zx[pivot_row]
+            zr[others] ^= zr[pivot_row]
+            pivots_found.append(qubit)
+            pivot_row += 1
+        # Reduced echelon form: set free bits to 0, each pivot bit to its sign
+        offset[pivots_found] = zr[: len(pivots_found)].astype(np.uint8)
+        return offset, generators
+
+    def measure_all(self, shots: int = 1000, seed: Seed = None) -> Result:
+        """
+        Measure all qubits in computational basis.
+
+        Args:
+            shots: Number of measurements to perform
+            seed: Seed or np.random.Generator for reproducible sampling
+
+        Returns:
+            Result object with measurement outcomes
+        """
+        if shots <= 0:
+            raise ValueError("Number of shots must be positive")
+
+        rng = np.random.default_rng(seed)
+        offset, generators = self._support()
+        k = len(generators)
+        if k <= _MULTINOMIAL_BITS:
+            counts = rng.multinomial(shots, np.full(1 << k, 1.0 / (1 << k)))
+            chosen = np.flatnonzero(counts)
+            frequencies = counts[chosen]
+            shifts = np.arange(k - 1, -1, -1)
+            coefficients = ((chosen[:, None] >> shifts) & 1).astype(np.uint8)
+        else:
+            draws = rng.integers(0, 2, size=(shots, k), dtype=np.uint8)
+            packed, frequencies = np.unique(
+                np.packbits(draws, axis=1), axis=0, return_counts=True
+            )
+            coefficients = np.unpackbits(packed, axis=1, count=k)
+
+        # outcome = v0 ^ (c @ G), accumulated on bytes packed 8 qubits each
+        packed_generators = np.packbits(generators, axis=1)
+        outcomes = np.tile(np.packbits(offset), (len(coefficients), 1))
+        for j in range(k):
+            outcomes ^= packed_generators[j] * coefficients[:, j, None]
+
+        return Result.from_arrays(
+            _packed_to_indices(outcomes, self.num_qubits),
+            frequencies.astype(np.int64),
+            shots,
+            self.num_qubits,
+        )
+
+    def get_statevector(self) -> np.ndarray:
+        """Not available: the tableau does not track amplitudes."""
+        raise ValueError("stabilizer backend has no statevector; use run()")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"StabilizerSimulator(num_qubits={self.num_qubits})"
+
+
+def _row_bits(matrix: np.ndarray, qubit: int) -> np.ndarray:
+    """Bit at one qubit of every row of a row-major (rows, words) array."""
+    return (matrix[:, qubit // 64] >> np.uint64(qubit % 64)) & _ONE
+
+
+def _product_sign(
+    x: np.ndarray, z: np.ndarray, r: np.ndarray, rows: np.ndarray, pivot: int
+) -> np.ndarray:
+    """
+    Sign bits of the products of ``rows`` with row ``pivot``.
+
+    Counts, per row, the qubits where multiplying the Paulis contributes
+    a factor +i or -i (the g function of Aaronson and Gottesman).
+    """
+    x1, z1 = x[pivot], z[pivot]
+    x2, z2 = x[rows], z[rows]
+    y1, only_x1, only_z1 = x1 & z1, x1 & ~z1, ~x1 & z1
+    plus = (y1 & z2 & ~x2) | (only_x1 & z2 & x2) | (only_z1 & x2 & ~z2)
+    minus = (y1 & x2 & ~z2) | (only_x1 & z2 & ~x2) | (only_z1 & x2 & z2)
+    g = _popcount(plus).sum(axis=1) - _popcount(minus).sum(axis=1)
+    phase = (2 * r[rows].astype(np.int64) + 2 * int(r[pivot]) + g) % 4
+    return (phase // 2).astype(np.uint64)
+
+
+def _unpack(words: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Tableau rows as a (rows, num_qubits) array of 0/1 bits."""
+    shifts = np.arange(64, dtype=np.uint64)
+    bits = (words[:, :, None] >> shifts) & _ONE
+    return bits.reshape(len(words), 64 * words.shape[1])[:, :num_qubits].astype(
+        np.uint8
+    )
+
+
+__all__ = ["CLIFFORD_GATES", "StabilizerSimulator", "is_clifford"]
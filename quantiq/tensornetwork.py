@@ -0,0 +1,350 @@
+"""
+Tensor-network amplitude evaluation for quantIQ
+
+A single amplitude <x|U|0...0> can be computed without the statevector
+by contracting the circuit as a network: one rank-1 tensor per input
+|0⟩, one rank-2k tensor per k-qubit gate and one projector <x_q| per
+output wire. Contraction cost depends on the circuit's width in the
+chosen contraction order rather than on 2^n, which makes shallow or
+narrow-treewidth circuits on many qubits tractable.
+
+The order is found once by a greedy search and stored in a
+``ContractionPlan`` together with the indices to *slice*: when the
+largest intermediate tensor would exceed the memory bound, a few indices
+are fixed to each of their values in turn and the partial results are
+summed. Projectors are the only tensors that depend on the bitstring, so
+one plan serves every query; a batch of bitstrings shares one pass, with
+the batch as an extra axis carried through the contraction.
+"""
+
+import heapq
+import itertools
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from .compiler import get_gate_spec
+from .parameters import is_symbolic
+
+# Default bound on intermediate tensor size, in elements (256 MiB)
+DEFAULT_MAX_SIZE = 2**24
+
+# Label of the bitstring batch axis
+_BATCH = -1
+
+
+class ContractionPlan:
+    """
+    A circuit's tensor network and the order to contract it in.
+
+    Attributes:
+        num_qubits: Number of qubits in the circuit
+        tensors: Fixed tensors of the network (inputs and gates)
+        labels: Index labels of each fixed tensor
+        outputs: Label of the final index of each qubit's wire
+        path: Pairs of tensor ids to contract; tensor ids count up from
+            the fixed tensors, then the output projectors, then one new id
+            per contraction
+        sliced: Labels summed over explicitly to bound memory
+        peak_size: Largest intermediate tensor, in elements, per slice
+        flops: Estimated multiply-adds for one amplitude over all slices
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        tensors: List[np.ndarray],
+        labels: List[Tuple[int, ...]],
+        outputs: List[int],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        """
+        Search a contraction order and choose sliced indices.
+
+        Args:
+            num_qubits: Number of qubits in the circuit
+            tensors: Fixed tensors of the network, every axis of length 2
+            labels: Index labels of each tensor
+            outputs: Label of the final index of each qubit's wire
+            max_size: Largest intermediate tensor allowed, in elements
+        """
+        self.num_qubits = num_qubits
+        self.tensors = tensors
+        self.labels = labels
+        self.outputs = outputs
+        self.max_size = max_size
+        self.path = _greedy_path(labels + [(label,) for label in outputs])
+        self.sliced: List[int] = []
+        self._choose_slices()
+
+    @property
+    def num_slices(self) -> int:
+        """Number of independent contractions summed per query."""
+        return 1 << len(self.sliced)
+
+    def _intermediates(self) -> List[Tuple[int, ...]]:
+        """Index labels of every tensor the path creates, sliced removed."""
+        sliced = set(self.sliced)
+        current = [
+            tuple(l for l in labels if l not in sliced)
+            for labels in self.labels + [(label,) for label in self.outputs]
+        ]
+        created = []
+        for a, b in self.path:
+            current.append(_result_labels(current[a], current[b]))
+            created.append(current[-1])
+        return created
+
+    def _choose_slices(self) -> None:
+        """Slice the index shared by most of the largest tensors until they fit."""
+        while True:
+            created = self._intermediates()
+            width = max((len(labels) for labels in created), default=0)
+            self.peak_size = 1 << width
+            self.flops = sum(1 << len(labels) for labels in created) * self.num_slices
+            if self.peak_size <= self.max_size:
+                return
+            counts: Dict[int, int] = {}
+            for labels in created:
+                if len(labels) == width:
+                    for label in labels:
+                        counts[label] = counts.get(label, 0) + 1
+            if not counts:
+                return
+            self.sliced.append(max(counts, key=lambda label: counts[label]))
+
+    def amplitudes(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Contract the network for a batch of bitstrings.
+
+        The batch is split into chunks so that peak_size times the chunk
+        length stays within max_size.
+
+        Args:
+            bits: (batch, num_qubits) array of 0/1 values
+
+        Returns:
+            Amplitude of each bitstring
+        """
+        chunk = max(1, self.max_size // self.peak_size)
+        return np.concatenate(
+            [np.zeros(0, dtype=complex)]
+            + [
+                self._contract_batch(bits[start : start + chunk])
+                for start in range(0, len(bits), chunk)
+            ]
+        )
+
+    def _contract_batch(self, bits: np.ndarray) -> np.ndarray:
+        """Amplitudes of one chunk of bitstrings, summed over all slices."""
+        projectors = [
+            np.eye(2, dtype=complex)[bits[:, q]] for q in range(self.num_qubits)
+        ]
+        tensors = self.tensors + projectors
+        labels = self.labels + [(_BATCH, label) for label in self.outputs]
+
+        total = np.zeros(len(bits), dtype=complex)
+        for values in itertools.product((0, 1), repeat=len(self.sliced)):
+            fixed = dict(zip(self.sliced, values))
+            current: Dict[int, Tuple[np.ndarray, Tuple[int, ...]]] = {
+                i: _slice(tensor, labels[i], fixed) for i, tensor in enumerate(tensors)
+            }
+            next_id = len(tensors)
+            for a, b in self.path:
+                # Popping frees inputs as soon as they are consumed
+                current[next_id] = _contract(*current.pop(a), *current.pop(b))
+                next_id += 1
+            total += current[next_id - 1][0].reshape(len(bits))
+        return total
+
+    def __repr__(self) -> str:
+        return (
+            f"ContractionPlan({len(self.tensors)} tensors, "
+            f"peak_size={self.peak_size}, slices={self.num_slices})"
+        )
+
+
+def build_plan(
+    num_qubits: int, gates: Sequence[Tuple], max_size: int = DEFAULT_MAX_SIZE
+) -> ContractionPlan:
+    """
+    Turn a gate list into a tensor network and plan its contraction.
+
+    SWAPs only exchange wire labels and add no tensor.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params), parameters bound
+        max_size: Largest intermediate tensor allowed, in elements
+
+    Returns:
+        ContractionPlan for the circuit
+    """
+    wires = list(range(num_qubits))
+    next_label = num_qubits
+    zero = np.array([1, 0], dtype=complex)
+    tensors: List[np.ndarray] = [zero] * num_qubits
+    labels: List[Tuple[int, ...]] = [(q,) for q in range(num_qubits)]
+
+    for gate in gates:
+        spec = get_gate_spec(gate[0])
+        if spec.kernel is None:
+            continue
+        qubits, params = spec.split(gate)
+        if is_symbolic(params):
+            raise ValueError("Bind all parameters before computing amplitudes")
+        if gate[0] == "SWAP":
+            wires[qubits[0]], wires[qubits[1]] = wires[qubits[1]], wires[qubits[0]]
+            continue
+        matrix = spec.to_matrix(gate)
+        if matrix is None:
+            raise ValueError(f"Gate '{gate[0]}' has no matrix form")
+        k = len(qubits)
+        new = list(range(next_label, next_label + k))
+        next_label += k
+        tensors.append(np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k)))
+        labels.append((*new, *(wires[q] for q in qubits)))
+        for qubit, label in zip(qubits, new):
+            wires[qubit] = label
+
+    return ContractionPlan(num_qubits, tensors, labels, wires, max_size)
+
+
+def _result_labels(first: Tuple[int, ...], second: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Labels left after contracting two tensors: the unshared ones."""
+    return tuple(l for l in first if l not in second) + tuple(
+        l for l in second if l not in first
+    )
+
+
+def _greedy_path(labels: List[Tuple[int, ...]]) -> List[Tuple[int, int]]:
+    """
+    Greedy contraction order.
+
+    Every index joins exactly two tensors, so contracting a pair sums
+    the indices they share. Each step contracts the connected pair that
+    shrinks the network most (size of result minus sizes of inputs),
+    and disconnected pieces are multiplied together at the end.
+
+    Args:
+        labels: Index labels of each tensor
+
+    Returns:
+        Pairs of tensor ids, new tensors numbered after the inputs
+    """
+    alive: Dict[int, Tuple[int, ...]] = dict(enumerate(labels))
+    owners: Dict[int, List[int]] = {}
+    for tensor, tensor_labels in alive.items():
+        for label in tensor_labels:
+            owners.setdefault(label, []).append(tensor)
+
+    heap: List[Tuple[int, int, int, int]] = []
+
+    def push(a: int, b: int) -> None:
+        out = _result_labels(alive[a], alive[b])
+        cost = (1 << len(out)) - (1 << len(alive[a])) - (1 << len(alive[b]))
+        heapq.heappush(heap, (cost, len(out), min(a, b), max(a, b)))
+
+    for tensors in owners.values():
+        if len(tensors) == 2:
+            push(*tensors)
+
+    path: List[Tuple[int, int]] = []
+    next_id = len(labels)
+    while heap:
+        _, _, a, b = heapq.heappop(heap)
+        if a not in alive or b not in alive:
+            continue
+        out = _result_labels(alive.pop(a), alive.pop(b))
+        alive[next_id] = out
+        path.append((a, b))
+        neighbours: Set[int] = set()
+        for label in out:
+            tensors = [t for t in owners[label] if t not in (a, b)] + [next_id]
+            owners[label] = tensors
+            neighbours.update(t for t in tensors if t != next_id)
+        for neighbour in sorted(neighbours):
+            push(next_id, neighbour)
+        next_id += 1
+
+    # Disconnected components: multiply the leftovers, smallest first
+    remaining = sorted(alive, key=lambda t: len(alive[t]))
+    while len(remaining) > 1:
+        a, b = remaining[0], remaining[1]
+        path.append((a, b))
+        alive[next_id] = alive.pop(a) + alive.pop(b)
+        remaining = sorted(alive, key=lambda t: len(alive[t]))
+        next_id += 1
+    return path
+
+
+def _slice(
+    tensor: np.ndarray, labels: Tuple[int, ...], fixed: Dict[int, int]
+) -> Tuple[np.ndarray, Tuple[int, ...]]:
+    """Fix sliced indices of a tensor to their values."""
+    if not fixed or not any(label in fixed for label in labels):
+        return tensor, labels
+    index = tuple(fixed.get(label, slice(None)) for label in labels)
+    return tensor[index], tuple(label for label in labels if label not in fixed)
+
+
+def _contract(
+    a: np.ndarray,
+    a_labels: Tuple[int, ...],
+    b: np.ndarray,
+    b_labels: Tuple[int, ...],
+) -> Tuple[np.ndarray, Tuple[int, ...]]:
+    """
+    Contract two tensors over their shared indices as one batched matmul.
+
+    The batch label, when both tensors carry it, is kept rather than
+    summed.
+
+    Returns:
+        Tuple of (result, its labels)
+    """
+    batch = [l for l in a_labels if l == _BATCH and l in b_labels]
+    shared = [l for l in a_labels if l in b_labels and l != _BATCH]
+    free_a = [l for l in a_labels if l not in b_labels]
+    free_b = [l for l in b_labels if l not in a_labels]
+
+    dims = dict(zip(a_labels, a.shape))
+    dims.update(zip(b_labels, b.shape))
+
+    def size(group: List[int]) -> int:
+        return int(np.prod([dims[l] for l in group], dtype=np.int64))
+
+    left = a.transpose([a_labels.index(l) for l in batch + free_a + shared])
+    right = b.transpose([b_labels.index(l) for l in batch + shared + free_b])
+    result = np.matmul(
+        left.reshape(size(batch), size(free_a), size(shared)),
+        right.reshape(size(batch), size(shared), size(free_b)),
+    )
+    labels = batch + free_a + free_b
+    return result.reshape([dims[l] for l in labels]), tuple(labels)
+
+
+def parse_bitstrings(bitstrings: Sequence[str], num_qubits: int) -> np.ndarray:
+    """
+    Validate bitstrings and convert them to a 0/1 array.
+
+    Args:
+        bitstrings: Strings of '0' and '1', qubit 0 first
+        num_qubits: Expected length
+
+    Returns:
+        (len(bitstrings), num_qubits) integer array
+    """
+    for bitstring in bitstrings:
+        if len(bitstring) != num_qubits or set(bitstring) - {"0", "1"}:
+            raise ValueError(
+                f"Bitstring '{bitstring}' is not {num_qubits} characters of 0/1"
+            )
+    if not bitstrings:
+        return np.zeros((0, num_qubits), dtype=np.intp)
+    return np.frombuffer("".join(bitstrings).encode(), dtype=np.uint8).reshape(
+        len(bitstrings), num_qubits
+    ).astype(np.intp) - ord("0")
+
+
+__all__ = ["ContractionPlan", "DEFAULT_MAX_SIZE", "build_plan", "parse_bitstrings"]
@@ -0,0 +1,464 @@
+"""
+Circuit optimization passes for quantIQ
+
+Passes rewrite a circuit's gate list before simulation so the statevector
+is swept fewer times. They work on gate tuples and return a new list plus
+a dictionary of statistics.
+"""
+
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .compiler import get_gate_spec
+from .kernels import embed_matrix
+
+# Gates that are their own inverse, so two in a row cancel
+SELF_INVERSE = {"H", "X", "Y", "Z", "CX", "CZ", "SWAP", "CCX", "MCX"}
+
+# Gates that are diagonal in the computational basis
+DIAGONAL = {"Z", "S", "T", "RZ", "CZ"}
+
+# Gates whose leading qubits are controls and last qubit is the target
+CONTROLLED = {"CX", "CCX", "MCX", "CU"}
+
+# Phase angle of the diagonal single-qubit gates diag(1, e^{i phi})
+PHASES = {"Z": np.pi, "S": np.pi / 2, "T": np.pi / 4}
+
+
+def fuse_gates(
+    num_qubits: int, gates: Sequence[Tuple], max_qubits: int = 2
+) -> Tuple[List[Tuple], Dict[str, int]]:
+    """
+    Merge neighbouring gates into larger unitaries.
+
+    Runs of single-qubit gates on the same qubit are multiplied into one
+    2x2, and single-qubit gates are absorbed into adjacent multi-qubit
+    blocks of up to ``max_qubits`` qubits. Each fused block becomes one
+    ``UNITARY`` gate, so it costs a single pass over the statevector.
+    Gates without a matrix form, or wider than ``max_qubits``, are left
+    in place and act as barriers on their qubits.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        max_qubits: Largest block to fuse into (1 fuses single-qubit runs only)
+
+    Returns:
+        Tuple of (fused gate list, stats) where stats has the keys
+        gates_before, gates_after and fused_gates
+    """
+    if max_qubits < 1:
+        raise ValueError("max_qubits must be at least 1")
+
+    # Each block is [qubits, matrix, source gates]; matrix is None for barriers
+    blocks: List[list] = []
+    last: Dict[int, int] = {}
+    pending: Dict[int, list] = {}
+
+    def flush(qubit: int) -> None:
+        """Emit the pending single-qubit run on qubit."""
+        if qubit not in pending:
+            return
+        matrix, sources = pending.pop(qubit)
+        index = last.get(qubit)
+        if index is not None and blocks[index][1] is not None:
+            # Nothing after the block touches qubit, so the run folds into it
+            block = blocks[index]
+            block[1] = embed_matrix(matrix, (qubit,), block[0]) @ block[1]
+            block[2].extend(sources)
+        else:
+            blocks.append([(qubit,), matrix, sources])
+            last[qubit] = len(blocks) - 1
+
+    for gate in gates:
+        spec = get_gate_spec(gate[0])
+        qubits, _ = spec.split(gate)
+        matrix = spec.to_matrix(gate) if spec.kernel is not None else None
+
+        if matrix is None or len(qubits) > max_qubits:
+            # Barrier: keep the gate as is
+            touched = qubits if qubits else tuple(range(num_qubits))
+            for qubit in touched:
+                flush(qubit)
+            blocks.append([tuple(touched), None, [gate]])
+            for qubit in touched:
+                last[qubit] = len(blocks) - 1
+            continue
+
+        if len(qubits) == 1:
+            qubit = qubits[0]
+            if qubit in pending:
+                pending[qubit][0] = matrix @ pending[qubit][0]
+                pending[qubit][1].append(gate)
+            else:
+                pending[qubit] = [matrix, [gate]]
+            continue
+
+        sources = []
+        for qubit in qubits:
+            if qubit in pending:
+                run, run_sources = pending.pop(qubit)
+                matrix = matrix @ embed_matrix(run, (qubit,), qubits)
+                sources.extend(run_sources)
+        sources.append(gate)
+
+        previous = {last[q] for q in qubits if q in last}
+        merged = False
+        if len(previous) == 1:
+            index = previous.pop()
+            block = blocks[index]
+            union = block[0] + tuple(q for q in qubits if q not in block[0])
+            if block[1] is not None and len(union) <= max_qubits:
+                block[1] = embed_matrix(matrix, qubits, union) @ embed_matrix(
+                    block[1], block[0], union
+                )
+                block[0] = union
+                block[2].extend(sources)
+                for qubit in qubits:
+                    last[qubit] = index
+                merged = True
+        if not merged:
+            blocks.append([tuple(qubits), matrix, sources])
+            for qubit in qubits:
+                last[qubit] = len(blocks) - 1
+
+    for qubit in sorted(pending):
+        flush(qubit)
+
+    fused: List[Tuple] = []
+    for qubits, matrix, sources in blocks:
+        if matrix is None or len(sources) == 1:
+            fused.extend(sources)
+        else:
+            fused.append(("UNITARY", *qubits, matrix))
+
+    stats = {
+        "gates_before": len(gates),
+        "gates_after": len(fused),
+        "fused_gates": len(gates) - len(fused),
+    }
+    return fused, stats
+
+
+def _qubits(num_qubits: int, gate: Tuple) -> Tuple[int, ...]:
+    """Qubits a gate acts on; kernel-less gates such as MEASURE_ALL span all."""
+    qubits, _ = get_gate_spec(gate[0]).split(gate)
+    return qubits if qubits else tuple(range(num_qubits))
+
+
+def _phase(gate: Tuple) -> Optional[float]:
+    """Angle phi if gate is diag(1, e^{i phi}) on one qubit, else None."""
+    if gate[0] in PHASES:
+        return PHASES[gate[0]]
+    if gate[0] == "UNITARY" and len(gate) == 3:
+        matrix = gate[2]
+        if np.allclose([matrix[0, 1], matrix[1, 0], matrix[0, 0]], [0, 0, 1]):
+            return float(np.angle(matrix[1, 1]))
+    return None
+
+
+def _controls(gate: Tuple) -> Tuple[frozenset, Optional[int]]:
+    """Control qubits and target of a controlled gate (CZ is all controls)."""
+    if gate[0] == "CZ":
+        return frozenset(gate[1:3]), None
+    if gate[0] in CONTROLLED:
+        qubits, _ = get_gate_spec(gate[0]).split(gate)
+        return frozenset(qubits[:-1]), qubits[-1]
+    return frozenset(), None
+
+
+def commutes(num_qubits: int, first: Tuple, second: Tuple) -> bool:
+    """
+    Conservative test of whether two gates commute.
+
+    Besides gates on disjoint qubits, this knows that diagonal gates
+    commute with each other and with the controls of controlled gates,
+    that X commutes with a CX-family target, and that CX-family gates
+    sharing only controls or only targets commute.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        first: Gate tuple
+        second: Gate tuple
+
+    Returns:
+        True if the gates are known to commute
+    """
+    qubits1 = set(_qubits(num_qubits, first))
+    qubits2 = set(_qubits(num_qubits, second))
+    if not qubits1 & qubits2:
+        return True
+    if first[0] == "MEASURE_ALL" or second[0] == "MEASURE_ALL":
+        return False
+
+    diagonal1 = first[0] in DIAGONAL or _phase(first) is not None
+    diagonal2 = second[0] in DIAGONAL or _phase(second) is not None
+    if diagonal1 and diagonal2:
+        return True
+
+    for gate, other, other_qubits, diagonal in [
+        (first, second, qubits2, diagonal2),
+        (second, first, qubits1, diagonal1),
+    ]:
+        controls, target = _controls(gate)
+        if not controls:
+            continue
+        shared = other_qubits & set(_qubits(num_qubits, gate))
+        # Diagonal gates only touching controls
+        if diagonal and shared <= controls:
+            return True
+        # X on the target of a CX-family gate
+        if other[0] == "X" and gate[0] != "CU" and shared == {target}:
+            return True
+
+    if first[0] in CONTROLLED - {"CU"} and second[0] in CONTROLLED - {"CU"}:
+        controls1, target1 = _controls(first)
+        controls2, target2 = _controls(second)
+        return target1 not in controls2 and target2 not in controls1
+
+    return False
+
+
+def _same_operation(first: Tuple, second: Tuple) -> bool:
+    """Whether two self-inverse gates are the same operation."""
+    if first[0] != second[0]:
+        return False
+    if first[0] in ("CZ", "SWAP"):
+        return set(first[1:]) == set(second[1:])
+    if first[0] in ("CCX", "MCX"):
+        return first[-1] == second[-1] and set(first[1:-1]) == set(second[1:-1])
+    return first == second
+
+
+_KEEP = object()
+
+
+def _cancel_rule(first: Tuple, second: Tuple) -> Any:
+    """Drop both gates when they are the same self-inverse operation."""
+    if first[0] in SELF_INVERSE and _same_operation(first, second):
+        return None
+    return _KEEP
+
+
+def _merge_diagonal_rule(first: Tuple, second: Tuple) -> Any:
+    """Merge two diagonal phase gates on the same qubit into one."""
+    phase1, phase2 = _phase(first), _phase(second)
+    if phase1 is None or phase2 is None or first[1] != second[1]:
+        return _KEEP
+    phase = (phase1 + phase2) % (2 * np.pi)
+    for name, value in PHASES.items():
+        if np.isclose(phase, value):
+            return (name, first[1])
+    if np.isclose(phase, 0) or np.isclose(phase, 2 * np.pi):
+        return None
+    return ("UNITARY", first[1], np.diag([1, np.exp(1j * phase)]))
+
+
+def _peephole(
+    num_qubits: int, gates: Sequence[Tuple], rule: Callable[[Tuple, Tuple], Any]
+) -> List[Tuple]:
+    """
+    Combine each gate with an earlier one it can commute back to.
+
+    For every gate, earlier gates sharing a qubit are visited newest first
+    while they commute with it; the first one the rule combines with
+    absorbs it (or both vanish when the rule returns None).
+    """
+    out: List[Optional[Tuple]] = []
+    on_qubit: Dict[int, List[int]] = {q: [] for q in range(num_qubits)}
+
+    for gate in gates:
+        qubits = _qubits(num_qubits, gate)
+        placed = False
+        seen = set()
+        candidates = heapq.merge(*(reversed(on_qubit[q]) for q in qubits), reverse=True)
+        for index in candidates:
+            previous = out[index]
+            if index in seen or previous is None:
+                continue
+            seen.add(index)
+            combined = rule(previous, gate)
+            if combined is not _KEEP:
+                out[index] = combined
+                placed = True
+                break
+            if not commutes(num_qubits, previous, gate):
+                break
+        if not placed:
+            out.append(gate)
+            for qubit in qubits:
+                on_qubit[qubit].append(len(out) - 1)
+
+    return [gate for gate in out if gate is not None]
+
+
+def cancel_inverses(num_qubits: int, gates: Sequence[Tuple]) -> List[Tuple]:
+    """
+    Remove pairs of self-inverse gates, looking through commuting gates.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples
+
+    Returns:
+        Gate list with cancelling pairs removed
+    """
+    return _peephole(num_qubits, gates, _cancel_rule)
+
+
+def merge_diagonal(num_qubits: int, gates: Sequence[Tuple]) -> List[Tuple]:
+    """
+    Merge Z, S, T and diagonal phase gates that meet on the same qubit.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples
+
+    Returns:
+        Gate list with each group of commuting phase gates as one gate
+    """
+    return _peephole(num_qubits, gates, _merge_diagonal_rule)
+
+
+PASSES: Dict[str, Callable[[int, Sequence[Tuple]], List[Tuple]]] = {
+    "cancel": cancel_inverses,
+    "merge_diagonal": merge_diagonal,
+}
+
+
+def circuit_depth(num_qubits: int, gates: Sequence[Tuple]) -> int:
+    """
+    Number of layers when every gate is scheduled as early as possible.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples
+
+    Returns:
+        Circuit depth
+    """
+    layers = [0] * num_qubits
+    for gate in gates:
+        qubits = _qubits(num_qubits, gate)
+        layer = max(layers[q] for q in qubits) + 1
+        for qubit in qubits:
+            layers[qubit] = layer
+    return max(layers, default=0)
+
+
+def lightcone(
+    num_qubits: int, gates: Sequence[Tuple], measured: Sequence[int]
+) -> Tuple[List[Tuple], List[int], Dict[str, int]]:
+    """
+    Keep only the gates inside the backward lightcone of measured qubits.
+
+    Walking back from the end of the circuit, a gate is kept when it
+    touches a qubit already in the lightcone, and its qubits then join
+    the lightcone. Qubits left untouched by the kept gates are dropped and
+    the rest renumbered 0..m-1 in their original order, so the simulated
+    register only spans the qubits that can affect the readout. Measured
+    qubits that no kept gate touches stay in |0⟩ and are dropped too.
+
+    Args:
+        num_qubits: Number of qubits in the circuit
+        gates: Gate tuples (name, *qubits, *params)
+        measured: Qubits read out at the end of the circuit
+
+    Returns:
+        Tuple of (kept gates over the compacted register, original index
+        of each compacted qubit, stats with the keys pruned_gates and
+        pruned_qubits)
+    """
+    active = set(measured)
+    kept: List[Tuple] = []
+    simulated = 0
+    for gate in reversed(gates):
+        spec = get_gate_spec(gate[0])
+        if spec.kernel is None:
+            continue
+        simulated += 1
+        qubits, _ = spec.split(gate)
+        if active.intersection(qubits):
+            kept.append(gate)
+            active.update(qubits)
+    kept.reverse()
+
+    register = sorted(
+        {q for gate in kept for q in get_gate_spec(gate[0]).split(gate)[0]}
+    )
+    if not register:
+        # Nothing to simulate; keep one measured qubit so the register is valid
+        register = [min(measured)]
+    remap = {q: i for i, q in enumerate(register)}
+
+    compacted = []
+    for gate in kept:
+        qubits, params = get_gate_spec(gate[0]).split(gate)
+        compacted.append((gate[0], *(remap[q] for q in qubits), *params))
+
+    stats = {
+        "pruned_gates": simulated - len(kept),
+        "pruned_qubits": num_qubits - len(register),
+    }
+    return compacted, register, stats
+
+
+def transpile(
+    circuit: Any,
+    passes: Sequence[str] = ("cancel", "merge_diagonal"),
+    max_iterations: int = 10,
+) -> Tuple[Any, Dict[str, int]]:
+    """
+    Run peephole optimization passes until the circuit stops shrinking.
+
+    Args:
+        circuit: QuantumCircuit to optimize (left unchanged); dynamic
+            circuits are rejected, as the passes ignore measurements,
+            resets and conditions
+        passes: Names of passes from ``PASSES``, applied in order
+        max_iterations: Upper bound on rounds over the whole pipeline
+
+    Returns:
+        Tuple of (new circuit, stats) where stats has the keys
+        gates_before, gates_after, gates_removed, depth_before and
+        depth_after
+    """
+    unknown = [name for name in passes if name not in PASSES]
+    if unknown:
+        raise ValueError(f"Unknown passes: {unknown}. Available: {list(PASSES)}")
+    circuit._require_static()
+
+    num_qubits = circuit.num_qubits
+    gates = list(circuit.gates)
+    for _ in range(max_iterations):
+        size = len(gates)
+        for name in passes:
+            gates = PASSES[name](num_qubits, gates)
+        if len(gates) == size:
+            break
+
+    optimized = type(circuit)(num_qubits)
+    for gate in gates:
+        optimized.append(*gate)
+
+    stats = {
+        "gates_before": len(circuit.gates),
+        "gates_after": len(gates),
+        "gates_removed": len(circuit.gates) - len(gates),
+        "depth_before": circuit_depth(num_qubits, circuit.gates),
+        "depth_after": circuit_depth(num_qubits, gates),
+    }
+    return optimized, stats
+
+
+__all__ = [
+    "cancel_inverses",
+    "circuit_depth",
+    "commutes",
+    "fuse_gates",
+    "lightcone",
+    "merge_diagonal",
+    "transpile",
+]
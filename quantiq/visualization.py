@@ -2,7 +2,7 @@
 Circuit and result visualization utilities
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from .results import Result
 
@@ -59,10 +59,36 @@ class CircuitDrawer:
                 control, target = gate[1], gate[2]
                 self._add_cx_gate(wires, control, target)
 
+            elif gate_type == "CZ":
+                self._add_multi_qubit_gate(wires, {gate[1]: "●", gate[2]: "●"})
+
+            elif gate_type == "SWAP":
+                self._add_multi_qubit_gate(wires, {gate[1]: "×", gate[2]: "×"})
+
+            elif gate_type in ["CCX", "MCX"]:
+                symbols = {control: "●" for control in gate[1:-1]}
+                symbols[gate[-1]] = "⊕"
+                self._add_multi_qubit_gate(wires, symbols)
+
+            elif gate_type == "CU":
+                self._add_multi_qubit_gate(wires, {gate[1]: "●", gate[2]: "[U]"})
+
             elif gate_type == "MEASURE_ALL":
                 # Measurement
                 self._add_measurement(wires)
 
+            elif gate_type == "MEASURE":
+                self._add_measurement(wires, gate[1:])
+
+            elif len(gate) == 2:
+                # Custom single-qubit gate
+                self._add_single_qubit_gate(wires, gate_type, gate[1])
+
+            elif len(gate) > 2:
+                # Custom multi-qubit gate, boxed on every qubit it touches
+                label = f"[{gate_type}]"
+                self._add_multi_qubit_gate(wires, {q: label for q in gate[1:]})
+
         # Add final connections
         for i in range(self.num_qubits):
             wires[i] += "─"
@@ -94,33 +120,37 @@ class CircuitDrawer:
 
     def _add_cx_gate(self, wires: List[str], control: int, target: int) -> None:
         """Add CNOT gate to diagram."""
+        self._add_multi_qubit_gate(wires, {control: "●", target: "⊕"})
+
+    def _add_multi_qubit_gate(self, wires: List[str], symbols: Dict[int, str]) -> None:
+        """Add a gate drawn as symbols on several wires joined vertically."""
         # Pad all wires to align
         max_len = max(len(w) for w in wires)
         for i in range(self.num_qubits):
             while len(wires[i]) < max_len:
                 wires[i] += "─"
 
-        # Add control and target symbols
-        wires[control] += "●─"
-        wires[target] += "⊕─"
-
-        # Add vertical connections
-        min_qubit = min(control, target)
-        max_qubit = max(control, target)
+        width = max(len(symbol) for symbol in symbols.values())
+        min_qubit = min(symbols)
+        max_qubit = max(symbols)
 
         for i in range(self.num_qubits):
-            if min_qubit < i < max_qubit:
-                wires[i] += "│─"
-            elif i not in [control, target]:
-                wires[i] += "──"
-
-    def _add_measurement(self, wires: List[str]) -> None:
-        """Add measurement symbols to diagram."""
+            if i in symbols:
+                wires[i] += symbols[i].ljust(width, "─") + "─"
+            elif min_qubit < i < max_qubit:
+                wires[i] += "│".ljust(width, "─") + "─"
+            else:
+                wires[i] += "─" * (width + 1)
+
+    def _add_measurement(
+        self, wires: List[str], qubits: Optional[Sequence[int]] = None
+    ) -> None:
+        """Add measurement symbols to diagram, on every wire by default."""
         max_len = max(len(w) for w in wires)
         for i in range(self.num_qubits):
             while len(wires[i]) < max_len:
                 wires[i] += "─"
-            wires[i] += "[M]"
+            wires[i] += "[M]" if qubits is None or i in qubits else "───"
 
 
 class ResultVisualizer:
@@ -0,0 +1,274 @@
+"""Tests for circuit hashing and the final-statevector cache."""
+
+import numpy as np
+import pytest
+
+import quantiq.cache
+from quantiq import Parameter, QuantumCircuit
+from quantiq.cache import StatevectorCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Replace the process-wide cache with an empty one."""
+    fresh = StatevectorCache()
+    monkeypatch.setattr(quantiq.cache, "STATEVECTOR_CACHE", fresh)
+    return fresh
+
+
+def bell_circuit():
+    """Two-qubit Bell state preparation."""
+    return QuantumCircuit(2).h(0).cx(0, 1)
+
+
+class TestContentHash:
+    """Test that hashes follow circuit content."""
+
+    def test_equal_for_identical_circuits(self):
+        """Test that separately built circuits with the same gates match."""
+        first = QuantumCircuit(3).rx(0.5, 0).cx(0, 2)
+        second = QuantumCircuit(3).rx(np.float64(0.5), 0).cx(np.int64(0), 2)
+
+        assert first.content_hash() == second.content_hash()
+
+    def test_changes_with_content(self):
+        """Test that parameters, qubits and register size change the hash."""
+        base = QuantumCircuit(3).rx(0.5, 0).cx(0, 2).content_hash()
+
+        assert QuantumCircuit(3).rx(0.6, 0).cx(0, 2).content_hash() != base
+        assert QuantumCircuit(3).rx(0.5, 1).cx(0, 2).content_hash() != base
+        assert QuantumCircuit(3).rx(0.5, 0).cx(2, 0).content_hash() != base
+        assert QuantumCircuit(4).rx(0.5, 0).cx(0, 2).content_hash() != base
+
+    def test_updated_by_new_gates(self):
+        """Test that appending a gate invalidates the stored hash."""
+        circuit = bell_circuit()
+        before = circuit.content_hash()
+
+        circuit.x(1)
+
+        assert circuit.content_hash() != before
+
+    def test_measurements_ignored(self):
+        """Test that measurement markers don't change the hash."""
+        assert (
+            bell_circuit().measure_all().content_hash() == bell_circuit().content_hash()
+        )
+
+    def test_symbolic_parameters(self):
+        """Test that unbound parameters hash by name."""
+        first = QuantumCircuit(1).rx(Parameter("a"), 0).content_hash()
+
+        assert QuantumCircuit(1).rx(Parameter("a"), 0).content_hash() == first
+        assert QuantumCircuit(1).rx(Parameter("b"), 0).content_hash() != first
+
+
+class TestStatevectorCache:
+    """Test cache hits, eviction and opt-out."""
+
+    def test_repeated_run_hits(self, cache):
+        """Test that the second run of an equal circuit reuses the state."""
+        first = bell_circuit().run(shots=100, seed=0)
+        second = bell_circuit().run(shots=100, seed=0)
+
+        assert first.metadata["cache_hit"] is False
+        assert second.metadata["cache_hit"] is True
+        assert dict(second.counts) == dict(first.counts)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_statevector_then_run(self, cache):
+        """Test that run() samples from a state computed by get_statevector()."""
+        circuit = bell_circuit()
+        statevector = circuit.get_statevector()
+
+        result = circuit.run(shots=50, seed=1)
+
+        assert result.metadata["cache_hit"] is True
+        assert np.allclose(statevector, [2**-0.5, 0, 0, 2**-0.5])
+        assert set(result.counts) <= {"00", "11"}
+
+    def test_results_match_uncached(self, cache):
+        """Test that cached sampling equals a fresh simulation."""
+        circuit = QuantumCircuit(3).h(0).ry(0.3, 1).cx(0, 2)
+        circuit.run(shots=10, seed=0)
+
+        cached = circuit.run(shots=1000, seed=4)
+        uncached = circuit.run(shots=1000, seed=4, cache=False)
+
+        assert cached.metadata["cache_hit"] is True
+        assert uncached.metadata["cache_hit"] is False
+        assert dict(cached.counts) == dict(uncached.counts)
+
+    def test_returned_statevector_is_a_copy(self, cache):
+        """Test that callers can't modify the cached state."""
+        circuit = bell_circuit()
+        circuit.get_statevector()[:] = 0
+
+        assert np.allclose(circuit.get_statevector(), [2**-0.5, 0, 0, 2**-0.5])
+
+    def test_lru_eviction_by_bytes(self, cache):
+        """Test that the least recently used state is dropped first."""
+        cache.max_bytes = 3 * 16 * 2**4
+        circuits = [QuantumCircuit(4).x(q) for q in range(4)]
+        for circuit in circuits[:3]:
+            circuit.get_statevector()
+        # Touch the oldest so the second becomes least recently used
+        circuits[0].get_statevector()
+
+        circuits[3].get_statevector()
+
+        assert cache.evictions == 1
+        assert cache.nbytes <= cache.max_bytes
+        assert (circuits[0].content_hash(), "double", True) in cache
+        assert (circuits[1].content_hash(), "double", True) not in cache
+
+    def test_oversized_state_not_stored(self, cache):
+        """Test that a state larger than the bound is skipped."""
+        cache.max_bytes = 16
+
+        bell_circuit().get_statevector()
+
+        assert len(cache) == 0
+
+    def test_opt_out_per_call(self, cache):
+        """Test that cache=False neither reads nor writes the cache."""
+        bell_circuit().run(shots=10, seed=0, cache=False)
+
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 0
+
+    def test_disabled_cache(self, cache):
+        """Test that a disabled cache never hits."""
+        cache.enabled = False
+        bell_circuit().run(shots=10, seed=0)
+
+        result = bell_circuit().run(shots=10, seed=0)
+
+        assert result.metadata["cache_hit"] is False
+        assert len(cache) == 0
+
+    def test_precision_is_part_of_key(self, cache):
+        """Test that single and double precision are cached separately."""
+        bell_circuit().get_statevector()
+
+        statevector = bell_circuit().get_statevector(precision="single")
+
+        assert statevector.dtype == np.complex64
+        assert len(cache) == 2
+
+    def test_clear(self, cache):
+        """Test that clear() empties the cache and resets counters."""
+        bell_circuit().run(shots=10, seed=0)
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "entries": 0,
+            "bytes": 0,
+        }
+
+
+class TestPrefixCheckpoints:
+    """Test resuming simulation from checkpointed circuit prefixes."""
+
+    def test_grown_circuit_resumes(self, cache):
+        """Test that each call only simulates the gates appended since."""
+        circuit = QuantumCircuit(3).h(0)
+        circuit.get_statevector()
+        circuit.cx(0, 1).ry(0.7, 2)
+
+        result = circuit.run(shots=100, seed=0)
+
+        assert result.metadata["resumed_gates"] == 1
+        expected = QuantumCircuit(3).h(0).cx(0, 1).ry(0.7, 2)
+        assert np.allclose(
+            circuit.get_statevector(), expected.get_statevector(cache=False)
+        )
+
+    def test_pruned_run_resumes(self, cache):
+        """Test that run() resumes when pruning drops an idle qubit."""
+        circuit = QuantumCircuit(3).h(0).cx(0, 1)
+        circuit.run(shots=10, seed=0)
+        circuit.x(1)
+
+        result = circuit.run(shots=100, seed=0)
+
+        assert result.metadata["pruned_qubits"] == 1
+        assert result.metadata["resumed_gates"] == 2
+        assert set(result.counts) == {"010", "100"}
+
+    def test_truncate_resumes_from_kept_prefix(self, cache):
+        """Test that editing the tail replays only the new gates."""
+        circuit = QuantumCircuit(2).h(0)
+        circuit.get_statevector()
+        circuit.cx(0, 1).x(1)
+        circuit.get_statevector()
+
+        circuit.truncate(1).y(1)
+        result = circuit.run(shots=10, seed=0)
+
+        assert result.metadata["resumed_gates"] == 1
+        assert circuit.gates == [("H", 0), ("Y", 1)]
+        assert circuit.content_hash() == QuantumCircuit(2).h(0).y(1).content_hash()
+        assert np.allclose(circuit.get_statevector(), [0, 1j, 0, 1j] / np.sqrt(2))
+
+    def test_truncate_after_single_full_run(self, cache):
+        """Test that one full simulation leaves prefixes to resume from."""
+        circuit = QuantumCircuit(3)
+        for i in range(40):
+            circuit.ry(0.1 * i, i % 3).cx(i % 3, (i + 1) % 3)
+        circuit.run(shots=10, seed=0)
+
+        circuit.truncate(77).x(0)
+        result = circuit.run(shots=10, seed=0)
+
+        # Checkpoints sit 16, 32 and 64 gates before the old end of 80
+        assert result.metadata["resumed_gates"] == 64
+        expected = QuantumCircuit(3)
+        for gate in circuit.gates:
+            expected.append(*gate)
+        assert np.allclose(
+            circuit.get_statevector(), expected.get_statevector(cache=False)
+        )
+
+    def test_intermediate_checkpoints_fit_budget(self, cache):
+        """Test that intermediate prefixes leave room for the final state."""
+        circuit = QuantumCircuit(3)
+        circuit.checkpoints.max_bytes = 2 * 16 * 2**3
+        for i in range(40):
+            circuit.h(i % 3)
+
+        circuit.get_statevector()
+
+        assert len(circuit.checkpoints) == 2
+        assert circuit.checkpoints.evictions == 0
+
+    def test_truncate_out_of_range(self):
+        """Test that truncate() only shortens the gate list."""
+        circuit = QuantumCircuit(1).h(0)
+        with pytest.raises(ValueError, match="Cannot keep 2 of 1"):
+            circuit.truncate(2)
+
+    def test_budget_evicts_old_prefixes(self, cache):
+        """Test that checkpoints stay within the circuit's byte budget."""
+        circuit = QuantumCircuit(3)
+        circuit.checkpoints.max_bytes = 2 * 16 * 2**3
+        for q in range(3):
+            circuit.h(q).get_statevector()
+
+        assert len(circuit.checkpoints) == 2
+        assert circuit.checkpoints.evictions == 1
+
+    def test_opt_out_skips_checkpoints(self, cache):
+        """Test that cache=False neither resumes nor stores prefixes."""
+        circuit = QuantumCircuit(2).h(0)
+        circuit.get_statevector()
+        circuit.x(1)
+
+        result = circuit.run(shots=10, seed=0, cache=False)
+
+        assert "resumed_gates" not in result.metadata
+        assert len(circuit.checkpoints) == 1
@@ -0,0 +1,72 @@
+"""Tests for circuit compilation and the gate registry."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit, register_gate
+from quantiq.compiler import compile_gates, get_gate_spec
+
+SX = np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2
+ISWAP = np.array(
+    [[1, 0, 0, 0], [0, 0, 1j, 0], [0, 1j, 0, 0], [0, 0, 0, 1]], dtype=complex
+)
+
+register_gate("SX_TEST", SX)
+register_gate("ISWAP_TEST", ISWAP)
+
+
+class TestCompile:
+    """Test lowering of gate lists to instruction arrays."""
+
+    def test_instruction_arrays(self):
+        """Test opcodes, padded operands and the shared matrix table."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0).h(1).cx(0, 1).ccx(0, 1, 2).measure_all()
+        program = circuit.compile()
+
+        assert len(program) == 4  # MEASURE_ALL lowers to nothing
+        assert program.opcodes.tolist() == [
+            get_gate_spec(name).opcode for name in ["H", "H", "CX", "CCX"]
+        ]
+        assert program.operands.tolist() == [
+            [0, -1, -1],
+            [1, -1, -1],
+            [0, 1, -1],
+            [0, 1, 2],
+        ]
+        assert program.matrix_ids[0] == program.matrix_ids[1]
+
+    def test_cache_invalidated_on_append(self):
+        """Test that the compiled program is cached until a gate is added."""
+        circuit = QuantumCircuit(2).h(0)
+        program = circuit.compile()
+        assert circuit.compile() is program
+
+        circuit.cx(0, 1)
+        assert circuit.compile() is not program
+        assert len(circuit.compile()) == 2
+
+    def test_unknown_gate_raises_error(self):
+        """Test that unregistered gate names are rejected."""
+        with pytest.raises(ValueError):
+            compile_gates(1, [("NOPE", 0)])
+
+
+class TestRegistry:
+    """Test custom gates added through the registry."""
+
+    def test_custom_single_qubit_gate(self):
+        """Test that a registered 2x2 gate runs and draws."""
+        circuit = QuantumCircuit(1).append("SX_TEST", 0).append("SX_TEST", 0)
+        assert np.allclose(circuit.get_statevector(), [0, 1])
+        assert "[SX_TEST]" in circuit.draw()
+
+    def test_custom_two_qubit_gate(self):
+        """Test that a registered 4x4 gate runs on the k-qubit kernel."""
+        circuit = QuantumCircuit(2).x(1).append("ISWAP_TEST", 1, 0)
+        assert np.allclose(circuit.get_statevector(), [0, 0, 1j, 0])
+
+    def test_duplicate_registration_raises_error(self):
+        """Test that built-in gates can't be overwritten."""
+        with pytest.raises(ValueError):
+            register_gate("H", SX)
@@ -0,0 +1,124 @@
+"""Tests for the sharded multi-process simulator."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit, Simulator
+from quantiq.distributed import DistributedSimulator
+from quantiq.gates import H, X
+
+from .test_outofcore import layered_circuit
+from .test_simulator import random_unitary
+
+
+@pytest.fixture(params=["pipe", "socket"])
+def transport(request):
+    """Both built-in transports."""
+    return request.param
+
+
+class TestDistributedSimulator:
+    """Test sharded execution against the in-memory simulator."""
+
+    @pytest.mark.parametrize("shards", [1, 2, 4])
+    def test_matches_in_memory(self, shards, transport):
+        """Test local, global and controlled gates across shard counts."""
+        circuit = layered_circuit(5)
+        options = {"shards": shards, "transport": transport}
+
+        statevector = circuit.get_statevector(
+            fuse=False, backend="distributed", backend_options=options
+        )
+        assert np.allclose(statevector, circuit.get_statevector(fuse=False))
+
+    def test_global_controls_and_relabeling(self, transport):
+        """Test gates whose controls and targets start on global qubits."""
+        distributed = DistributedSimulator(4, shards=4, transport=transport)
+        serial = Simulator(4)
+        unitary = random_unitary(4, seed=2)
+        try:
+            for simulator in (distributed, serial):
+                simulator.apply_gate(H, 0)
+                simulator.apply_gate(H, 3)
+                simulator.apply_controlled_gate(X, [0], 1)
+                simulator.apply_swap(1, 3)
+                simulator.apply_controlled_gate(random_unitary(2), [0, 1], 2)
+                simulator.apply_unitary(unitary, [1, 0])
+
+            assert distributed.layout != list(range(4))
+            assert np.allclose(distributed.get_statevector(), serial.statevector)
+            assert distributed.expectation("ZIIZ") == pytest.approx(
+                serial.expectation("ZIIZ")
+            )
+        finally:
+            distributed.close()
+
+    def test_merged_counts(self, transport):
+        """Test that per-shard counts merge into one GHZ Result."""
+        circuit = QuantumCircuit(5).h(0)
+        for q in range(4):
+            circuit.cx(q, q + 1)
+
+        result = circuit.run(
+            shots=1000,
+            seed=5,
+            backend="distributed",
+            backend_options={"shards": 4, "transport": transport},
+        )
+        assert set(result.counts) == {"00000", "11111"}
+        assert result.shots == 1000
+
+    def test_run_stops_ranks(self, monkeypatch):
+        """Test that run() and get_statevector() stop their rank processes."""
+        created = []
+        original = QuantumCircuit._make_simulator
+
+        def make_simulator(circuit, *args, **kwargs):
+            created.append(original(circuit, *args, **kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(QuantumCircuit, "_make_simulator", make_simulator)
+        circuit = QuantumCircuit(3).h(0).cx(0, 1).x(2)
+        options = {"shards": 2}
+
+        circuit.run(
+            shots=10, fuse=False, backend="distributed", backend_options=options
+        )
+        circuit.get_statevector(
+            fuse=False, backend="distributed", backend_options=options
+        )
+
+        assert len(created) == 2
+        for simulator in created:
+            assert not any(process.is_alive() for process in simulator._processes)
+
+    def test_reset(self):
+        """Test that reset restores |0...0> and the identity layout."""
+        simulator = DistributedSimulator(3, shards=2)
+        try:
+            simulator.apply_gate(X, 0)
+            simulator.apply_swap(0, 2)
+            simulator.reset()
+
+            assert simulator.layout == [0, 1, 2]
+            assert simulator.get_statevector()[0] == 1
+        finally:
+            simulator.close()
+
+    def test_invalid_configuration(self):
+        """Test rejection of bad shard counts, too-wide gates and forks."""
+        with pytest.raises(ValueError):
+            DistributedSimulator(3, shards=3)
+        with pytest.raises(ValueError):
+            DistributedSimulator(2, shards=4)
+
+        simulator = DistributedSimulator(3, shards=4)
+        try:
+            with pytest.raises(ValueError):
+                simulator.apply_unitary(random_unitary(4), [0, 1])
+            with pytest.raises(ValueError, match="can't be forked"):
+                simulator.fork()
+            with pytest.raises(ValueError, match="no snapshots"):
+                simulator.snapshot()
+        finally:
+            simulator.close()
@@ -0,0 +1,161 @@
+"""Tests for mid-circuit measurement, reset and shot branching."""
+
+import numpy as np
+import pytest
+
+from quantiq import Parameter, QuantumCircuit
+from quantiq.dynamic import plan_dynamic
+
+
+def teleport_circuit(theta):
+    """Teleport ry(theta)|0> from qubit 0 to qubit 2."""
+    circuit = QuantumCircuit(3).ry(theta, 0)
+    circuit.h(1).cx(1, 2).cx(0, 1).h(0).measure([0, 1])
+    circuit.x(2).c_if(1).z(2).c_if(0)
+    return circuit.measure(2)
+
+
+class TestDynamicCircuits:
+    """Test results of circuits sampled by shot branching."""
+
+    def test_teleportation(self):
+        """Test that corrections conditioned on measurements are applied."""
+        theta = 1.1
+        result = teleport_circuit(theta).run(shots=20000, seed=1)
+
+        ones = result.marginal([2]).counts.get("1", 0) / 20000
+        assert ones == pytest.approx(np.sin(theta / 2) ** 2, abs=0.015)
+        assert result.metadata["branches"] == 4
+
+    def test_condition_on_zero(self):
+        """Test that c_if(q, 0) runs only where the qubit read 0."""
+        circuit = QuantumCircuit(2).h(0).measure(0).x(1).c_if(0, 0).measure(1)
+
+        result = circuit.run(shots=500, seed=0)
+
+        assert set(result.counts) == {"01", "10"}
+
+    def test_measure_then_rotate(self):
+        """Test that a mid-circuit measurement destroys coherence."""
+        circuit = QuantumCircuit(1).h(0).measure(0).h(0).measure(0)
+
+        result = circuit.run(shots=4000, seed=3)
+
+        # Without the first measurement H H would always give 0
+        assert 1800 < result.counts["1"] < 2200
+
+    def test_reset_reuses_qubit(self):
+        """Test that reset returns an entangled qubit to |0>."""
+        circuit = QuantumCircuit(2).h(0).cx(0, 1).reset(0).measure([0, 1])
+
+        result = circuit.run(shots=2000, seed=5)
+
+        assert set(result.counts) == {"00", "01"}
+        assert result.metadata["merged_branches"] == 0
+
+    def test_identical_branches_merge(self):
+        """Test that resetting an unentangled qubit merges its branches."""
+        circuit = QuantumCircuit(2).x(1)
+        for _ in range(5):
+            circuit.h(0).reset(0)
+
+        result = circuit.run(shots=1000, seed=0)
+
+        assert dict(result.counts) == {"01": 1000}
+        assert result.metadata["merged_branches"] == 5
+
+    def test_branches_bounded_by_outcomes(self):
+        """Test that branch count follows distinct outcomes, not shots."""
+        circuit = QuantumCircuit(4)
+        for q in range(3):
+            circuit.h(q)
+        circuit.measure([0, 1, 2])
+        for q in range(3):
+            circuit.cx(q, 3).c_if(q)
+
+        result = circuit.run(shots=100000, seed=2)
+
+        assert result.metadata["branches"] == 8
+        assert sum(result.counts.values()) == 100000
+
+    def test_reproducible_with_seed(self):
+        """Test that a seed fixes every branching decision."""
+        circuit = teleport_circuit(0.4)
+
+        first = circuit.run(shots=300, seed=9)
+        second = circuit.run(shots=300, seed=9)
+
+        assert dict(first.counts) == dict(second.counts)
+
+    def test_static_only_methods_raise(self):
+        """Test that statevector methods reject dynamic circuits."""
+        circuit = QuantumCircuit(2).h(0).reset(0)
+
+        with pytest.raises(ValueError, match="only run"):
+            circuit.get_statevector()
+        with pytest.raises(ValueError, match="only run"):
+            circuit.amplitude("00")
+        with pytest.raises(ValueError, match="can't run mid-circuit"):
+            circuit.run(shots=10, backend="mps")
+
+
+class TestDynamicStructure:
+    """Test detection, planning and bookkeeping of dynamic circuits."""
+
+    def test_is_dynamic(self):
+        """Test which circuits need shot branching."""
+        assert not QuantumCircuit(2).h(0).measure(0).x(1).is_dynamic
+        assert not QuantumCircuit(2).x(0).measure(1).measure_all().is_dynamic
+        assert QuantumCircuit(2).measure(0).x(0).is_dynamic
+        assert QuantumCircuit(2).measure_all().cx(0, 1).is_dynamic
+        assert QuantumCircuit(1).reset(0).is_dynamic
+        assert QuantumCircuit(2).x(1).c_if(0).is_dynamic
+
+    def test_terminal_measurements_deferred(self):
+        """Test that only measurements with later use branch."""
+        circuit = QuantumCircuit(3).h(0).h(1).measure([0, 1]).x(2).c_if(0)
+        circuit.measure(2)
+
+        operations, deferred = plan_dynamic(
+            3, circuit.gates, circuit.conditions, circuit.measured_qubits
+        )
+
+        assert [op for op in operations if op[0] == "measure"] == [("measure", 0)]
+        assert deferred == [1, 2]
+
+    def test_c_if_validation(self):
+        """Test that conditions need a preceding gate and a bit value."""
+        with pytest.raises(ValueError, match="must follow a gate"):
+            QuantumCircuit(2).c_if(0)
+        with pytest.raises(ValueError, match="must follow a gate"):
+            QuantumCircuit(2).measure(0).c_if(0)
+        with pytest.raises(ValueError, match="0 or 1"):
+            QuantumCircuit(2).x(1).c_if(0, 2)
+
+    def test_hash_covers_conditions_and_measurements(self):
+        """Test that dynamic structure changes the content hash."""
+        plain = QuantumCircuit(2).h(0).x(1).content_hash()
+        conditioned = QuantumCircuit(2).h(0).x(1)
+        before = conditioned.content_hash()
+        conditioned.c_if(0)
+
+        assert before == plain
+        assert conditioned.content_hash() != plain
+        assert (
+            QuantumCircuit(1).h(0).measure(0).h(0).content_hash()
+            != QuantumCircuit(1).h(0).h(0).content_hash()
+        )
+
+    def test_bind_and_truncate_keep_conditions_aligned(self):
+        """Test that conditions follow their gates through bind and truncate."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(2).h(0).measure(0).rx(theta, 1).c_if(0)
+
+        bound = circuit.bind({"theta": np.pi}).measure(1)
+
+        assert bound.conditions == {2: (0, 1)}
+        assert set(bound.run(shots=200, seed=0).counts) == {"00", "11"}
+
+        circuit.truncate(2)
+        assert circuit.conditions == {}
+        assert not circuit.is_dynamic
@@ -0,0 +1,137 @@
+"""Tests for adjoint and parameter-shift gradients."""
+
+import numpy as np
+import pytest
+
+from quantiq import Parameter, PauliSum, QuantumCircuit
+
+OBSERVABLE = PauliSum({"ZZI": 0.8, "XIY": -0.5, "IYX": 0.3, "ZIZ": 1.1})
+
+
+def ansatz():
+    """Layered rx/ry/rz circuit with a parameter used twice."""
+    a, b, c = Parameter("a"), Parameter("b"), Parameter("c")
+    circuit = QuantumCircuit(3).h(0).rx(a, 0).ry(b, 1).cx(0, 1).rz(c, 2)
+    circuit.h(2).cx(1, 2).ry(a, 2).rx(0.3, 1).swap(0, 2).ccx(0, 1, 2)
+    return circuit
+
+
+def finite_difference(circuit, bindings, step=1e-6):
+    """Central finite-difference gradient of OBSERVABLE."""
+    gradient = []
+    for name in bindings:
+        plus = dict(bindings, **{name: bindings[name] + step})
+        minus = dict(bindings, **{name: bindings[name] - step})
+        gradient.append(
+            (
+                circuit.bind(plus).expectation(OBSERVABLE)
+                - circuit.bind(minus).expectation(OBSERVABLE)
+            )
+            / (2 * step)
+        )
+    return np.array(gradient)
+
+
+class TestGradient:
+    """Test gradients of expectation values against references."""
+
+    BINDINGS = {"a": 0.4, "b": -1.1, "c": 2.0}
+
+    def test_adjoint_matches_finite_difference(self):
+        """Test the adjoint method against central differences."""
+        circuit = ansatz()
+
+        gradient = circuit.gradient(OBSERVABLE, self.BINDINGS)
+
+        assert gradient.shape == (3,)
+        assert np.allclose(gradient, finite_difference(circuit, self.BINDINGS))
+
+    def test_methods_agree(self):
+        """Test that adjoint and parameter-shift gradients match."""
+        circuit = ansatz()
+
+        adjoint = circuit.gradient(OBSERVABLE, self.BINDINGS)
+        shift = circuit.gradient(OBSERVABLE, self.BINDINGS, method="parameter_shift")
+
+        assert np.allclose(adjoint, shift, atol=1e-12)
+
+    def test_single_rotation(self):
+        """Test d<Z>/dtheta = -sin(theta) after ry(theta)."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(1).ry(theta, 0)
+
+        gradient = circuit.gradient("Z", {theta: 0.7})
+
+        assert gradient[0] == pytest.approx(-np.sin(0.7))
+
+    def test_batched_bindings(self):
+        """Test one gradient row per binding."""
+        circuit = ansatz()
+        bindings = {"a": np.array([0.4, -0.2, 1.5]), "b": -1.1, "c": 2.0}
+
+        adjoint = circuit.gradient(OBSERVABLE, bindings)
+        shift = circuit.gradient(OBSERVABLE, bindings, method="parameter_shift")
+
+        assert adjoint.shape == (3, 3)
+        assert np.allclose(adjoint, shift, atol=1e-12)
+        single = circuit.gradient(OBSERVABLE, dict(self.BINDINGS, a=-0.2))
+        assert np.allclose(adjoint[1], single)
+
+    def test_single_precision(self):
+        """Test that complex64 statevectors give close gradients."""
+        circuit = ansatz()
+
+        single = circuit.gradient(OBSERVABLE, self.BINDINGS, precision="single")
+
+        assert np.allclose(
+            single, circuit.gradient(OBSERVABLE, self.BINDINGS), atol=1e-5
+        )
+
+    def test_measurements_ignored(self):
+        """Test that terminal measurements don't affect the gradient."""
+        circuit = ansatz()
+        measured = ansatz().measure_all()
+
+        assert np.allclose(
+            measured.gradient(OBSERVABLE, self.BINDINGS),
+            circuit.gradient(OBSERVABLE, self.BINDINGS),
+        )
+
+
+class TestGradientValidation:
+    """Test rejection of circuits and observables that can't be differentiated."""
+
+    def test_unknown_method(self):
+        """Test that only the supported methods are accepted."""
+        with pytest.raises(ValueError, match="Unknown gradient method"):
+            ansatz().gradient(OBSERVABLE, TestGradient.BINDINGS, method="spsa")
+
+    def test_non_hermitian_observable(self):
+        """Test that complex coefficients are rejected."""
+        with pytest.raises(ValueError, match="real coefficients"):
+            ansatz().gradient(PauliSum({"XYZ": 1j}), TestGradient.BINDINGS)
+
+    def test_qubit_count_mismatch(self):
+        """Test that the observable must cover the circuit."""
+        with pytest.raises(ValueError, match="acts on 2 qubits"):
+            ansatz().gradient("ZZ", TestGradient.BINDINGS)
+
+    def test_parameter_outside_rotation(self):
+        """Test that Parameters in other gates are rejected."""
+        circuit = QuantumCircuit(2).append("CU", 0, 1, Parameter("u"))
+
+        with pytest.raises(ValueError, match="only in rx, ry and rz"):
+            circuit.gradient("ZZ", {"u": 0.1})
+
+    def test_missing_binding(self):
+        """Test that every parameter needs a value."""
+        with pytest.raises(ValueError, match="No values bound"):
+            ansatz().gradient(OBSERVABLE, {"a": 0.1})
+
+    def test_dynamic_circuit(self):
+        """Test that dynamic circuits are rejected."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(1).rx(theta, 0).reset(0).ry(theta, 0)
+
+        with pytest.raises(ValueError, match="only run"):
+            circuit.gradient("Z", {theta: 0.1})
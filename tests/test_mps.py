@@ -0,0 +1,125 @@
+"""Tests for the matrix product state backend."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit
+from quantiq.gates import H
+from quantiq.mps import MPSSimulator
+
+from .test_outofcore import layered_circuit
+
+
+def ghz_circuit(num_qubits):
+    """Nearest-neighbour GHZ preparation."""
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for q in range(num_qubits - 1):
+        circuit.cx(q, q + 1)
+    return circuit
+
+
+class TestMPSSimulator:
+    """Test the MPS backend against the dense statevector."""
+
+    @pytest.mark.parametrize("num_qubits", [4, 5, 7])
+    @pytest.mark.parametrize("fuse", [True, False])
+    def test_matches_statevector(self, num_qubits, fuse):
+        """Test that an untruncated MPS reproduces the exact state."""
+        circuit = layered_circuit(num_qubits, seed=num_qubits)
+        expected = circuit.get_statevector(fuse=fuse)
+
+        actual = circuit.get_statevector(fuse=fuse, backend="mps")
+
+        assert np.allclose(actual, expected)
+
+    def test_long_range_gates_are_routed(self):
+        """Test that gates on distant qubits match after SWAP routing."""
+        circuit = QuantumCircuit(7)
+        circuit.h(0).ry(0.4, 3).cx(0, 6).cz(5, 1).ccx(6, 0, 3).swap(2, 6)
+        circuit.cx(4, 0)
+
+        simulator = MPSSimulator(7)
+        circuit.compile(fuse=False).run(simulator)
+
+        assert np.allclose(simulator.get_statevector(), circuit.get_statevector())
+        assert sorted(simulator.sites) == list(range(7))
+
+    def test_swap_only_relabels_sites(self):
+        """Test that a SWAP gate leaves the tensors untouched."""
+        simulator = MPSSimulator(4)
+        simulator.apply_gate(H, 0)
+        tensors = [t.copy() for t in simulator.tensors]
+
+        simulator.apply_swap(0, 3)
+
+        assert simulator.sites == [3, 1, 2, 0]
+        assert all(np.array_equal(a, b) for a, b in zip(tensors, simulator.tensors))
+
+    def test_bond_cap_truncates(self):
+        """Test that a bond cap of 1 cuts a GHZ state to one branch."""
+        result = ghz_circuit(6).run(
+            shots=200, seed=0, backend="mps", backend_options={"max_bond": 1}
+        )
+
+        assert result.metadata["truncation_error"] == pytest.approx(0.5)
+        assert result.metadata["bond_dimension"] == 1
+        assert len(result.counts) == 1
+
+    def test_exact_run_reports_no_truncation(self):
+        """Test that a low-entanglement circuit is simulated exactly."""
+        result = ghz_circuit(8).run(shots=100, seed=0, backend="mps")
+
+        assert result.metadata["backend"] == "mps"
+        assert result.metadata["truncation_error"] == pytest.approx(0.0, abs=1e-12)
+        assert result.metadata["bond_dimension"] == 2
+
+    def test_sampling_matches_distribution(self):
+        """Test that sequential sampling follows the exact probabilities."""
+        circuit = layered_circuit(5, seed=2)
+        probabilities = np.abs(circuit.get_statevector()) ** 2
+        shots = 40000
+
+        result = circuit.run(shots=shots, seed=7, backend="mps")
+
+        empirical = np.zeros_like(probabilities)
+        empirical[result.outcomes] = result.frequencies / shots
+        assert result.frequencies.sum() == shots
+        assert np.abs(empirical - probabilities).max() < 0.01
+
+    def test_sampling_is_reproducible(self):
+        """Test that a seed fixes the sampled counts."""
+        circuit = layered_circuit(5, seed=3)
+
+        first = circuit.run(shots=500, seed=11, backend="mps")
+        second = circuit.run(shots=500, seed=11, backend="mps")
+
+        assert dict(first.counts) == dict(second.counts)
+
+    def test_many_qubit_ladder(self):
+        """Test a 80-qubit ladder that a dense statevector couldn't hold."""
+        result = ghz_circuit(80).run(shots=300, seed=1, backend="mps")
+
+        assert set(result.counts) <= {"0" * 80, "1" * 80}
+        assert sum(result.counts.values()) == 300
+
+    def test_single_precision(self):
+        """Test that single precision keeps complex64 tensors."""
+        simulator = MPSSimulator(4, precision="single")
+        layered_circuit(4).compile().run(simulator)
+
+        assert all(t.dtype == np.complex64 for t in simulator.tensors)
+        assert np.allclose(
+            simulator.get_statevector(),
+            layered_circuit(4).get_statevector(),
+            atol=1e-5,
+        )
+
+    def test_invalid_options(self):
+        """Test that bad options are rejected."""
+        with pytest.raises(ValueError, match="Bond dimension"):
+            MPSSimulator(3, max_bond=0)
+        with pytest.raises(ValueError, match="cutoff"):
+            MPSSimulator(3, cutoff=-1.0)
+        with pytest.raises(ValueError, match="precision"):
+            MPSSimulator(3, precision="half")
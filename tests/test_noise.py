@@ -0,0 +1,178 @@
+"""Tests for trajectory noise simulation and readout error."""
+
+import numpy as np
+import pytest
+
+from quantiq import NoiseModel, QuantumCircuit
+from quantiq.noise import noise_streams, run_trajectories
+
+
+class TestGateNoise:
+    """Test depolarizing and amplitude-damping trajectories."""
+
+    def test_depolarizing_flip_rate(self):
+        """Test that X and Y errors after a gate flip the bit at 2p/3."""
+        p = 0.3
+        noise = NoiseModel(depolarizing=p, trajectories=2000)
+        circuit = QuantumCircuit(1).x(0)
+
+        result = circuit.run(shots=20000, seed=4, noise=noise)
+
+        zeros = result.counts.get("0", 0) / 20000
+        assert zeros == pytest.approx(2 * p / 3, abs=0.02)
+        assert result.metadata["trajectories"] == 2000
+
+    def test_amplitude_damping_decay(self):
+        """Test that an excited qubit decays with probability gamma."""
+        gamma = 0.25
+        noise = NoiseModel(amplitude_damping=gamma, trajectories=4000)
+        circuit = QuantumCircuit(2).x(0)
+
+        result = circuit.run(shots=8000, seed=1, noise=noise)
+
+        decayed = result.marginal([0]).counts.get("0", 0) / 8000
+        assert decayed == pytest.approx(gamma, abs=0.02)
+        # The idle qubit is never touched by a gate, so never by noise
+        assert set(result.marginal([1]).counts) == {"0"}
+
+    def test_damping_leaves_ground_state(self):
+        """Test that damping never excites a qubit in |0>."""
+        noise = NoiseModel(amplitude_damping=0.5, trajectories=100)
+        circuit = QuantumCircuit(2).cx(0, 1)
+
+        result = circuit.run(shots=500, seed=0, noise=noise)
+
+        assert dict(result.counts) == {"00": 500}
+        assert result.metadata["error_patterns"] == 1
+
+    def test_error_patterns_grouped(self):
+        """Test that trajectories with equal errors share a batch row."""
+        noise = NoiseModel(depolarizing=0.01, trajectories=500)
+        circuit = QuantumCircuit(3).h(0).cx(0, 1).cx(1, 2)
+
+        result = circuit.run(shots=500, seed=2, noise=noise)
+
+        assert 1 < result.metadata["error_patterns"] < 500
+        assert sum(result.counts.values()) == 500
+
+    def test_reproducible_with_seed(self):
+        """Test that a seed fixes every trajectory and readout draw."""
+        noise = NoiseModel(depolarizing=0.1, amplitude_damping=0.05, readout=0.02)
+        circuit = QuantumCircuit(3).h(0).cx(0, 1).ry(0.7, 2)
+
+        first = circuit.run(shots=1000, seed=11, noise=noise)
+        second = circuit.run(shots=1000, seed=11, noise=noise)
+
+        assert dict(first.counts) == dict(second.counts)
+
+    def test_chunking_preserves_results(self, monkeypatch):
+        """Test that splitting trajectories into chunks keeps their errors."""
+        noise = NoiseModel(depolarizing=0.2, trajectories=64)
+        # Every trajectory ends in a basis state, so counts follow the errors
+        circuit = QuantumCircuit(2).x(0).cx(0, 1)
+
+        whole = run_trajectories(2, circuit.gates, noise, 64, noise_streams(5)[0])
+        monkeypatch.setattr("quantiq.noise.MAX_STATEVECTOR_BYTES", 3 * 16 * 4)
+        chunked = run_trajectories(2, circuit.gates, noise, 64, noise_streams(5)[0])
+
+        # Rows can't be shared across chunks, so more of them are simulated
+        assert chunked.metadata["error_patterns"] > whole.metadata["error_patterns"]
+        assert dict(chunked.counts) == dict(whole.counts)
+
+    def test_chunks_bound_random_draws(self, monkeypatch):
+        """Test that chunk sizes count each trajectory's draws."""
+        noise = NoiseModel(depolarizing=1e-12, trajectories=8)
+        circuit = QuantumCircuit(2)
+        for _ in range(50):
+            circuit.x(0)
+        # Room for four statevectors, but not for one row of 50 draws
+        monkeypatch.setattr("quantiq.noise.MAX_STATEVECTOR_BYTES", 4 * 16 * 4)
+
+        result = run_trajectories(2, circuit.gates, noise, 8, noise_streams(0)[0])
+
+        # One trajectory per chunk, each simulated in its own row
+        assert result.metadata["error_patterns"] == 8
+        assert dict(result.counts) == {"00": 8}
+
+    def test_matches_noiseless_without_noise(self):
+        """Test that a zero-noise model leaves the distribution unchanged."""
+        circuit = QuantumCircuit(2).h(0).cx(0, 1)
+
+        result = circuit.run(shots=2000, seed=3, noise=NoiseModel())
+
+        assert set(result.counts) == {"00", "11"}
+
+
+class TestReadoutNoise:
+    """Test bit flips applied to sampled counts."""
+
+    def test_symmetric_flip_rate(self):
+        """Test that each bit flips with the readout probability."""
+        noise = NoiseModel(readout=0.1)
+        circuit = QuantumCircuit(2).x(0)
+
+        result = circuit.run(shots=20000, seed=6, noise=noise)
+
+        assert result.marginal([0]).counts["0"] / 20000 == pytest.approx(0.1, abs=0.01)
+        assert result.marginal([1]).counts["1"] / 20000 == pytest.approx(0.1, abs=0.01)
+        assert sum(result.counts.values()) == 20000
+
+    def test_asymmetric_flip_rate(self):
+        """Test separate P(read 1 | 0) and P(read 0 | 1)."""
+        noise = NoiseModel(readout=(0.0, 0.3))
+        circuit = QuantumCircuit(2).x(0)
+
+        result = circuit.run(shots=20000, seed=7, noise=noise)
+
+        assert "1" not in result.marginal([1]).counts
+        assert result.marginal([0]).counts["0"] / 20000 == pytest.approx(0.3, abs=0.015)
+
+    def test_readout_only_measured_qubits(self):
+        """Test that readout error acts on the reported bits only."""
+        noise = NoiseModel(readout=1.0)
+        circuit = QuantumCircuit(3).x(1).measure([1, 2])
+
+        result = circuit.run(shots=100, seed=0, noise=noise)
+
+        assert dict(result.counts) == {"01": 100}
+
+
+class TestNoiseModel:
+    """Test noise model validation and run() integration."""
+
+    def test_validation(self):
+        """Test that probabilities and trajectory counts are checked."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            NoiseModel(depolarizing=1.5)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            NoiseModel(readout=(0.1, -0.1))
+        with pytest.raises(ValueError, match="must be positive"):
+            NoiseModel(trajectories=0)
+
+    def test_locations(self):
+        """Test that every channel follows every qubit of every gate."""
+        noise = NoiseModel(depolarizing=0.1, amplitude_damping=0.1)
+        circuit = QuantumCircuit(2).h(0).measure(0).cx(0, 1)
+
+        locations = noise.locations(circuit.gates)
+
+        assert [index for index, _, _ in locations] == [0, 0, 2, 2, 2, 2]
+        assert [qubit for _, _, qubit in locations] == [0, 0, 0, 0, 1, 1]
+
+    def test_unsupported_runs_raise(self):
+        """Test that gate noise needs the statevector backend and static circuits."""
+        noise = NoiseModel(depolarizing=0.1)
+
+        with pytest.raises(ValueError, match="can't simulate gate noise"):
+            QuantumCircuit(2).h(0).run(shots=10, backend="mps", noise=noise)
+        with pytest.raises(ValueError, match="dynamic circuits"):
+            QuantumCircuit(1).h(0).reset(0).run(shots=10, noise=noise)
+
+    def test_unbound_parameters_raise(self):
+        """Test that symbolic gates are rejected before sampling."""
+        from quantiq import Parameter
+
+        circuit = QuantumCircuit(1).rx(Parameter("theta"), 0)
+
+        with pytest.raises(ValueError):
+            circuit.run(shots=10, noise=NoiseModel(depolarizing=0.1))
@@ -0,0 +1,122 @@
+"""Tests for Pauli-sum observables."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from quantiq import Parameter, PauliSum, QuantumCircuit, Simulator
+
+
+def random_state(num_qubits, seed=0, batch=None):
+    """Random normalized statevector, or a stack of them."""
+    rng = np.random.default_rng(seed)
+    shape = (2**num_qubits,) if batch is None else (batch, 2**num_qubits)
+    state = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    return state / np.linalg.norm(state, axis=-1, keepdims=True)
+
+
+def random_pauli_sum(num_qubits, num_terms, seed=0):
+    """Random real-weighted Pauli sum."""
+    rng = np.random.default_rng(seed)
+    return PauliSum(
+        [
+            ("".join(rng.choice(list("IXYZ"), size=num_qubits)), rng.normal())
+            for _ in range(num_terms)
+        ]
+    )
+
+
+class TestPauliSum:
+    """Test exact expectation values against the dense matrix."""
+
+    @pytest.mark.parametrize(
+        "pauli", ["".join(p) for p in itertools.product("IXYZ", repeat=2)]
+    )
+    def test_single_terms(self, pauli):
+        """Test every two-qubit Pauli string."""
+        observable = PauliSum({pauli: 1.0})
+        state = random_state(2, seed=3)
+
+        expected = np.vdot(state, observable.to_matrix() @ state)
+        assert observable.expectation(state) == pytest.approx(expected.real)
+
+    @pytest.mark.parametrize("num_terms", [5, 200])
+    def test_random_sums(self, num_terms):
+        """Test term-by-term and Walsh-Hadamard group evaluation."""
+        observable = random_pauli_sum(5, num_terms, seed=num_terms)
+        state = random_state(5, seed=1)
+
+        expected = np.vdot(state, observable.to_matrix() @ state).real
+        assert observable.expectation(state) == pytest.approx(expected)
+
+    def test_batched_states(self):
+        """Test one value per row of a batch of states."""
+        observable = random_pauli_sum(3, 12)
+        states = random_state(3, seed=2, batch=4)
+        matrix = observable.to_matrix()
+
+        expected = [np.vdot(s, matrix @ s).real for s in states]
+        assert np.allclose(observable.expectation(states), expected)
+
+    def test_apply_matches_matrix(self):
+        """Test H|psi> for single and batched states."""
+        observable = random_pauli_sum(3, 10, seed=4)
+        states = random_state(3, seed=6, batch=3)
+        matrix = observable.to_matrix()
+
+        assert np.allclose(observable.apply(states), states @ matrix.T)
+        assert np.allclose(observable.apply(states[0]), matrix @ states[0])
+
+    def test_complex_coefficients(self):
+        """Test that non-Hermitian sums return complex values."""
+        observable = PauliSum({"XY": 1j, "ZI": 0.5})
+        state = random_state(2, seed=5)
+
+        expected = np.vdot(state, observable.to_matrix() @ state)
+        assert observable.expectation(state) == pytest.approx(expected)
+
+    def test_repeated_terms_are_combined(self):
+        """Test that repeated Pauli strings add their coefficients."""
+        observable = PauliSum([("ZZ", 0.5), ("XX", 1.0), ("ZZ", 0.25)])
+
+        assert len(observable) == 2
+        assert observable.coeffs[0] == 0.75
+
+    def test_invalid_terms(self):
+        """Test rejection of malformed Pauli strings."""
+        with pytest.raises(ValueError):
+            PauliSum({"ZA": 1.0})
+        with pytest.raises(ValueError):
+            PauliSum({"Z": 1.0, "ZZ": 1.0})
+        with pytest.raises(ValueError):
+            PauliSum({})
+
+
+class TestCircuitExpectation:
+    """Test expectation values through the simulator and circuit."""
+
+    def test_bell_state(self):
+        """Test ZZ, XX and YY correlations of a Bell state."""
+        circuit = QuantumCircuit(2).h(0).cx(0, 1)
+
+        assert circuit.expectation("ZZ") == pytest.approx(1.0)
+        assert circuit.expectation("XX") == pytest.approx(1.0)
+        assert circuit.expectation("YY") == pytest.approx(-1.0)
+        assert circuit.expectation(PauliSum({"ZI": 1.0, "IZ": 1.0})) == pytest.approx(
+            0.0
+        )
+
+    def test_batched_bindings(self):
+        """Test <Z> of RY(theta)|0> over a batch of angles."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(1).ry(theta, 0)
+        angles = np.linspace(0, np.pi, 7)
+
+        values = circuit.expectation("Z", bindings={theta: angles})
+        assert np.allclose(values, np.cos(angles))
+
+    def test_qubit_count_mismatch(self):
+        """Test rejection of observables of the wrong size."""
+        with pytest.raises(ValueError):
+            Simulator(3).expectation("ZZ")
@@ -0,0 +1,120 @@
+"""Tests for the memory-mapped out-of-core simulator."""
+
+import os
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit
+from quantiq.outofcore import OutOfCoreSimulator
+
+from .test_simulator import random_unitary
+
+# Two amplitudes per chunk in double precision leaves most qubits global
+TINY_BUDGET = 4 * 2 * 16
+
+
+def layered_circuit(num_qubits, seed=0):
+    """Circuit mixing every kernel family across local and global qubits."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for q in range(num_qubits):
+        circuit.h(q).ry(rng.uniform(0, np.pi), q)
+    for q in range(num_qubits - 1):
+        circuit.cx(q, q + 1)
+    circuit.cx(num_qubits - 1, 0).ccx(0, num_qubits - 1, 1).swap(0, num_qubits - 1)
+    circuit.cu(random_unitary(2, seed=seed), 1, num_qubits - 2)
+    circuit.append("UNITARY", 0, num_qubits - 1, random_unitary(4, seed=seed))
+    circuit.append("UNITARY", 2, 0, 1, random_unitary(8, seed=seed + 1))
+    return circuit
+
+
+class TestOutOfCoreSimulator:
+    """Test chunked execution against the in-memory simulator."""
+
+    @pytest.mark.parametrize("ram_budget", [TINY_BUDGET, 4 * 8 * 16, 2**20])
+    @pytest.mark.parametrize("fuse", [False, True])
+    def test_matches_in_memory(self, ram_budget, fuse):
+        """Test agreement for chunk sizes from 2 amplitudes to everything."""
+        circuit = layered_circuit(5)
+        options = {"ram_budget": ram_budget}
+
+        statevector = circuit.get_statevector(
+            fuse=fuse, backend="outofcore", backend_options=options
+        )
+        assert np.allclose(statevector, circuit.get_statevector(fuse=fuse))
+
+    def test_chunk_layout(self, tmp_path):
+        """Test that the RAM budget sets the number of local qubits."""
+        simulator = OutOfCoreSimulator(
+            6, ram_budget=4 * 8 * 16, directory=str(tmp_path)
+        )
+
+        assert simulator.chunk_qubits == 3
+        assert simulator.num_chunks == 8
+        assert isinstance(simulator.statevector, np.memmap)
+        assert os.path.dirname(simulator.path) == str(tmp_path)
+
+    def test_streamed_sampling(self):
+        """Test chunk-wise sampling of a GHZ state."""
+        circuit = QuantumCircuit(6).h(0)
+        for q in range(5):
+            circuit.cx(q, q + 1)
+
+        result = circuit.run(
+            shots=2000,
+            seed=3,
+            backend="outofcore",
+            backend_options={"ram_budget": TINY_BUDGET},
+        )
+        assert set(result.counts) == {"000000", "111111"}
+        assert abs(result.get_counts("000000") - 1000) < 150
+
+    def test_streamed_probabilities(self):
+        """Test that streamed probabilities cover the state in order."""
+        simulator = OutOfCoreSimulator(4, ram_budget=TINY_BUDGET)
+        simulator.apply_gate(np.array([[0, 1], [1, 0]]), 3)
+
+        probabilities = simulator.get_probabilities()
+        assert probabilities[1] == 1
+        offsets = [offset for offset, _ in simulator.iter_probabilities()]
+        assert offsets == list(range(0, 16, 2))
+
+    def test_single_precision_and_reset(self):
+        """Test complex64 chunks and resetting the file."""
+        simulator = OutOfCoreSimulator(3, precision="single", ram_budget=64)
+        simulator.apply_gate(np.eye(2)[::-1], 0)
+        assert simulator.statevector.dtype == np.complex64
+
+        simulator.reset()
+        assert simulator.get_statevector()[0] == 1
+        assert np.count_nonzero(simulator.get_statevector()) == 1
+
+    def test_file_removed_with_simulator(self, tmp_path):
+        """Test that the statevector file is deleted with the simulator."""
+        simulator = OutOfCoreSimulator(3, directory=str(tmp_path))
+        path = simulator.path
+        assert os.path.exists(path)
+
+        del simulator
+        assert not os.path.exists(path)
+
+    def test_capacity_checks(self):
+        """Test rejection of impossible disk and RAM budgets."""
+        with pytest.raises(ValueError):
+            OutOfCoreSimulator(2, ram_budget=16)
+        with pytest.raises(ValueError):
+            OutOfCoreSimulator(62)
+
+    def test_fork_unsupported(self):
+        """Test that the memory-mapped state can't be shared."""
+        simulator = OutOfCoreSimulator(3)
+        with pytest.raises(ValueError, match="can't be forked"):
+            simulator.fork()
+        with pytest.raises(ValueError, match="no snapshots"):
+            simulator.snapshot()
+
+    def test_unknown_backend(self):
+        """Test rejection of unknown backend names."""
+        with pytest.raises(ValueError):
+            QuantumCircuit(2).run(backend="gpu")
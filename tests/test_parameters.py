@@ -0,0 +1,98 @@
+"""Tests for parameterized circuits and batched execution."""
+
+import numpy as np
+import pytest
+
+from quantiq import Parameter, QuantumCircuit
+from quantiq.gates import rx, ry, rz
+
+
+def ansatz():
+    """Two-qubit circuit with two parameters."""
+    theta, phi = Parameter("theta"), Parameter("phi")
+    circuit = QuantumCircuit(2)
+    circuit.ry(theta, 0).cx(0, 1).rz(phi, 1).rx(2 * np.pi, 1)
+    return circuit, theta, phi
+
+
+class TestRotationGates:
+    """Test rotation matrices and circuit methods."""
+
+    def test_vectorized_matrices(self):
+        """Test that array angles give a stack of the scalar matrices."""
+        angles = np.array([0.1, 1.2, -2.0])
+        for gate in (rx, ry, rz):
+            stack = gate(angles)
+            assert stack.shape == (3, 2, 2)
+            assert all(np.allclose(stack[i], gate(a)) for i, a in enumerate(angles))
+
+    def test_fixed_rotation(self):
+        """Test that RX(pi) flips |0⟩ to -i|1⟩."""
+        statevector = QuantumCircuit(1).rx(np.pi, 0).get_statevector()
+        assert np.allclose(statevector, [0, -1j])
+
+
+class TestParameters:
+    """Test symbolic parameters and binding."""
+
+    def test_parameters_in_order(self):
+        """Test that parameters are collected in order of first use."""
+        circuit, theta, phi = ansatz()
+        assert circuit.parameters == [theta, phi]
+
+    def test_bind(self):
+        """Test binding by Parameter and by name."""
+        circuit, theta, _ = ansatz()
+        bound = circuit.bind({theta: np.pi, "phi": 0.0})
+        assert bound.parameters == []
+        assert np.allclose(np.abs(bound.get_statevector()) ** 2, [0, 0, 0.0, 1.0])
+
+    def test_bind_unknown_parameter(self):
+        """Test that binding a parameter the circuit lacks fails clearly."""
+        circuit, _, _ = ansatz()
+        with pytest.raises(ValueError, match="no parameter 'b'"):
+            circuit.bind({"b": 1.0})
+        with pytest.raises(ValueError, match="no parameter"):
+            circuit.bind({Parameter("theta"): 1.0})
+
+    def test_unbound_run_raises_error(self):
+        """Test that simulating with unbound parameters fails clearly."""
+        circuit, _, _ = ansatz()
+        with pytest.raises(ValueError, match="theta"):
+            circuit.run(shots=10)
+
+
+class TestBatchExecution:
+    """Test vectorized simulation over parameter sets."""
+
+    def test_statevectors_match_bound_circuits(self):
+        """Test each batch row against the individually bound circuit."""
+        circuit, theta, phi = ansatz()
+        thetas = np.linspace(0, np.pi, 7)
+        phis = np.linspace(-1, 1, 7)
+        statevectors = circuit.get_statevectors({theta: thetas, phi: phis})
+
+        assert statevectors.shape == (7, 4)
+        for i in range(7):
+            bound = circuit.bind({theta: thetas[i], phi: phis[i]})
+            assert np.allclose(statevectors[i], bound.get_statevector())
+
+    def test_scalar_broadcast(self):
+        """Test that a scalar binding applies to every batch element."""
+        circuit, theta, phi = ansatz()
+        statevectors = circuit.get_statevectors({theta: [0.0, np.pi], phi: 0.5})
+        assert statevectors.shape == (2, 4)
+
+    def test_run_batch(self):
+        """Test that run_batch returns one Result per binding."""
+        circuit, theta, phi = ansatz()
+        circuit.measure_all()
+        results = circuit.run_batch({theta: [0.0, np.pi], phi: [0.0, 0.0]}, shots=50)
+        assert [r.get_counts("00") for r in results] == [50, 0]
+        assert results[1].get_counts("11") == 50
+
+    def test_mismatched_lengths_raise_error(self):
+        """Test that bindings must share a batch size."""
+        circuit, theta, phi = ansatz()
+        with pytest.raises(ValueError):
+            circuit.get_statevectors({theta: [0.0, 1.0], phi: [0.0, 1.0, 2.0]})
@@ -1,5 +1,6 @@
 """Tests for QuantumCircuit class."""
 
+import numpy as np
 import pytest
 
 from quantiq import QuantumCircuit
@@ -55,6 +56,83 @@ class TestQuantumGates:
         assert result is circuit  # Should return self for chaining
         assert len(circuit.gates) == 2
 
+    def test_multi_qubit_gates(self):
+        """Test CZ, SWAP, Toffoli and multi-controlled X."""
+        circuit = QuantumCircuit(4)
+        circuit.cz(0, 1).swap(1, 2).ccx(0, 1, 2).mcx([0, 1, 2], 3)
+        assert circuit.gates[-1] == ("MCX", 0, 1, 2, 3)
+        with pytest.raises(ValueError):
+            circuit.ccx(0, 0, 1)
+
+
+class TestSubsetMeasurement:
+    """Test measure() and lightcone pruning in run()."""
+
+    def test_measured_bits_follow_measure_order(self):
+        """Test that results hold the measured qubits in the given order."""
+        circuit = QuantumCircuit(4).x(1).x(3)
+        circuit.measure([3, 0]).measure(1)
+
+        result = circuit.run(shots=50, seed=0)
+
+        assert circuit.measured_qubits == [3, 0, 1]
+        assert dict(result.counts) == {"101": 50}
+
+    def test_pruned_run_matches_marginal(self):
+        """Test that pruning doesn't change the measured distribution."""
+        circuit = QuantumCircuit(6)
+        for q in range(6):
+            circuit.ry(0.4 * (q + 1), q)
+        for q in range(5):
+            circuit.cx(q, q + 1)
+        circuit.cx(5, 0).measure([1, 2])
+        probabilities = np.abs(circuit.get_statevector(cache=False)) ** 2
+        expected = probabilities.reshape([2] * 6).sum(axis=(0, 3, 4, 5)).ravel()
+
+        result = circuit.run(shots=40000, seed=3)
+
+        empirical = np.zeros(4)
+        empirical[result.outcomes] = result.frequencies / 40000
+        assert result.metadata["pruned_gates"] == 5
+        assert result.metadata["pruned_qubits"] == 2
+        assert np.allclose(empirical, expected, atol=0.01)
+
+    def test_large_register_small_lightcone(self):
+        """Test that a wide circuit read on a few qubits stays cheap."""
+        circuit = QuantumCircuit(60)
+        for q in range(60):
+            circuit.h(q)
+        circuit.cx(10, 11).x(40).measure([11, 40, 59])
+
+        result = circuit.run(shots=1000, seed=1)
+
+        assert result.num_qubits == 3
+        assert result.metadata["pruned_qubits"] == 56
+        assert len(result.counts) == 8
+
+    def test_idle_measured_qubit_reads_zero(self):
+        """Test that a measured qubit with no gates is reported as 0."""
+        circuit = QuantumCircuit(3).x(0).measure([0, 2])
+
+        result = circuit.run(shots=10, seed=0)
+
+        assert dict(result.counts) == {"10": 10}
+
+    def test_prune_disabled(self):
+        """Test that prune=False simulates every qubit with the same readout."""
+        circuit = QuantumCircuit(3).h(0).x(2).measure(2)
+
+        result = circuit.run(shots=20, seed=0, prune=False)
+
+        assert dict(result.counts) == {"1": 20}
+        assert "pruned_gates" not in result.metadata
+
+    def test_measure_all_overrides_subset(self):
+        """Test that measure_all() reads out every qubit."""
+        circuit = QuantumCircuit(2).x(0).measure(1).measure_all()
+
+        assert circuit.run(shots=5, seed=0).num_qubits == 2
+
 
 def test_package_import():
     """Test that the package can be imported."""
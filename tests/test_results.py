@@ -0,0 +1,131 @@
+"""Tests for the array-backed Result."""
+
+import numpy as np
+import pytest
+
+from quantiq import Result
+
+
+class TestArrayResult:
+    """Test Result construction and its lazy count views."""
+
+    def test_dict_and_array_construction_agree(self):
+        """Test that both constructors give the same counts."""
+        from_dict = Result({"10": 3, "00": 5, "11": 2}, shots=10, num_qubits=2)
+        from_arrays = Result.from_arrays(
+            np.array([3, 0, 2]), np.array([2, 5, 3]), shots=10, num_qubits=2
+        )
+
+        assert from_dict.counts == from_arrays.counts
+        assert dict(from_dict.counts) == {"00": 5, "10": 3, "11": 2}
+        assert list(from_dict.outcomes) == [0, 2, 3]
+
+    def test_counts_view_lookups(self):
+        """Test membership, indexing and get on the counts view."""
+        result = Result({"01": 4, "10": 6}, shots=10, num_qubits=2)
+
+        assert result.counts["10"] == 6
+        assert "01" in result.counts
+        assert "11" not in result.counts
+        assert "1" not in result.counts
+        assert result.get_counts("11") == 0
+        with pytest.raises(KeyError):
+            result.counts["00"]
+        assert result.probabilities() == {"01": 0.4, "10": 0.6}
+
+    def test_validation(self):
+        """Test rejection of inconsistent results."""
+        with pytest.raises(ValueError):
+            Result({"0": 5}, shots=5, num_qubits=2)
+        with pytest.raises(ValueError):
+            Result({"00": 4}, shots=5, num_qubits=2)
+        with pytest.raises(ValueError):
+            Result.from_arrays(np.array([4]), np.array([5]), shots=5, num_qubits=2)
+
+    def test_most_common_breaks_ties_by_outcome(self):
+        """Test that most_common orders by count, then by bitstring."""
+        result = Result(
+            {"000": 1, "011": 5, "101": 5, "110": 2, "111": 7},
+            shots=20,
+            num_qubits=3,
+        )
+
+        assert result.most_common(3) == [("111", 7), ("011", 5), ("101", 5)]
+        assert len(result.most_common(10)) == 5
+
+    def test_expectation_value_parity(self):
+        """Test the Z expectation value from bit parity."""
+        result = Result({"00": 3, "01": 1, "11": 4, "10": 2}, shots=10, num_qubits=2)
+
+        assert result.expectation_value("Z") == pytest.approx((3 - 1 + 4 - 2) / 10)
+
+    def test_wide_register(self):
+        """Test that registers wider than 63 qubits keep exact indices."""
+        bitstring = "1" + "0" * 68 + "1"
+        result = Result({bitstring: 3, "0" * 70: 1}, shots=4, num_qubits=70)
+
+        assert result.counts[bitstring] == 3
+        assert result.most_common(1) == [(bitstring, 3)]
+        assert result.expectation_value() == 1.0
+        assert result.to_dict()["counts"] == {"0" * 70: 1, bitstring: 3}
+
+
+class TestSubsetAnalytics:
+    """Test marginals and Z-string correlators computed from outcome bits."""
+
+    @pytest.fixture
+    def result(self):
+        """Three-qubit result with a mix of outcomes."""
+        return Result({"000": 4, "011": 3, "101": 2, "110": 1}, shots=10, num_qubits=3)
+
+    def test_marginal(self, result):
+        """Test marginal counts and the order of the kept qubits."""
+        assert result.marginal([0]).counts == {"0": 7, "1": 3}
+        assert result.marginal([2, 0]).counts == {"00": 4, "01": 1, "10": 3, "11": 2}
+        assert result.marginal([0, 1, 2]).counts == result.counts
+        assert result.marginal([1]).shots == 10
+
+    def test_z_string_expectation(self, result):
+        """Test I/Z-string expectation values against string slicing."""
+        for observable in ["ZII", "IZI", "ZIZ", "ZZZ", "III"]:
+            expected = sum(
+                count
+                * (-1)
+                ** sum(
+                    bit == "1"
+                    for bit, pauli in zip(outcome, observable)
+                    if pauli == "Z"
+                )
+                for outcome, count in result.counts.items()
+            )
+            assert result.expectation_value(observable) == pytest.approx(expected / 10)
+        assert result.expectation_value("Z") == result.expectation_value("ZZZ")
+
+    def test_invalid_observables(self, result):
+        """Test rejection of malformed and non-diagonal observables."""
+        with pytest.raises(ValueError):
+            result.expectation_value("ZZ")
+        with pytest.raises(NotImplementedError):
+            result.expectation_value("XIZ")
+
+    def test_batched_correlators(self, result):
+        """Test that correlators match one expectation value per subset."""
+        subsets = [(0,), (1, 2), (0, 2), (), (0, 1, 2)]
+        expected = [
+            result.expectation_value(
+                "".join("Z" if q in subset else "I" for q in range(3))
+            )
+            for subset in subsets
+        ]
+
+        assert np.allclose(result.correlators(subsets), expected)
+        with pytest.raises(ValueError):
+            result.correlators([(0, 0)])
+
+    def test_wide_register_marginal(self):
+        """Test marginals and correlators on object-dtype outcomes."""
+        bitstring = "1" + "0" * 68 + "1"
+        result = Result({bitstring: 3, "0" * 70: 1}, shots=4, num_qubits=70)
+
+        assert result.marginal([0, 69]).counts == {"00": 1, "11": 3}
+        assert np.allclose(result.correlators([(0,), (0, 69)]), [-0.5, 1.0])
@@ -0,0 +1,345 @@
+"""Tests for the statevector Simulator and its kernels."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit, Simulator
+from quantiq.gates import CX, CZ, SWAP, H, S, T, X, Y, Z, controlled
+from quantiq.kernels import expand_gate, expand_matrix
+
+
+def random_unitary(dim, seed=0):
+    """Haar-ish random unitary from a QR decomposition."""
+    rng = np.random.default_rng(seed)
+    matrix = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    q, r = np.linalg.qr(matrix)
+    return q * (np.diag(r) / np.abs(np.diag(r)))
+
+
+def random_state(num_qubits, seed=0):
+    """Random normalized statevector."""
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2**num_qubits) + 1j * rng.normal(size=2**num_qubits)
+    return state / np.linalg.norm(state)
+
+
+class TestSingleQubitKernel:
+    """Test in-place single-qubit gate application."""
+
+    @pytest.mark.parametrize("gate", [H, X, Y, Z, S, T, random_unitary(2)])
+    @pytest.mark.parametrize("target", [0, 1, 3])
+    def test_matches_dense_reference(self, gate, target):
+        """Test that the kernel agrees with the dense kron oracle."""
+        simulator = Simulator(4)
+        simulator.statevector = random_state(4, seed=target)
+        expected = expand_gate(gate, target, 4) @ simulator.statevector
+
+        simulator.apply_gate(gate, target)
+
+        assert np.allclose(simulator.statevector, expected)
+
+    def test_invalid_qubit_raises_error(self):
+        """Test that out-of-range qubits are rejected."""
+        with pytest.raises(ValueError):
+            Simulator(2).apply_gate(H, 2)
+
+    def test_wide_register(self):
+        """Test that gates on 20 qubits run without dense matrices."""
+        circuit = QuantumCircuit(20)
+        for qubit in range(20):
+            circuit.h(qubit)
+        statevector = circuit.get_statevector()
+        assert np.allclose(statevector, 2 ** (-10))
+
+
+class TestControlledKernels:
+    """Test bitmask-sliced controlled gates against dense references."""
+
+    @pytest.mark.parametrize("control,target", [(0, 1), (3, 1), (0, 3), (2, 0)])
+    def test_cx_and_cz(self, control, target):
+        """Test CX and CZ on adjacent and distant qubit pairs."""
+        state = random_state(4, seed=1)
+        for method, matrix in [("apply_cx", CX), ("apply_cz", CZ)]:
+            simulator = Simulator(4)
+            simulator.statevector = state.copy()
+            getattr(simulator, method)(control, target)
+            expected = expand_matrix(matrix, [control, target], 4) @ state
+            assert np.allclose(simulator.statevector, expected)
+
+    def test_swap(self):
+        """Test SWAP against its dense matrix."""
+        state = random_state(4, seed=2)
+        simulator = Simulator(4)
+        simulator.statevector = state.copy()
+        simulator.apply_swap(3, 1)
+        assert np.allclose(
+            simulator.statevector, expand_matrix(SWAP, [3, 1], 4) @ state
+        )
+
+    def test_controlled_unitary_and_toffoli(self):
+        """Test arbitrary controlled-2x2 and multi-controlled X."""
+        gate = random_unitary(2, seed=3)
+        state = random_state(5, seed=3)
+        simulator = Simulator(5)
+        simulator.statevector = state.copy()
+        simulator.apply_controlled_gate(gate, [4, 1], 2)
+        simulator.apply_mcx([0, 2, 3], 4)
+
+        expected = expand_matrix(controlled(gate, 2), [4, 1, 2], 5) @ state
+        expected = expand_matrix(controlled(X, 3), [0, 2, 3, 4], 5) @ expected
+        assert np.allclose(simulator.statevector, expected)
+
+    def test_repeated_qubits_raise_error(self):
+        """Test that a control equal to the target is rejected."""
+        with pytest.raises(ValueError):
+            Simulator(3).apply_controlled_gate(X, [1, 2], 1)
+
+    def test_circuit_methods(self):
+        """Test that circuit-level CZ, SWAP and Toffoli run end to end."""
+        circuit = QuantumCircuit(3)
+        circuit.x(0).x(1).ccx(0, 1, 2).swap(0, 2).cz(0, 1)
+        statevector = circuit.get_statevector()
+        # |110⟩ -> Toffoli -> |111⟩ -> SWAP -> |111⟩ -> CZ -> -|111⟩
+        assert np.isclose(statevector[0b111], -1)
+
+
+class TestSampling:
+    """Test multinomial shot sampling."""
+
+    def test_seed_reproducibility(self):
+        """Test that equal seeds give equal counts."""
+        circuit = QuantumCircuit(3).h(0).h(1).h(2).measure_all()
+        first = circuit.run(shots=500, seed=7).counts
+        assert circuit.run(shots=500, seed=7).counts == first
+        assert circuit.run(shots=500, seed=np.random.default_rng(7)).counts == first
+
+    def test_huge_shot_count(self):
+        """Test that a billion shots cost one pass over the probabilities."""
+        result = QuantumCircuit(2).h(0).cx(0, 1).measure_all().run(shots=10**9, seed=1)
+        assert set(result.counts) == {"00", "11"}
+        assert sum(result.counts.values()) == 10**9
+        assert abs(result.get_counts("00") / 10**9 - 0.5) < 1e-3
+
+    def test_only_observed_outcomes(self):
+        """Test that outcomes with zero probability never appear."""
+        result = QuantumCircuit(4).x(2).h(0).run(shots=100, seed=0)
+        assert set(result.counts) <= {"0010", "1010"}
+
+
+class TestPrecision:
+    """Test single- and double-precision statevectors."""
+
+    def build_circuit(self):
+        """Circuit touching every kernel family, rotations included."""
+        circuit = QuantumCircuit(4).h(0).cx(0, 1).ccx(0, 1, 2).swap(2, 3)
+        circuit.rx(0.3, 1).ry(1.1, 2).rz(-0.7, 3).cu(random_unitary(2), 3, 0)
+        return circuit.append("UNITARY", 1, 2, random_unitary(4, seed=1))
+
+    @pytest.mark.parametrize("fuse", [False, True])
+    def test_single_matches_double(self, fuse):
+        """Test that complex64 simulation stays complex64 and accurate."""
+        circuit = self.build_circuit()
+        single = circuit.get_statevector(fuse=fuse, precision="single")
+        double = circuit.get_statevector(fuse=fuse)
+
+        assert single.dtype == np.complex64
+        assert double.dtype == np.complex128
+        assert np.allclose(single, double, atol=1e-6)
+
+    def test_single_precision_probabilities_and_sampling(self):
+        """Test float32 probabilities and sampling from them."""
+        simulator = Simulator(2, precision="single")
+        simulator.apply_gate(H, 0)
+
+        assert simulator.get_probabilities().dtype == np.float32
+        result = QuantumCircuit(2).h(0).cx(0, 1).run(shots=200, precision="single")
+        assert set(result.counts) <= {"00", "11"}
+
+    def test_memory_budget_depends_on_precision(self, monkeypatch):
+        """Test that single precision fits twice the amplitudes."""
+        monkeypatch.setattr("quantiq.simulator.MAX_STATEVECTOR_BYTES", 8 * 2**3)
+
+        assert Simulator(3, precision="single").statevector.nbytes == 64
+        with pytest.raises(ValueError):
+            Simulator(3, precision="double")
+        with pytest.raises(ValueError):
+            Simulator(4, precision="single")
+
+    def test_memory_budget_covers_batch(self, monkeypatch):
+        """Test that a batch of statevectors counts against the budget."""
+        monkeypatch.setattr("quantiq.simulator.MAX_STATEVECTOR_BYTES", 16 * 2**3)
+
+        assert Simulator(2, batch_size=2).statevector.nbytes == 128
+        with pytest.raises(ValueError, match="3 qubits x 2"):
+            Simulator(3, batch_size=2)
+
+    def test_unknown_precision(self):
+        """Test rejection of unsupported precisions."""
+        with pytest.raises(ValueError):
+            Simulator(2, precision="half")
+
+
+class TestSnapshots:
+    """Test copy-on-write snapshots and forks."""
+
+    def test_snapshot_is_frozen(self):
+        """Test that a snapshot shares memory until the next gate."""
+        simulator = Simulator(2)
+        simulator.apply_gate(H, 0)
+        snapshot = simulator.snapshot()
+
+        assert np.shares_memory(snapshot, simulator.statevector)
+        with pytest.raises(ValueError):
+            snapshot[0] = 0
+
+        simulator.apply_gate(X, 1)
+
+        assert not np.shares_memory(snapshot, simulator.statevector)
+        assert np.allclose(snapshot, [2**-0.5, 0, 2**-0.5, 0])
+        assert np.allclose(simulator.statevector, [0, 2**-0.5, 0, 2**-0.5])
+
+    def test_fork_shares_until_write(self):
+        """Test that branches share the prefix state and diverge on write."""
+        parent = Simulator(3)
+        parent.apply_gate(H, 0)
+        branch = parent.fork()
+
+        assert branch.statevector is parent.statevector
+
+        branch.apply_controlled_gate(X, [0], 2)
+
+        assert not np.shares_memory(branch.statevector, parent.statevector)
+        assert np.allclose(parent.statevector, [2**-0.5, 0, 0, 0, 2**-0.5, 0, 0, 0])
+        assert np.allclose(branch.statevector, [2**-0.5, 0, 0, 0, 0, 2**-0.5, 0, 0])
+
+    def test_branches_match_full_circuits(self):
+        """Test several suffixes forked from one prefix simulation."""
+        prefix = QuantumCircuit(3).h(0).cx(0, 1).ry(0.3, 2)
+        parent = Simulator(3)
+        prefix.compile().run(parent)
+        suffixes = [("h", 0), ("s", 1), ("x", 2)]
+
+        for name, qubit in suffixes:
+            branch = parent.fork()
+            getattr(QuantumCircuit(3), name)(qubit).compile().run(branch)
+            full = QuantumCircuit(3)
+            for gate in prefix.gates:
+                full.append(*gate)
+            getattr(full, name)(qubit)
+
+            assert np.allclose(branch.statevector, full.get_statevector(cache=False))
+
+        assert np.allclose(parent.statevector, prefix.get_statevector(cache=False))
+
+
+class TestCollapse:
+    """Test single-qubit measurement probabilities and projection."""
+
+    def test_probability_and_projection(self):
+        """Test collapsing one qubit of an entangled state."""
+        simulator = Simulator(2)
+        simulator.apply_gate(H, 0)
+        simulator.apply_cx(0, 1)
+
+        assert simulator.qubit_probability(1) == pytest.approx(0.5)
+
+        simulator.collapse(0, 1)
+
+        assert np.allclose(simulator.statevector, [0, 0, 0, 1])
+        assert simulator.qubit_probability(1) == pytest.approx(1.0)
+
+    def test_collapse_leaves_snapshot(self):
+        """Test that projecting a shared state writes a new buffer."""
+        simulator = Simulator(1)
+        simulator.apply_gate(H, 0)
+        snapshot = simulator.snapshot()
+
+        simulator.collapse(0, 0)
+
+        assert np.allclose(snapshot, [2**-0.5, 2**-0.5])
+        assert np.allclose(simulator.statevector, [1, 0])
+
+    def test_impossible_outcome(self):
+        """Test that projecting onto a zero-probability outcome fails."""
+        with pytest.raises(ValueError, match="probability 0"):
+            Simulator(1).collapse(0, 1)
+
+
+class TestParallelWorkers:
+    """Test gate application split across shared-memory workers."""
+
+    @pytest.fixture(autouse=True)
+    def always_parallel(self, monkeypatch):
+        """Send even tiny circuits to the worker pool."""
+        monkeypatch.setattr("quantiq.simulator.PARALLEL_MIN_QUBITS", 0)
+
+    @pytest.mark.parametrize("workers", [2, 3, 4])
+    def test_matches_serial(self, workers):
+        """Test every kernel family against the serial path."""
+        serial = Simulator(5)
+        parallel = Simulator(5, workers=workers)
+        unitary = random_unitary(4, seed=workers)
+        try:
+            for simulator in (serial, parallel):
+                simulator.statevector = random_state(5, seed=workers)
+                simulator.apply_gate(H, 0)
+                simulator.apply_controlled_gate(random_unitary(2), [0, 1], 4)
+                simulator.apply_swap(0, 3)
+                simulator.apply_unitary(unitary, [4, 1])
+                simulator.apply_unitary(random_unitary(8), [2, 0, 3])
+
+            assert np.allclose(parallel.statevector, serial.statevector)
+        finally:
+            parallel.close()
+
+    def test_batched_state(self):
+        """Test a batch of states with per-row rotation matrices."""
+        from quantiq.gates import ry
+
+        angles = np.linspace(0, np.pi, 4)
+        serial = Simulator(3, batch_size=4)
+        parallel = Simulator(3, batch_size=4, workers=2)
+        try:
+            for simulator in (serial, parallel):
+                simulator.apply_gate(ry(angles), 0)
+                simulator.apply_cx(0, 2)
+
+            assert np.allclose(parallel.get_statevector(), serial.get_statevector())
+        finally:
+            parallel.close()
+
+    def test_circuit_run_with_workers(self):
+        """Test running a circuit through backend options."""
+        circuit = QuantumCircuit(4).h(0).cx(0, 1).cx(1, 2).cx(2, 3)
+
+        statevector = circuit.get_statevector(backend_options={"workers": 2})
+        assert np.allclose(statevector, circuit.get_statevector(cache=False))
+
+    def test_close_keeps_state(self):
+        """Test that closing the pool leaves a usable private statevector."""
+        simulator = Simulator(3, workers=2)
+        simulator.apply_gate(X, 1)
+        simulator.close()
+
+        simulator.apply_gate(X, 2)
+        assert simulator.get_statevector()[0b011] == 1
+
+    def test_fork_leaves_pool(self):
+        """Test that a fork runs in-process and doesn't see the parent's gates."""
+        simulator = Simulator(3, workers=2)
+        try:
+            simulator.apply_gate(X, 0)
+            branch = simulator.fork()
+            simulator.apply_gate(X, 1)
+            branch.apply_gate(X, 2)
+
+            assert branch._pool is None
+            assert simulator.get_statevector()[0b110] == 1
+            assert branch.get_statevector()[0b101] == 1
+        finally:
+            simulator.close()
+
+    def test_invalid_worker_count(self):
+        """Test rejection of non-positive worker counts."""
+        with pytest.raises(ValueError):
+            Simulator(2, workers=0)
@@ -0,0 +1,136 @@
+"""Tests for the sparse statevector backend."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit
+from quantiq.gates import H, X
+from quantiq.sparse import SparseSimulator
+
+from .test_outofcore import layered_circuit
+
+
+def oracle_circuit(num_qubits, seed=0):
+    """Permutation-heavy circuit over a small superposition."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for q in range(3):
+        circuit.h(q)
+    for _ in range(60):
+        a, b, c = (int(q) for q in rng.choice(num_qubits, size=3, replace=False))
+        kind = rng.integers(5)
+        if kind == 0:
+            circuit.cx(a, b)
+        elif kind == 1:
+            circuit.ccx(a, b, c)
+        elif kind == 2:
+            circuit.swap(a, b)
+        elif kind == 3:
+            circuit.z(a).s(b)
+        else:
+            circuit.x(a)
+    return circuit
+
+
+class TestSparseSimulator:
+    """Test the sparse backend against the dense statevector."""
+
+    @pytest.mark.parametrize("num_qubits", [4, 6, 8])
+    @pytest.mark.parametrize("fuse", [True, False])
+    def test_matches_statevector(self, num_qubits, fuse):
+        """Test that a sparse run of a dense circuit is exact."""
+        circuit = layered_circuit(num_qubits, seed=num_qubits)
+        expected = circuit.get_statevector(fuse=fuse)
+
+        actual = circuit.get_statevector(
+            fuse=fuse, backend="sparse", backend_options={"density_threshold": 1.0}
+        )
+
+        assert np.allclose(actual, expected)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_oracle_circuit_stays_sparse(self, seed):
+        """Test that permutation gates keep the eight-entry superposition."""
+        circuit = oracle_circuit(10, seed=seed)
+        simulator = SparseSimulator(10, density_threshold=1.0)
+        circuit.compile().run(simulator)
+
+        assert simulator.num_nonzero == 8
+        assert np.allclose(simulator.get_statevector(), circuit.get_statevector())
+
+    def test_cancelling_amplitudes_are_dropped(self):
+        """Test that H followed by H returns to a single entry."""
+        simulator = SparseSimulator(5, density_threshold=1.0)
+        simulator.apply_gate(H, 2)
+        assert simulator.num_nonzero == 2
+
+        simulator.apply_gate(H, 2)
+
+        assert simulator.num_nonzero == 1
+        indices, amplitudes = simulator.get_sparse_state()
+        assert indices.tolist() == [0]
+        assert np.allclose(amplitudes, [1.0])
+
+    def test_controlled_gate_touches_only_controlled_entries(self):
+        """Test that a controlled X only remaps entries with the control set."""
+        simulator = SparseSimulator(3, density_threshold=1.0)
+        simulator.apply_gate(H, 0)
+
+        simulator.apply_controlled_gate(X, [0], 2)
+
+        indices, _ = simulator.get_sparse_state()
+        assert indices.tolist() == [0b000, 0b101]
+
+    def test_dense_fallback(self):
+        """Test that passing the density threshold switches to dense."""
+        circuit = QuantumCircuit(4)
+        for q in range(4):
+            circuit.h(q)
+
+        result = circuit.run(
+            shots=100,
+            seed=0,
+            backend="sparse",
+            backend_options={"density_threshold": 0.5},
+        )
+
+        assert result.metadata["dense_fallback"] is True
+        assert result.metadata["nonzero_amplitudes"] == 16
+        assert len(result.counts) > 1
+
+    def test_wide_register(self):
+        """Test a 60-qubit circuit that a dense statevector couldn't hold."""
+        circuit = oracle_circuit(60, seed=5)
+        circuit.cx(0, 59).ccx(1, 2, 58)
+
+        result = circuit.run(shots=2000, seed=1, backend="sparse")
+
+        assert result.metadata["dense_fallback"] is False
+        assert result.metadata["nonzero_amplitudes"] == 8
+        assert result.metadata["peak_memory_bytes"] <= 8 * (8 + 16)
+        assert len(result.counts) == 8
+        # The three Hadamards leave a uniform superposition
+        assert min(result.counts.values()) > 150
+
+    def test_sampling_matches_distribution(self):
+        """Test that sampling follows the stored probabilities."""
+        circuit = layered_circuit(5, seed=2)
+        probabilities = np.abs(circuit.get_statevector()) ** 2
+
+        result = circuit.run(
+            shots=40000,
+            seed=7,
+            backend="sparse",
+            backend_options={"density_threshold": 1.0},
+        )
+
+        empirical = np.zeros_like(probabilities)
+        empirical[result.outcomes] = result.frequencies / 40000
+        assert np.abs(empirical - probabilities).max() < 0.01
+
+    def test_invalid_options(self):
+        """Test that bad sizes and thresholds are rejected."""
+        with pytest.raises(ValueError, match="at most"):
+            SparseSimulator(64)
+        with pytest.raises(ValueError, match="Density threshold"):
+            SparseSimulator(4, density_threshold=0.0)
@@ -0,0 +1,107 @@
+"""Tests for the Clifford tableau backend."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit
+from quantiq.stabilizer import StabilizerSimulator, is_clifford
+
+
+def random_clifford_circuit(num_qubits, num_gates, seed=0):
+    """Random circuit over the Clifford gates the circuit API offers."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        kind = rng.choice(["h", "s", "x", "y", "z", "cx", "cz", "swap"])
+        if kind in ("cx", "cz", "swap"):
+            a, b = rng.choice(num_qubits, size=2, replace=False)
+            getattr(circuit, kind)(int(a), int(b))
+        else:
+            getattr(circuit, kind)(int(rng.integers(num_qubits)))
+    return circuit
+
+
+class TestStabilizerSimulator:
+    """Test tableau sampling against the statevector simulator."""
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_support_matches_statevector(self, seed):
+        """Test that sampled outcomes cover exactly the nonzero amplitudes."""
+        circuit = random_clifford_circuit(5, 40, seed=seed)
+        probabilities = np.abs(circuit.get_statevector()) ** 2
+        support = {
+            format(i, "05b") for i in np.flatnonzero(probabilities > 1e-9).tolist()
+        }
+
+        result = circuit.run(shots=4000, seed=seed, backend="stabilizer")
+
+        assert set(result.counts) == support
+        # Stabilizer states are uniform over their support
+        assert np.allclose(probabilities[probabilities > 1e-9], 1 / len(support))
+
+    @pytest.mark.parametrize(
+        "build, expected",
+        [
+            (lambda c: c.x(0), "10"),
+            (lambda c: c.y(1), "01"),
+            (lambda c: c.h(0).s(0).s(0).h(0), "10"),
+            (lambda c: c.h(0).z(0).h(0).cx(0, 1), "11"),
+            (lambda c: c.x(0).swap(0, 1), "01"),
+            (lambda c: c.x(0).h(1).cz(0, 1).h(1), "11"),
+        ],
+    )
+    def test_deterministic_outcomes(self, build, expected):
+        """Test sign tracking on circuits with a single outcome."""
+        circuit = build(QuantumCircuit(2))
+        result = circuit.run(shots=10, backend="stabilizer")
+
+        assert result.counts == {expected: 10}
+
+    def test_thousand_qubit_ghz(self):
+        """Test a GHZ state far beyond statevector reach."""
+        circuit = QuantumCircuit(1000).h(0)
+        for q in range(999):
+            circuit.cx(q, q + 1)
+
+        result = circuit.run(shots=500, seed=1)
+
+        assert result.metadata["backend"] == "stabilizer"
+        assert set(result.counts) == {"0" * 1000, "1" * 1000}
+        assert result.marginal([0, 999]).counts.keys() <= {"00", "11"}
+
+    def test_wide_uniform_support(self):
+        """Test sampling a support too large for one multinomial."""
+        circuit = QuantumCircuit(64)
+        for q in range(64):
+            circuit.h(q)
+
+        result = circuit.run(shots=1000, seed=2)
+        assert len(result.counts) == 1000
+        assert abs(result.expectation_value("Z" + "I" * 63)) < 0.15
+
+    def test_automatic_selection(self):
+        """Test that only large all-Clifford circuits switch backend."""
+        small = QuantumCircuit(3).h(0).cx(0, 1)
+        non_clifford = QuantumCircuit(20).h(0).append("T", 0)
+
+        assert small.run(shots=10).metadata["backend"] == "statevector"
+        assert non_clifford.run(shots=10).metadata["backend"] == "statevector"
+        assert is_clifford(small.gates)
+        assert not is_clifford(non_clifford.gates)
+
+    def test_rejects_non_clifford_gates(self):
+        """Test that non-Clifford gates are refused."""
+        with pytest.raises(ValueError):
+            QuantumCircuit(2).append("T", 0).run(backend="stabilizer")
+        with pytest.raises(ValueError):
+            QuantumCircuit(3).ccx(0, 1, 2).run(backend="stabilizer")
+        with pytest.raises(ValueError):
+            StabilizerSimulator(0)
+
+    def test_get_statevector_not_available(self):
+        """Test that get_statevector() explains the missing amplitudes."""
+        circuit = QuantumCircuit(2).h(0).cx(0, 1)
+
+        for fuse in (True, False):
+            with pytest.raises(ValueError, match="no statevector; use run"):
+                circuit.get_statevector(fuse=fuse, backend="stabilizer")
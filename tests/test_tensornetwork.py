@@ -0,0 +1,111 @@
+"""Tests for tensor-network amplitude evaluation."""
+
+import numpy as np
+import pytest
+
+from quantiq import Parameter, QuantumCircuit
+
+from .test_outofcore import layered_circuit
+
+
+def brickwork_circuit(num_qubits, depth, seed=0):
+    """Random single-qubit rotations between layers of nearest-neighbour CZs."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for layer in range(depth):
+        for q in range(num_qubits):
+            circuit.ry(float(rng.uniform(0, np.pi)), q)
+            circuit.rz(float(rng.uniform(0, np.pi)), q)
+        for q in range(layer % 2, num_qubits - 1, 2):
+            circuit.cz(q, q + 1)
+    return circuit
+
+
+def all_bitstrings(num_qubits):
+    """Every basis state in index order."""
+    return [format(i, f"0{num_qubits}b") for i in range(2**num_qubits)]
+
+
+class TestAmplitudes:
+    """Test contraction results against the statevector."""
+
+    @pytest.mark.parametrize("num_qubits", [4, 6, 8])
+    def test_matches_statevector(self, num_qubits):
+        """Test every amplitude of a circuit using all gate kinds."""
+        circuit = layered_circuit(num_qubits, seed=num_qubits)
+
+        amplitudes = circuit.amplitudes(all_bitstrings(num_qubits))
+
+        assert np.allclose(amplitudes, circuit.get_statevector())
+
+    def test_single_amplitude(self):
+        """Test that amplitude() returns one complex number."""
+        circuit = brickwork_circuit(5, depth=4, seed=1)
+        expected = circuit.get_statevector()[0b10110]
+
+        assert circuit.amplitude("10110") == pytest.approx(expected)
+
+    def test_slicing_bounds_intermediates(self):
+        """Test that a small size bound slices indices without changing results."""
+        circuit = brickwork_circuit(6, depth=6, seed=2)
+        expected = circuit.get_statevector()
+
+        plan = circuit.contraction_plan(max_size=16)
+        amplitudes = circuit.amplitudes(all_bitstrings(6), max_size=16)
+
+        assert plan.peak_size <= 16
+        assert plan.num_slices > 1
+        assert np.allclose(amplitudes, expected)
+
+    def test_wide_circuit(self):
+        """Test a 60-qubit GHZ state that has no dense statevector."""
+        circuit = QuantumCircuit(60).h(0)
+        for q in range(59):
+            circuit.cx(q, q + 1)
+
+        amplitudes = circuit.amplitudes(["0" * 60, "1" * 60, "01" * 30])
+
+        assert np.allclose(amplitudes, [2**-0.5, 2**-0.5, 0])
+
+    def test_swap_relabels_wires(self):
+        """Test that SWAPs are followed through the network."""
+        circuit = QuantumCircuit(3).x(0).swap(0, 2).h(1)
+
+        assert circuit.amplitude("001") == pytest.approx(2**-0.5)
+        assert circuit.amplitude("100") == pytest.approx(0)
+
+
+class TestContractionPlan:
+    """Test caching and validation of contraction plans."""
+
+    def test_plan_is_cached(self):
+        """Test that repeated queries reuse the plan until a gate is added."""
+        circuit = brickwork_circuit(8, depth=3)
+        plan = circuit.contraction_plan()
+        circuit.amplitude("0" * 8)
+
+        assert circuit.contraction_plan() is plan
+
+        circuit.h(0)
+        assert circuit.contraction_plan() is not plan
+
+    def test_wide_brickwork_stays_small(self):
+        """Test that the greedy path keeps a shallow 40-qubit circuit narrow."""
+        plan = brickwork_circuit(40, depth=6).contraction_plan()
+
+        assert plan.peak_size <= 2**12
+        assert plan.num_slices == 1
+
+    def test_invalid_bitstring(self):
+        """Test that malformed bitstrings are rejected."""
+        circuit = QuantumCircuit(3).h(0)
+        with pytest.raises(ValueError, match="not 3 characters"):
+            circuit.amplitude("01")
+        with pytest.raises(ValueError, match="not 3 characters"):
+            circuit.amplitude("0a1")
+
+    def test_unbound_parameters(self):
+        """Test that symbolic parameters must be bound first."""
+        circuit = QuantumCircuit(2).rx(Parameter("theta"), 0)
+        with pytest.raises(ValueError, match="Bind all parameters"):
+            circuit.amplitude("00")
@@ -0,0 +1,147 @@
+"""Tests for circuit optimization passes."""
+
+import numpy as np
+import pytest
+
+from quantiq import QuantumCircuit, transpile
+from quantiq.transpiler import fuse_gates, lightcone
+
+
+def random_circuit(num_qubits, depth, seed=0):
+    """Layers of random Pauli/Hadamard gates with CX entanglers."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for layer in range(depth):
+        for qubit in range(num_qubits):
+            getattr(circuit, "hxyz"[rng.integers(4)])(qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            circuit.cx(qubit, qubit + 1)
+    circuit.cz(0, num_qubits - 1).ccx(0, 1, 2)
+    return circuit
+
+
+class TestGateFusion:
+    """Test merging of adjacent gates into larger unitaries."""
+
+    @pytest.mark.parametrize("max_qubits", [1, 2, 3])
+    def test_fused_statevector_matches(self, max_qubits):
+        """Test that fusion doesn't change the simulated state."""
+        circuit = random_circuit(5, depth=6)
+        gates, stats = fuse_gates(5, circuit.gates, max_qubits=max_qubits)
+
+        fused = QuantumCircuit(5)
+        for gate in gates:
+            fused.append(*gate)
+
+        assert stats["gates_after"] == len(gates) < len(circuit.gates)
+        assert np.allclose(
+            fused.get_statevector(fuse=False), circuit.get_statevector(fuse=False)
+        )
+
+    def test_single_qubit_run_becomes_one_gate(self):
+        """Test that H X H on one qubit fuses to a single 2x2."""
+        gates, stats = fuse_gates(1, [("H", 0), ("X", 0), ("H", 0)])
+        assert len(gates) == 1 and gates[0][0] == "UNITARY"
+        assert np.allclose(gates[0][2], np.diag([1, -1]))
+        assert stats["fused_gates"] == 2
+
+    def test_lone_gates_are_kept(self):
+        """Test that gates with nothing to fuse with are left untouched."""
+        gates, stats = fuse_gates(3, [("CX", 0, 1), ("H", 2)])
+        assert gates == [("CX", 0, 1), ("H", 2)]
+        assert stats["fused_gates"] == 0
+
+    def test_run_reports_fusion(self):
+        """Test that run() fuses by default and can be switched off."""
+        circuit = QuantumCircuit(2).h(0).x(0).cx(0, 1).z(1).measure_all()
+        assert circuit.run(shots=10).metadata["fused_gates"] == 3
+        assert "fused_gates" not in circuit.run(shots=10, fuse=False).metadata
+
+
+class TestPeepholeOptimizer:
+    """Test cancellation, commutation and diagonal merging."""
+
+    def test_adjacent_pairs_cancel(self):
+        """Test that H H, X X and CX CX pairs vanish."""
+        circuit = QuantumCircuit(2).h(0).h(0).x(1).x(1).cx(0, 1).cx(0, 1)
+        optimized, stats = circuit.optimize()
+        assert optimized.gates == []
+        assert stats["gates_removed"] == 6
+        assert stats["depth_before"] == 4 and stats["depth_after"] == 0
+
+    def test_cancel_through_commuting_gates(self):
+        """Test that Z on a CX control and X on its target commute through."""
+        circuit = QuantumCircuit(3)
+        circuit.cx(0, 1).z(0).x(1).cx(0, 2).cx(0, 1)
+        optimized, _ = transpile(circuit, passes=["cancel"])
+        assert optimized.gates == [("Z", 0), ("X", 1), ("CX", 0, 2)]
+
+    def test_blocked_cancellation(self):
+        """Test that a non-commuting gate in between blocks cancellation."""
+        circuit = QuantumCircuit(2).cx(0, 1).h(0).cx(0, 1)
+        optimized, stats = circuit.optimize()
+        assert stats["gates_removed"] == 0
+        assert optimized.gates == circuit.gates
+
+    def test_diagonal_merging(self):
+        """Test that T T becomes S and S S across a CX control becomes Z."""
+        circuit = QuantumCircuit(2).append("T", 0).append("T", 0)
+        circuit.cx(0, 1).append("S", 0)
+        optimized, _ = circuit.optimize()
+        assert optimized.gates == [("Z", 0), ("CX", 0, 1)]
+
+    def test_rejects_dynamic_circuits(self):
+        """Test that conditioned gates aren't silently made unconditional."""
+        circuit = QuantumCircuit(2).h(0).measure(0).x(1).c_if(0, 1)
+
+        with pytest.raises(ValueError, match="only run"):
+            transpile(circuit)
+
+    def test_optimized_circuit_is_equivalent(self):
+        """Test that optimization preserves the statevector."""
+        circuit = random_circuit(4, depth=8, seed=3)
+        circuit.z(0).cx(0, 1).z(0).cx(0, 1).h(2).h(2)
+        optimized, stats = circuit.optimize()
+        assert stats["gates_after"] < stats["gates_before"]
+        assert np.allclose(optimized.get_statevector(), circuit.get_statevector())
+        assert circuit.gates[-1] == ("H", 2)  # the original is left untouched
+
+
+class TestLightcone:
+    """Test pruning to the backward lightcone of measured qubits."""
+
+    def test_gates_outside_lightcone_are_dropped(self):
+        """Test that only gates feeding the measured qubit survive."""
+        gates = [("H", 0), ("H", 3), ("CX", 0, 1), ("X", 2), ("CX", 3, 2)]
+
+        kept, register, stats = lightcone(4, gates, [1])
+
+        assert register == [0, 1]
+        assert kept == [("H", 0), ("CX", 0, 1)]
+        assert stats == {"pruned_gates": 3, "pruned_qubits": 2}
+
+    def test_register_is_compacted(self):
+        """Test that surviving qubits are renumbered in order."""
+        gates = [("RY", 5, 0.3), ("CX", 5, 2), ("MEASURE_ALL",)]
+
+        kept, register, _ = lightcone(6, gates, [2])
+
+        assert register == [2, 5]
+        assert kept == [("RY", 1, 0.3), ("CX", 1, 0)]
+
+    def test_later_gates_cannot_widen_lightcone(self):
+        """Test that a gate after the last use of the measured qubit is pruned."""
+        gates = [("H", 0), ("CX", 0, 1), ("CX", 1, 2)]
+
+        kept, register, _ = lightcone(3, gates, [0])
+
+        assert kept == [("H", 0), ("CX", 0, 1)]
+        assert register == [0, 1]
+
+    def test_idle_measured_qubits(self):
+        """Test that an untouched register keeps one qubit."""
+        kept, register, stats = lightcone(5, [("H", 0)], [3, 4])
+
+        assert kept == []
+        assert register == [3]
+        assert stats == {"pruned_gates": 1, "pruned_qubits": 4}